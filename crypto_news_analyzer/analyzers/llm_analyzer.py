@@ -13,6 +13,8 @@ LLM分析器
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
@@ -63,6 +65,7 @@ class LLMAnalyzer:
         analysis_prompt_path: str = "./prompts/analysis_prompt.md",
         temperature: float = 0.5,
         batch_size: int = 10,
+        max_concurrent_batches: int = 1,
         cache_ttl_minutes: int = 30,
         cached_messages_hours: int = 24,
         mock_mode: bool = False,
@@ -83,6 +86,7 @@ class LLMAnalyzer:
             analysis_prompt_path: 分析提示词路径
             temperature: 温度参数
             batch_size: 批量分析的批次大小
+            max_concurrent_batches: 定时分析时最多同时请求的批次数
             cache_ttl_minutes: 缓存有效期（分钟）
             cached_messages_hours: 缓存消息的时间范围（小时）
             mock_mode: 是否使用模拟模式（用于测试）
@@ -127,6 +131,7 @@ class LLMAnalyzer:
         self.analysis_api_key = self.provider_credentials.get(self.analysis_provider, "")
 
         self.batch_size = batch_size
+        self.max_concurrent_batches = max(1, max_concurrent_batches)
 
         # 使用会话ID管理器获取或创建持久化的conversation_id
         conversation_id_manager = ConversationIdManager(cache_dir="./data/cache")
@@ -181,8 +186,9 @@ class LLMAnalyzer:
         self._cached_market_snapshot: Optional[MarketSnapshot] = None
         self._cached_system_prompt: Optional[str] = None
 
-        # 记录实际使用的模型（包括备用模型）
+        # 记录实际使用的模型（包括备用模型），并发批次通过锁更新
         self._last_used_model: Optional[str] = None
+        self._last_used_model_lock = threading.Lock()
 
         if mock_mode:
             self.logger.info("LLM分析器运行在模拟模式")
@@ -485,146 +491,208 @@ class LLMAnalyzer:
         if not self.client:
             raise RuntimeError("OpenAI客户端未初始化")
 
+        batches = [
+            items[i : i + self.batch_size] for i in range(0, len(items), self.batch_size)
+        ]
+
+        # 定时任务各批次使用相同的历史标题，彼此独立，可以并发请求；
+        # 手动分析需要把前一批次的结果标题带入下一批次，必须按顺序执行
+        workers = min(self.max_concurrent_batches, len(batches))
+        if is_scheduled and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-batch") as executor:
+                futures = [
+                    executor.submit(
+                        self._analyze_single_batch,
+                        batch,
+                        batch_number,
+                        system_prompt,
+                        market_snapshot,
+                        is_scheduled,
+                        historical_titles,
+                    )
+                    for batch_number, batch in enumerate(batches, start=1)
+                ]
+                try:
+                    # 按批次顺序汇总结果
+                    return [result for future in futures for result in future.result()]
+                except Exception:
+                    # 与顺序执行一致，某批次失败需要中止分析时，取消尚未开始的批次，
+                    # 避免为已经失败的分析继续消耗token
+                    for future in futures:
+                        future.cancel()
+                    raise
+
         all_results = []
         rolling_historical_titles = self._deduplicate_titles_preserving_order(historical_titles)
 
-        for i in range(0, len(items), self.batch_size):
-            batch = items[i : i + self.batch_size]
-            messages: List[Dict[str, str]] = []
-            self.logger.info(f"处理批次 {i // self.batch_size + 1}，包含 {len(batch)} 条内容")
-
-            try:
-                batch_historical_titles = (
-                    historical_titles if is_scheduled else rolling_historical_titles
-                )
-                user_prompt = self._build_user_prompt_with_context(
-                    batch, market_snapshot, is_scheduled, batch_historical_titles
+        for batch_number, batch in enumerate(batches, start=1):
+            batch_historical_titles = (
+                historical_titles if is_scheduled else rolling_historical_titles
+            )
+            batch_results = self._analyze_single_batch(
+                batch,
+                batch_number,
+                system_prompt,
+                market_snapshot,
+                is_scheduled,
+                batch_historical_titles,
+            )
+            all_results.extend(batch_results)
+            if not is_scheduled and batch_results:
+                rolling_historical_titles = self._deduplicate_titles_preserving_order(
+                    rolling_historical_titles + self._extract_result_titles(batch_results)
                 )
 
-                # 构建消息列表
-                messages = [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ]
+        return all_results
 
-                # 以用户友好的方式打印最终发送给LLM的完整提示词
-                self._log_final_prompt(system_prompt, user_prompt, i // self.batch_size + 1)
-
-                # 判断是否启用 web_search 及使用哪种方式
-                # Grok 使用 responses.parse() API
-                # Kimi 使用内置 web_search（builtin_function + $web_search）
-                enable_web_search = self._supports_web_search(self.analysis_model_runtime)
-
-                if enable_web_search:
-                    if self.analysis_model_runtime.provider_name == "kimi":
-                        self.logger.info("检测到 Kimi 模型，启用内置 web_search 工具")
-                    elif self.analysis_model_runtime.provider_name == "grok":
-                        self.logger.info("检测到 Grok 模型，启用 web_search 和 x_search 工具")
-
-                # 使用结构化输出管理器强制返回结构化数据
-                extra_body = self._build_model_extra_body(self.analysis_model_runtime)
-                batch_result = self.structured_output_manager.force_structured_response(
-                    llm_client=self.client,
-                    messages=messages,
-                    model=self.model,
-                    max_retries=3,
-                    temperature=self.temperature,
-                    batch_mode=True,
-                    enable_web_search=enable_web_search,
-                    conversation_id=self.conversation_id,
-                    usage_callback=self._record_token_usage,
-                    extra_body=extra_body,
-                )
+    def _analyze_single_batch(
+        self,
+        batch: List[ContentItem],
+        batch_number: int,
+        system_prompt: str,
+        market_snapshot: MarketSnapshot,
+        is_scheduled: bool,
+        batch_historical_titles: Optional[List[str]],
+    ) -> List[StructuredAnalysisResult]:
+        """
+        分析单个批次
+
+        内容过滤且备用模型不可用或失败时抛出异常，其他错误记录日志后返回空列表，
+        以便继续处理其余批次。
+
+        Args:
+            batch: 本批次内容项
+            batch_number: 批次序号（从1开始，用于日志）
+            system_prompt: 静态系统提示词
+            market_snapshot: 市场快照对象
+            is_scheduled: 是否为定时任务
+            batch_historical_titles: 本批次使用的历史标题
 
-                # 记录主模型使用情况（如果没有使用过备用模型）
+        Returns:
+            本批次的结构化分析结果列表
+        """
+        messages: List[Dict[str, str]] = []
+        self.logger.info(f"处理批次 {batch_number}，包含 {len(batch)} 条内容")
+
+        try:
+            user_prompt = self._build_user_prompt_with_context(
+                batch, market_snapshot, is_scheduled, batch_historical_titles
+            )
+
+            # 构建消息列表
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ]
+
+            # 以用户友好的方式打印最终发送给LLM的完整提示词
+            self._log_final_prompt(system_prompt, user_prompt, batch_number)
+
+            # 判断是否启用 web_search 及使用哪种方式
+            # Grok 使用 responses.parse() API
+            # Kimi 使用内置 web_search（builtin_function + $web_search）
+            enable_web_search = self._supports_web_search(self.analysis_model_runtime)
+
+            if enable_web_search:
+                if self.analysis_model_runtime.provider_name == "kimi":
+                    self.logger.info("检测到 Kimi 模型，启用内置 web_search 工具")
+                elif self.analysis_model_runtime.provider_name == "grok":
+                    self.logger.info("检测到 Grok 模型，启用 web_search 和 x_search 工具")
+
+            # 使用结构化输出管理器强制返回结构化数据
+            extra_body = self._build_model_extra_body(self.analysis_model_runtime)
+            batch_result = self.structured_output_manager.force_structured_response(
+                llm_client=self.client,
+                messages=messages,
+                model=self.model,
+                max_retries=3,
+                temperature=self.temperature,
+                batch_mode=True,
+                enable_web_search=enable_web_search,
+                conversation_id=self.conversation_id,
+                usage_callback=self._record_token_usage,
+                extra_body=extra_body,
+            )
+
+            # 记录主模型使用情况（如果没有使用过备用模型）
+            with self._last_used_model_lock:
                 if self._last_used_model is None:
-                    self._last_used_model = self._display_provider_name(self.analysis_model_runtime)
-
-                # 打印LLM返回的原始数据
-                self._log_llm_response(batch_result, i // self.batch_size + 1)
-
-                # 提取结果
-                if isinstance(batch_result, BatchAnalysisResult):
-                    all_results.extend(batch_result.results)
-                    if not is_scheduled:
-                        rolling_historical_titles = self._deduplicate_titles_preserving_order(
-                            rolling_historical_titles
-                            + self._extract_result_titles(batch_result.results)
-                        )
-                    self.logger.info(f"批次返回 {len(batch_result.results)} 条结果")
-                else:
-                    self.logger.warning(f"批次返回格式异常: {type(batch_result)}")
-
-            except ContentFilterError as e:
-                self.logger.error(f"Kimi 内容过滤错误: {e}")
-                # 尝试使用 Grok 作为备用模型
-                fallback_runtime = self._select_content_filter_fallback_runtime()
-                fallback_api_key = ""
-                if fallback_runtime is not None:
-                    fallback_api_key = self.provider_credentials.get(
-                        fallback_runtime.provider_name, ""
+                    self._last_used_model = self._display_provider_name(
+                        self.analysis_model_runtime
                     )
 
-                if (
-                    self.analysis_model_runtime.provider_name == "kimi"
-                    and fallback_runtime is not None
-                    and fallback_api_key
-                ):
-                    self.logger.info("尝试切换到 Grok 模型重试...")
-                    try:
-                        fallback_client = self._build_client(fallback_runtime, fallback_api_key)
+            # 打印LLM返回的原始数据
+            self._log_llm_response(batch_result, batch_number)
+
+            # 提取结果
+            if isinstance(batch_result, BatchAnalysisResult):
+                self.logger.info(f"批次返回 {len(batch_result.results)} 条结果")
+                return list(batch_result.results)
+            self.logger.warning(f"批次返回格式异常: {type(batch_result)}")
+            return []
+
+        except ContentFilterError as e:
+            self.logger.error(f"Kimi 内容过滤错误: {e}")
+            # 尝试使用 Grok 作为备用模型
+            fallback_runtime = self._select_content_filter_fallback_runtime()
+            fallback_api_key = ""
+            if fallback_runtime is not None:
+                fallback_api_key = self.provider_credentials.get(
+                    fallback_runtime.provider_name, ""
+                )
 
-                        # 记录使用了备用模型
+            if (
+                self.analysis_model_runtime.provider_name == "kimi"
+                and fallback_runtime is not None
+                and fallback_api_key
+            ):
+                self.logger.info("尝试切换到 Grok 模型重试...")
+                try:
+                    fallback_client = self._build_client(fallback_runtime, fallback_api_key)
+
+                    # 记录使用了备用模型，覆盖其他批次记录的主模型
+                    with self._last_used_model_lock:
                         self._last_used_model = (
                             f"{self._display_provider_name(self.analysis_model_runtime)} (主模型) -> "
                             f"{self._display_provider_name(fallback_runtime)} (备用模型)"
                         )
 
-                        # Grok 备用模型保持开启 web_search/x_search
-                        batch_result = self.structured_output_manager.force_structured_response(
-                            llm_client=fallback_client,
-                            messages=messages,
-                            model=fallback_runtime.name,
-                            max_retries=2,
-                            temperature=self.temperature,
-                            batch_mode=True,
-                            enable_web_search=self._supports_web_search(fallback_runtime),
-                            conversation_id=self.conversation_id,
-                            usage_callback=self._record_token_usage,
+                    # Grok 备用模型保持开启 web_search/x_search
+                    batch_result = self.structured_output_manager.force_structured_response(
+                        llm_client=fallback_client,
+                        messages=messages,
+                        model=fallback_runtime.name,
+                        max_retries=2,
+                        temperature=self.temperature,
+                        batch_mode=True,
+                        enable_web_search=self._supports_web_search(fallback_runtime),
+                        conversation_id=self.conversation_id,
+                        usage_callback=self._record_token_usage,
+                    )
+
+                    # 打印LLM返回的原始数据
+                    self._log_llm_response(batch_result, batch_number)
+
+                    # 提取结果
+                    if isinstance(batch_result, BatchAnalysisResult):
+                        self.logger.info(
+                            f"Grok备用模型批次返回 {len(batch_result.results)} 条结果"
                         )
+                        return list(batch_result.results)
+                    self.logger.warning(f"Grok批次返回格式异常: {type(batch_result)}")
+                    return []
 
-                        # 打印LLM返回的原始数据
-                        self._log_llm_response(batch_result, i // self.batch_size + 1)
-
-                        # 提取结果
-                        if isinstance(batch_result, BatchAnalysisResult):
-                            all_results.extend(batch_result.results)
-                            if not is_scheduled:
-                                rolling_historical_titles = (
-                                    self._deduplicate_titles_preserving_order(
-                                        rolling_historical_titles
-                                        + self._extract_result_titles(batch_result.results)
-                                    )
-                                )
-                            self.logger.info(
-                                f"Grok备用模型批次返回 {len(batch_result.results)} 条结果"
-                            )
-                        else:
-                            self.logger.warning(f"Grok批次返回格式异常: {type(batch_result)}")
-
-                    except Exception as fallback_error:
-                        self.logger.error(f"Grok备用模型失败，停止当前分析: {fallback_error}")
-                        raise
-                else:
-                    self.logger.warning("未配置可用的备用模型凭证，无法使用备用模型")
+                except Exception as fallback_error:
+                    self.logger.error(f"Grok备用模型失败，停止当前分析: {fallback_error}")
                     raise
+            else:
+                self.logger.warning("未配置可用的备用模型凭证，无法使用备用模型")
+                raise
 
-            except Exception as e:
-                self.logger.error(f"批次分析失败: {e}")
-                # 继续处理下一批次
-                continue
-
-        return all_results
+        except Exception as e:
+            self.logger.error(f"批次分析失败: {e}")
+            # 继续处理下一批次
+            return []
 
     def _build_user_prompt_with_context(
         self,
@@ -56,6 +56,7 @@ class LLMConfig:
     market_model: ModelConfig
     temperature: float = 0.5
     batch_size: int = 10
+    max_concurrent_llm_batches: int = 1
     market_prompt_path: str = "./prompts/market_summary_prompt.md"
     analysis_prompt_path: str = "./prompts/analysis_prompt.md"
     min_weight_score: int = 50
@@ -86,6 +87,9 @@ class LLMConfig:
         if self.batch_size <= 0:
             raise ValueError("batch_size必须大于0")
 
+        if self.max_concurrent_llm_batches <= 0:
+            raise ValueError("max_concurrent_llm_batches必须大于0")
+
         if self.min_weight_score < 0 or self.min_weight_score > 100:
             raise ValueError("min_weight_score必须在0到100之间")
 
@@ -417,6 +421,7 @@ def validate_llm_config_payload(payload: Any) -> LLMConfig:
         market_model=validated_market_model,
         temperature=payload.get("temperature", 0.5),
         batch_size=payload.get("batch_size", 10),
+        max_concurrent_llm_batches=payload.get("max_concurrent_llm_batches", 1),
         market_prompt_path=payload.get(
             "market_prompt_path", "./prompts/market_summary_prompt.md"
         ),
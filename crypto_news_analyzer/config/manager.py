@@ -378,6 +378,24 @@ class ConfigManager:
 
         return 24
 
+    def get_max_concurrent_crawlers(self) -> int:
+        """
+        获取同时爬取的HTTP数据源（RSS、REST API）最大数量
+
+        Returns:
+            最大并发爬取数，至少为1
+        """
+        env_value = os.getenv("MAX_CONCURRENT_CRAWLERS")
+        if env_value:
+            try:
+                return max(1, int(env_value))
+            except ValueError:
+                self.logger.warning(
+                    f"环境变量MAX_CONCURRENT_CRAWLERS值无效: {env_value}，使用默认值"
+                )
+
+        return 4
+
     def get_storage_config(self) -> StorageConfig:
         """获取存储配置"""
         storage_data = self.config_data["storage"]
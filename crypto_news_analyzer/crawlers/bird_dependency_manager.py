@@ -16,6 +16,10 @@ from ..utils.logging import get_logger
 from ..models import BirdConfig
 
 
+# 版本号，例如 "bird 1.2.3" 或 "version 1.2.3" 中的 "1.2.3"
+_VERSION_RE = re.compile(r'(\d+\.\d+\.\d+)')
+
+
 @dataclass
 class DependencyStatus:
     """依赖状态"""
@@ -203,7 +207,7 @@ class BirdDependencyManager:
                 # 解析版本信息
                 version_text = result.stdout.strip()
                 # 尝试提取版本号 (例如: "bird 1.2.3" 或 "version 1.2.3")
-                version_match = re.search(r'(\d+\.\d+\.\d+)', version_text)
+                version_match = _VERSION_RE.search(version_text)
                 if version_match:
                     return version_match.group(1)
 
@@ -223,7 +227,7 @@ class BirdDependencyManager:
         """检查版本兼容性"""
         try:
             # 提取版本号
-            version_match = re.search(r'(\d+\.\d+\.\d+)', version)
+            version_match = _VERSION_RE.search(version)
             if not version_match:
                 # 如果无法解析版本号，假设兼容
                 self.logger.warning(f"无法解析版本号: {version}，假设兼容")
@@ -8,16 +8,37 @@ Bird工具Python封装层
 import subprocess
 import json
 import os
+import random
+import re
 import time
 import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from ..models import BirdConfig, BirdResult
 from ..utils.logging import get_logger
+from ..utils.rate_limiter import TokenBucket
 from .bird_dependency_manager import BirdDependencyManager
 
 
+# bird错误输出中表示可重试的临时故障：限流、服务端5xx和网络抖动。
+# 状态码必须出现在status/HTTP之后，避免误匹配输出中的计数或字节数
+_TRANSIENT_ERROR_RE = re.compile(
+    r'(?:status|HTTP)\D{0,3}(?:429|50[0234])\b|rate.?limit|too many requests'
+    r'|ECONNRESET|ETIMEDOUT|EAI_AGAIN',
+    re.IGNORECASE,
+)
+
+# bird错误输出中的服务端建议重试间隔，例如 "Retry-After: 30"
+_RETRY_AFTER_RE = re.compile(r'retry[- ]after\D{0,3}(\d+)', re.IGNORECASE)
+
+
 class BirdWrapper:
     """
     Bird工具Python封装层
@@ -26,6 +47,10 @@ class BirdWrapper:
     支持认证管理、命令执行和输出解析。
     """
 
+    # 命令级令牌桶容量：为1时任意两次bird调用至少间隔rate_limit_delay，
+    # 不因空闲积累额度而连续请求，避免触发X的风控
+    COMMAND_BURST = 1
+
     def __init__(self, config: Optional[BirdConfig] = None, data_manager: Optional[Any] = None):
         """
         初始化Bird封装器
@@ -39,6 +64,25 @@ class BirdWrapper:
         self.logger = get_logger(__name__)
         self.dependency_manager = BirdDependencyManager(self.config)
 
+        # JSON解析函数，orjson可用时优先使用
+        self._json_loads: Callable[[str], Any] = orjson.loads if orjson is not None else json.loads
+
+        # 重试抖动使用每个封装器实例一个的随机数生成器，不影响全局random状态；
+        # fetch_batch的工作线程共用该实例，random.Random的取值调用在CPython中是线程安全的
+        self._rng = random.Random()
+
+        # 执行环境与命令前缀缓存: ((ct0, auth_token), 缓存值)
+        self._env_cache: Optional[Tuple[Tuple[Optional[str], Optional[str]], Dict[str, str]]] = None
+        self._prefix_cache: Optional[Tuple[Tuple[Optional[str], Optional[str]], List[str]]] = None
+
+        # 命令速率限制，rate_limit_delay为0时不限制
+        self._command_bucket: Optional[TokenBucket] = None
+        if self.config.rate_limit_delay > 0:
+            self._command_bucket = TokenBucket(
+                rate=1.0 / self.config.rate_limit_delay,
+                capacity=self.COMMAND_BURST
+            )
+
         # 验证bird工具可用性
         self._validate_bird_availability()
 
@@ -102,36 +146,32 @@ class BirdWrapper:
             self.logger.error(f"获取bird工具版本失败: {str(e)}")
             raise
 
-    def execute_command(self, args: List[str], timeout: Optional[int] = None) -> BirdResult:
+    def execute_command(
+        self,
+        args: List[str],
+        timeout: Optional[int] = None,
+        env: Optional[Dict[str, str]] = None,
+    ) -> BirdResult:
         """
         执行bird工具命令
 
         Args:
             args: 命令参数列表
             timeout: 超时时间（秒），如果为None则使用配置中的默认值
+            env: 执行环境变量，如果为None则从当前环境构建
 
         Returns:
             BirdResult: 执行结果
         """
         if timeout is None:
             timeout = self.config.timeout_seconds
+        if env is None:
+            env = self._get_environment()
 
-        # 构建完整命令，添加认证参数
-        command = [self.config.executable_path]
-
-        # 添加认证参数
-        ct0 = os.getenv('X_CT0')
-        auth_token = os.getenv('X_AUTH_TOKEN')
+        # 构建完整命令：固定前缀（含认证参数）+ 用户命令参数
+        command = self._command_prefix() + args
 
-        if ct0:
-            command.extend(["--ct0", ct0])
-        if auth_token:
-            command.extend(["--auth-token", auth_token])
-
-        # 添加用户命令参数
-        command.extend(args)
-
-        start_time = time.time()
+        start_time = time.monotonic()
 
         try:
             self.logger.debug(f"执行bird命令: {' '.join(command[:3])} ... (隐藏认证参数)")
@@ -142,10 +182,10 @@ class BirdWrapper:
                 capture_output=True,
                 text=True,
                 timeout=timeout,
-                env=self._get_environment()
+                env=env
             )
 
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
 
             # 创建结果对象
             bird_result = BirdResult(
@@ -165,7 +205,7 @@ class BirdWrapper:
             return bird_result
 
         except subprocess.TimeoutExpired:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             error_msg = f"Bird命令执行超时 ({timeout}秒)"
             self.logger.error(error_msg)
 
@@ -179,7 +219,7 @@ class BirdWrapper:
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             error_msg = f"Bird命令执行异常: {str(e)}"
             self.logger.error(error_msg)
 
@@ -192,19 +232,50 @@ class BirdWrapper:
                 command=command
             )
 
+    def _command_prefix(self) -> List[str]:
+        """
+        获取命令的固定前缀（可执行文件及认证参数）
+
+        前缀按认证信息缓存，认证信息不变时复用，调用方需复制后再修改。
+        """
+        auth_key = (os.getenv('X_CT0'), os.getenv('X_AUTH_TOKEN'))
+        if self._prefix_cache is not None and self._prefix_cache[0] == auth_key:
+            return self._prefix_cache[1]
+
+        prefix = [self.config.executable_path]
+
+        # 添加认证参数
+        ct0, auth_token = auth_key
+        if ct0:
+            prefix.extend(["--ct0", ct0])
+        if auth_token:
+            prefix.extend(["--auth-token", auth_token])
+
+        self._prefix_cache = (auth_key, prefix)
+        return prefix
+
     def _get_environment(self) -> Dict[str, str]:
-        """获取执行环境变量"""
+        """
+        获取执行环境变量
+
+        环境变量快照按认证信息缓存，认证信息不变时复用，
+        避免每条命令都复制一次完整的os.environ。
+        """
+        auth_key = (os.getenv('X_CT0'), os.getenv('X_AUTH_TOKEN'))
+        if self._env_cache is not None and self._env_cache[0] == auth_key:
+            return self._env_cache[1]
+
         env = os.environ.copy()
 
         # 添加bird工具特定的环境变量
-        ct0 = os.getenv('X_CT0')
-        auth_token = os.getenv('X_AUTH_TOKEN')
+        ct0, auth_token = auth_key
 
         if ct0:
             env['X_CT0'] = ct0
         if auth_token:
             env['X_AUTH_TOKEN'] = auth_token
 
+        self._env_cache = (auth_key, env)
         return env
 
     def setup_authentication_from_env(self) -> None:
@@ -280,38 +351,8 @@ class BirdWrapper:
             BirdResult: 执行结果
         """
         try:
-            # 如果没有指定max_pages且提供了source_name，使用智能速率限制
-            if max_pages is None and source_name:
-                max_pages = self.calculate_max_pages_for_source(source_name, source_type="x")
-                self.logger.info(f"智能速率限制: 数据源 {source_name} 使用 max_pages={max_pages}")
-            elif max_pages is None:
-                # 使用配置中的默认值
-                max_pages = self.config.bird_max_page
-
-            # 确保max_pages在有效范围内
-            max_pages = max(1, min(self.config.bird_max_page, max_pages))
-
-            # 构建命令参数
-            args = [
-                "list-timeline",
-                list_id,
-                "--json",
-                "--max-pages", str(max_pages)
-            ]
-
-            # 添加速率限制延迟
-            if hasattr(self, '_last_request_time'):
-                elapsed = time.time() - self._last_request_time
-                if elapsed < self.config.rate_limit_delay:
-                    sleep_time = self.config.rate_limit_delay - elapsed
-                    self.logger.debug(f"速率限制延迟: {sleep_time:.2f} 秒")
-                    time.sleep(sleep_time)
-
-            # 执行命令
-            result = self.execute_command(args)
-            self._last_request_time = time.time()
-
-            return result
+            max_pages = self._resolve_max_pages(max_pages, source_name)
+            return self._execute_rate_limited(self._build_list_args(list_id, max_pages))
 
         except Exception as e:
             error_msg = f"获取列表推文失败: {str(e)}"
@@ -339,51 +380,8 @@ class BirdWrapper:
             BirdResult: 执行结果
         """
         try:
-            # 如果没有指定max_pages且提供了source_name，使用智能速率限制
-            if max_pages is None and source_name:
-                max_pages = self.calculate_max_pages_for_source(source_name, source_type="x")
-                self.logger.info(f"智能速率限制: 数据源 {source_name} 使用 max_pages={max_pages}")
-            elif max_pages is None:
-                # 使用配置中的默认值
-                max_pages = self.config.bird_max_page
-
-            # 确保max_pages在有效范围内
-            max_pages = max(1, min(self.config.bird_max_page, max_pages))
-
-            # 清理用户名
-            if username.startswith('@'):
-                username = username[1:]
-
-            # 构建命令参数
-            if username == "home":
-                # 主时间线
-                args = [
-                    "home",
-                    "--json",
-                    "--max-pages", str(max_pages)
-                ]
-            else:
-                # 用户时间线
-                args = [
-                    "user-tweets",
-                    username,
-                    "--json",
-                    "--max-pages", str(max_pages)
-                ]
-
-            # 添加速率限制延迟
-            if hasattr(self, '_last_request_time'):
-                elapsed = time.time() - self._last_request_time
-                if elapsed < self.config.rate_limit_delay:
-                    sleep_time = self.config.rate_limit_delay - elapsed
-                    self.logger.debug(f"速率限制延迟: {sleep_time:.2f} 秒")
-                    time.sleep(sleep_time)
-
-            # 执行命令
-            result = self.execute_command(args)
-            self._last_request_time = time.time()
-
-            return result
+            max_pages = self._resolve_max_pages(max_pages, source_name)
+            return self._execute_rate_limited(self._build_timeline_args(username, max_pages))
 
         except Exception as e:
             error_msg = f"获取用户时间线失败: {str(e)}"
@@ -398,6 +396,179 @@ class BirdWrapper:
                 command=["bird", "user-tweets", username]
             )
 
+    def fetch_batch(
+        self,
+        requests: List[Tuple[str, str, Optional[str]]],
+        rate_limiter: Optional[TokenBucket] = None,
+        max_workers: int = 1,
+    ) -> List[BirdResult]:
+        """
+        批量获取推文
+
+        bird工具每次调用只支持一个目标，这里在一次批量调用中复用
+        执行环境，并可在线程池中并发执行多个bird进程。
+
+        Args:
+            requests: 请求列表，每项为 (类型, 目标, 数据源名称)，
+                类型为 "list"（目标为列表ID）或 "timeline"（目标为用户名）
+            rate_limiter: 可选的令牌桶，传入时代替命令级令牌桶，
+                每次bird调用（包括重试）前获取一个令牌
+            max_workers: 最大并发bird进程数，为1时按顺序执行
+
+        Returns:
+            List[BirdResult]: 与请求顺序一一对应的执行结果
+        """
+        env = self._get_environment()
+
+        def failed(request_type: str, target: str, error: Exception) -> BirdResult:
+            error_msg = f"批量获取推文失败 ({request_type}: {target}): {str(error)}"
+            self.logger.error(error_msg)
+            return BirdResult(
+                success=False,
+                output="",
+                error=error_msg,
+                exit_code=-1,
+                execution_time=0.0,
+                command=["bird", request_type, target]
+            )
+
+        # 在调用线程上确定每个请求的命令参数：max_pages的智能计算会查询data_manager，
+        # 不放到工作线程中执行
+        # 每项为 (类型, 目标, 命令参数或准备阶段的失败结果)
+        prepared: List[Tuple[str, str, Union[List[str], BirdResult]]] = []
+        for request_type, target, source_name in requests:
+            try:
+                max_pages = self._resolve_max_pages(None, source_name)
+                if request_type == "list":
+                    args = self._build_list_args(target, max_pages)
+                elif request_type == "timeline":
+                    args = self._build_timeline_args(target, max_pages)
+                else:
+                    raise ValueError(f"不支持的请求类型: {request_type}")
+                prepared.append((request_type, target, args))
+            except Exception as e:
+                prepared.append((request_type, target, failed(request_type, target, e)))
+
+        def run(item: Tuple[str, str, Union[List[str], BirdResult]]) -> BirdResult:
+            request_type, target, args = item
+            if isinstance(args, BirdResult):
+                return args
+
+            try:
+                return self._execute_rate_limited(args, env=env, bucket=rate_limiter)
+            except Exception as e:
+                return failed(request_type, target, e)
+
+        workers = min(max_workers, len(prepared))
+        if workers <= 1:
+            return [run(item) for item in prepared]
+
+        # 令牌桶是线程安全的，并发执行时仍按预算控制bird调用速率；
+        # 工作线程只执行bird进程，不访问data_manager
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bird-fetch") as executor:
+            return list(executor.map(run, prepared))
+
+    def _resolve_max_pages(self, max_pages: Optional[int], source_name: Optional[str]) -> int:
+        """确定本次请求的max_pages"""
+        # 如果没有指定max_pages且提供了source_name，使用智能速率限制
+        if max_pages is None and source_name:
+            max_pages = self.calculate_max_pages_for_source(source_name, source_type="x")
+            self.logger.info(f"智能速率限制: 数据源 {source_name} 使用 max_pages={max_pages}")
+        elif max_pages is None:
+            # 使用配置中的默认值
+            max_pages = self.config.bird_max_page
+
+        # 确保max_pages在有效范围内
+        return max(1, min(self.config.bird_max_page, max_pages))
+
+    def _build_list_args(self, list_id: str, max_pages: int) -> List[str]:
+        """构建列表推文命令参数"""
+        return [
+            "list-timeline",
+            list_id,
+            "--json",
+            "--max-pages", str(max_pages)
+        ]
+
+    def _build_timeline_args(self, username: str, max_pages: int) -> List[str]:
+        """构建时间线命令参数"""
+        # 清理用户名
+        if username.startswith('@'):
+            username = username[1:]
+
+        if username == "home":
+            # 主时间线
+            return [
+                "home",
+                "--json",
+                "--max-pages", str(max_pages)
+            ]
+
+        # 用户时间线
+        return [
+            "user-tweets",
+            username,
+            "--json",
+            "--max-pages", str(max_pages)
+        ]
+
+    def _execute_rate_limited(
+        self,
+        args: List[str],
+        env: Optional[Dict[str, str]] = None,
+        bucket: Optional[TokenBucket] = None,
+    ) -> BirdResult:
+        """
+        获取命令令牌后执行命令，令牌充足时不等待
+
+        每条调用路径只经过一个令牌桶：传入bucket时使用它，否则使用命令级令牌桶。
+
+        启用自动重试时，限流和服务端临时错误最多重试max_retries次；
+        错误输出中带有Retry-After时按其等待，否则等待retry_delay_seconds，
+        并附加少量随机抖动。
+        认证失败、参数错误和超时不重试。
+        """
+        if bucket is None:
+            bucket = self._command_bucket
+
+        attempt = 0
+        while True:
+            if bucket is not None:
+                waited = bucket.acquire()
+                if waited:
+                    self.logger.debug(f"速率限制延迟: {waited:.2f} 秒")
+
+            result = self.execute_command(args, env=env)
+            if result.success or not self._should_retry(result, attempt):
+                return result
+
+            attempt += 1
+            delay = self._retry_delay(result)
+            self.logger.warning(
+                f"Bird命令遇到临时错误，{delay:.0f} 秒后第 {attempt} 次重试: {result.error.strip()[:200]}"
+            )
+            time.sleep(delay)
+
+    def _should_retry(self, result: BirdResult, attempt: int) -> bool:
+        """判断失败的命令是否应重试"""
+        if not self.config.enable_auto_retry or attempt >= self.config.max_retries:
+            return False
+        return bool(_TRANSIENT_ERROR_RE.search(result.error or ""))
+
+    def _retry_delay(self, result: BirdResult) -> float:
+        """
+        计算重试等待时间，优先使用错误输出中的Retry-After
+
+        Retry-After最多按命令超时时间等待，避免服务端给出的过长间隔
+        长时间阻塞爬取线程；附加0到1秒的随机抖动，避免并发的bird进程同时重试。
+        """
+        match = _RETRY_AFTER_RE.search(result.error or "")
+        if match:
+            base = min(float(match.group(1)), float(self.config.timeout_seconds))
+        else:
+            base = float(self.config.retry_delay_seconds)
+        return base + self._rng.uniform(0, 1)
+
     def calculate_max_pages_for_source(self, source_name: str, source_type: str = "x") -> int:
         """
         计算指定数据源的智能max_pages值
@@ -470,29 +641,88 @@ class BirdWrapper:
         Returns:
             List[Dict[str, Any]]: 解析后的推文数据列表
         """
+        return list(self.iter_tweet_data(raw_data))
+
+    def iter_tweet_data(self, raw_data: str) -> Iterator[Dict[str, Any]]:
+        """
+        逐条解析推文数据
+
+        与parse_tweet_data相同，但按需逐条产出标准化后的推文，
+        调用方无需同时持有全部推文数据。
+
+        Args:
+            raw_data: bird工具的原始输出
+
+        Yields:
+            Dict[str, Any]: 标准化后的推文数据
+        """
         try:
             if not raw_data or not raw_data.strip():
-                return []
+                return
 
             # 根据输出格式解析数据
             if self.config.output_format == "json":
-                return self._parse_json_output(raw_data)
+                yield from self._iter_json_output(raw_data)
             elif self.config.output_format == "text":
-                return self._parse_text_output(raw_data)
+                yield from self._parse_text_output(raw_data)
             else:
                 self.logger.warning(f"不支持的输出格式: {self.config.output_format}")
-                return []
 
         except Exception as e:
             self.logger.error(f"解析推文数据失败: {str(e)}")
-            return []
 
     def _parse_json_output(self, raw_data: str) -> List[Dict[str, Any]]:
         """解析JSON格式输出"""
+        return list(self._iter_json_output(raw_data))
+
+    def _iter_json_documents(self, raw_data: str) -> Iterator[Any]:
+        """
+        逐个产出JSON顶层文档
+
+        优先整体解析（bird工具通常输出单个JSON数组），失败时再按
+        多个连续JSON文档（NDJSON）逐个解析，两者都优先使用快速解析函数。
+        """
         try:
-            # 尝试解析为JSON
-            data = json.loads(raw_data)
+            yield self._json_loads(raw_data)
+            return
+        except ValueError:
+            pass
+
+        decoder = json.JSONDecoder()
+        position = 0
+        length = len(raw_data)
+
+        while True:
+            # 跳过文档之间的空白
+            while position < length and raw_data[position].isspace():
+                position += 1
+            if position >= length:
+                return
+
+            # NDJSON通常一行一个文档，整行交给快速解析函数；
+            # 跨行的文档再用标准库逐个解码
+            line_end = raw_data.find("\n", position)
+            if line_end == -1:
+                line_end = length
+            try:
+                data = self._json_loads(raw_data[position:line_end])
+                position = line_end
+            except ValueError:
+                try:
+                    data, position = decoder.raw_decode(raw_data, position)
+                except json.JSONDecodeError as e:
+                    self.logger.error(f"JSON解析失败: {str(e)}")
+                    return
+
+            yield data
 
+    def _iter_json_output(self, raw_data: str) -> Iterator[Dict[str, Any]]:
+        """
+        逐条解析JSON格式输出
+
+        支持单个JSON文档，也支持逐行输出的多个JSON文档（NDJSON）。
+        """
+        for data in self._iter_json_documents(raw_data):
             # bird工具返回的数据可能是数组或单个对象
             if isinstance(data, list):
                 tweets = data
@@ -505,21 +735,14 @@ class BirdWrapper:
                 else:
                     tweets = [data]
             else:
-                return []
+                continue
 
             # 标准化推文数据格式
-            normalized_tweets = []
             for item in tweets:
                 if isinstance(item, dict):
                     tweet = self._normalize_tweet_data(item)
                     if tweet:
-                        normalized_tweets.append(tweet)
-
-            return normalized_tweets
-
-        except json.JSONDecodeError as e:
-            self.logger.error(f"JSON解析失败: {str(e)}")
-            return []
+                        yield tweet
 
     def _parse_text_output(self, raw_data: str) -> List[Dict[str, Any]]:
         """解析文本格式输出"""
@@ -561,42 +784,43 @@ class BirdWrapper:
     def _normalize_tweet_data(self, raw_tweet: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """标准化推文数据格式"""
         try:
-            # bird工具的输出格式
-            tweet = {
-                'id': raw_tweet.get('id', ''),
-                'text': raw_tweet.get('text', ''),
-                'created_at': raw_tweet.get('createdAt', ''),  # bird工具使用createdAt字段
-                'user': {},
-                'entities': raw_tweet.get('entities', {}),
-                'public_metrics': {
-                    'retweet_count': raw_tweet.get('retweetCount', 0),
-                    'like_count': raw_tweet.get('likeCount', 0),
-                    'reply_count': raw_tweet.get('replyCount', 0)
-                }
-            }
+            tweet_id = raw_tweet.get('id', '')
+            text = raw_tweet.get('text', '')
+
+            # 确保必需字段存在，无效推文不再构建其余字段
+            if not tweet_id or not text:
+                self.logger.warning(f"推文缺少必需字段: id={tweet_id}, text_length={len(text)}")
+                return None
 
             # 处理用户信息 - bird工具使用author字段
-            author_data = raw_tweet.get('author', {})
+            author_data = raw_tweet.get('author')
             if author_data:
-                tweet['user'] = {
+                user = {
                     'screen_name': author_data.get('username', ''),
                     'name': author_data.get('name', ''),
                     'id': raw_tweet.get('authorId', '')
                 }
             else:
                 # 如果没有author信息，尝试从其他字段获取
-                tweet['user'] = {
+                user = {
                     'screen_name': raw_tweet.get('username', 'unknown'),
                     'name': raw_tweet.get('name', ''),
                     'id': raw_tweet.get('authorId', raw_tweet.get('user_id', ''))
                 }
 
-            # 确保必需字段存在
-            if not tweet['id'] or not tweet['text']:
-                self.logger.warning(f"推文缺少必需字段: id={tweet['id']}, text_length={len(tweet['text'])}")
-                return None
-
-            return tweet
+            # bird工具的输出格式
+            return {
+                'id': tweet_id,
+                'text': text,
+                'created_at': raw_tweet.get('createdAt', ''),  # bird工具使用createdAt字段
+                'user': user,
+                'entities': raw_tweet.get('entities') or {},
+                'public_metrics': {
+                    'retweet_count': raw_tweet.get('retweetCount', 0),
+                    'like_count': raw_tweet.get('likeCount', 0),
+                    'reply_count': raw_tweet.get('replyCount', 0)
+                }
+            }
 
         except Exception as e:
             self.logger.warning(f"标准化推文数据失败: {str(e)}")
@@ -33,6 +33,9 @@ class DataSourceInterface(ABC):
     Subclasses MUST document their return type in their own crawl() signature.
     """
 
+    # 不引入实例字典，允许子类通过__slots__保持无__dict__；未声明__slots__的子类不受影响
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, time_window_hours: int, **kwargs):
         """
@@ -99,21 +102,21 @@ class DataSourceInterface(ABC):
         """
         pass
 
-    def get_supported_config_fields(self) -> List[str]:
+    def get_supported_config_fields(self) -> Sequence[str]:
         """
         获取支持的配置字段列表
 
         Returns:
-            List[str]: 支持的配置字段名称列表
+            Sequence[str]: 支持的配置字段名称序列（列表或元组，调用方不应修改）
         """
         return []
 
-    def get_required_config_fields(self) -> List[str]:
+    def get_required_config_fields(self) -> Sequence[str]:
         """
         获取必需的配置字段列表
 
         Returns:
-            List[str]: 必需的配置字段名称列表
+            Sequence[str]: 必需的配置字段名称序列（列表或元组，调用方不应修改）
         """
         return []
 
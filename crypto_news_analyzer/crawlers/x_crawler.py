@@ -6,17 +6,130 @@ X/Twitter爬取器
 基于需求4.1、4.2、4.7、4.8的实现。
 """
 
+import hashlib
+import logging
+import os
 import re
+import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-
-from ..models import ContentItem, XSource, CrawlResult, BirdConfig, create_content_item_from_raw
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+
+from ..models import (
+    ContentItem, XSource, CrawlResult, BirdConfig, BirdResult,
+    create_content_item_from_raw, create_content_items_bulk,
+)
 from ..utils.errors import CrawlerError, AuthenticationError
 from ..utils.logging import get_logger
 from .bird_wrapper import BirdWrapper
 
 
+# 推文时间格式，按命中概率排序
+_TWITTER_TIME_FORMATS = (
+    "%a %b %d %H:%M:%S %z %Y",  # Bird工具格式: "Wed Feb 04 14:57:51 +0000 2026"
+    "%a %b %d %H:%M:%S +0000 %Y",  # Twitter标准格式
+    "%Y-%m-%dT%H:%M:%S.%fZ",    # ISO格式
+    "%Y-%m-%dT%H:%M:%SZ",       # ISO格式（无毫秒）
+    "%Y-%m-%d %H:%M:%S",        # 简单格式
+)
+
+# bird错误输出中表示认证失效的信息：HTTP 401/403 或认证相关的错误文本。
+# 列表ID无效、超时、5xx等其他失败与认证无关，不应使已验证的认证信息失效
+_AUTH_ERROR_RE = re.compile(
+    r'(?:status|HTTP|code)\D{0,3}40[13]\b|unauthori[sz]ed|forbidden|could not authenticate'
+    r'|auth(?:entication)?[ _-]?(?:failed|error|required)|invalid (?:token|credentials)',
+    re.IGNORECASE,
+)
+
+# 英文月份缩写，用于不依赖locale地解析bird时间格式
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+# X/Twitter源URL：列表URL匹配list_id，用户时间线URL匹配user
+_X_URL_RE = re.compile(
+    r'^https?://(?:www\.|mobile\.)?(?:x|twitter)\.com/'
+    r'(?:[^/?#]+/lists/(?P<list_id>\d+)|(?P<user>[^/?#]+))',
+    re.IGNORECASE,
+)
+
+# 时间线URL中不代表用户名的特殊路径
+_RESERVED_PATHS = frozenset(['i', 'home', 'explore', 'notifications', 'messages', 'settings'])
+
+
+def _parse_bird_time(time_str: str) -> Optional[datetime]:
+    """
+    按固定格式快速解析bird时间，如 "Wed Feb 04 14:57:51 +0000 2026"
+
+    月份通过查表转换，不受进程locale影响，也比strptime快得多。
+
+    Returns:
+        Optional[datetime]: 带时区的时间，格式不符时返回None
+    """
+    parts = time_str.split()
+    if len(parts) != 6:
+        return None
+
+    _, month_name, day, hms, tz, year = parts
+    month = _MONTHS.get(month_name)
+    hms_parts = hms.split(":")
+    if month is None or len(hms_parts) != 3 or len(tz) != 5 or tz[0] not in "+-":
+        return None
+
+    try:
+        offset_minutes = int(tz[1:3]) * 60 + int(tz[3:5])
+        tzinfo = timezone.utc
+        if offset_minutes:
+            sign = 1 if tz[0] == "+" else -1
+            tzinfo = timezone(timedelta(minutes=sign * offset_minutes))
+        hour, minute, second = (int(v) for v in hms_parts)
+        return datetime(int(year), month, int(day), hour, minute, second, tzinfo=tzinfo)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _parse_x_url(url: str) -> Optional[Tuple[str, str]]:
+    """
+    解析X/Twitter URL，结果按URL缓存
+
+    Returns:
+        Optional[Tuple[str, str]]: ("list", 列表ID) 或 ("user", 用户名)，无法识别时返回None
+    """
+    match = _X_URL_RE.match(url)
+    if not match:
+        return None
+
+    list_id = match.group("list_id")
+    if list_id:
+        return ("list", list_id)
+
+    username = match.group("user")
+    if username in _RESERVED_PATHS:
+        return None
+    return ("user", username)
+
+
+def _extract_list_id(list_url: str) -> Optional[str]:
+    """从列表URL提取列表ID"""
+    parsed = _parse_x_url(list_url)
+    return parsed[1] if parsed and parsed[0] == "list" else None
+
+
+def _extract_username(timeline_url: str) -> Optional[str]:
+    """从时间线URL提取用户名"""
+    parsed = _parse_x_url(timeline_url)
+    return parsed[1] if parsed and parsed[0] == "user" else None
+
+
+def _credential_key() -> str:
+    """当前X认证信息的摘要，用作共享认证状态的键，避免以明文保存"""
+    raw = f"{os.getenv('X_CT0', '')}|{os.getenv('X_AUTH_TOKEN', '')}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
 class XCrawler:
     """
     X/Twitter爬取器
@@ -25,7 +138,25 @@ class XCrawler:
     支持列表和时间线爬取，提供稳定的数据获取能力。
     """
 
-    def __init__(self, time_window_hours: int, bird_config: Optional[BirdConfig] = None, data_manager: Optional[Any] = None):
+    # 认证失败后，在该时间内爬取路径不再重复验证连接（秒）
+    AUTH_RETRY_INTERVAL_SECONDS = 60.0
+
+    # 认证验证结果的有效期（秒），有效期内不再重复运行连接测试
+    AUTH_CACHE_TTL_SECONDS = 3600.0
+
+    # 进程内已验证通过的认证信息摘要 -> 有效期截止时间（monotonic），
+    # 所有爬取器实例共享，相同认证信息新建爬取器时无需再次运行连接测试
+    _verified_credentials: Dict[str, float] = {}
+    _verified_lock = threading.Lock()
+
+    def __init__(
+        self,
+        time_window_hours: int,
+        bird_config: Optional[BirdConfig] = None,
+        data_manager: Optional[Any] = None,
+        stale_streak_break: int = 5,
+        max_concurrent_sources: int = 4,
+    ):
         """
         初始化X爬取器
 
@@ -33,8 +164,15 @@ class XCrawler:
             time_window_hours: 时间窗口（小时）
             bird_config: Bird工具配置，如果为None则使用默认配置
             data_manager: 数据管理器实例，用于智能速率限制
+            stale_streak_break: 连续出现多少条超出时间窗口的推文后停止解析，
+                小于等于0表示不提前停止
+            max_concurrent_sources: 批量爬取时最多同时运行的bird进程数
         """
         self.time_window_hours = time_window_hours
+        self.stale_streak_break = stale_streak_break
+        self.max_concurrent_sources = max_concurrent_sources
+        # 当前一次爬取使用的时间窗口截止时间，同一次爬取内保持不变
+        self._current_cutoff: Optional[datetime] = None
         self.data_manager = data_manager
         self.logger = get_logger(__name__)
 
@@ -46,16 +184,25 @@ class XCrawler:
             self.logger.error(f"Bird工具初始化失败: {str(e)}")
             raise CrawlerError(f"Bird工具初始化失败: {str(e)}")
 
-        # 验证bird工具连接
+        # 验证bird工具连接，相同认证信息已验证过时直接复用
         self.authenticated = False
-        try:
-            self.authenticated = self.bird_wrapper.test_connection()
-            if self.authenticated:
-                self.logger.info("X/Twitter连接验证成功")
-            else:
-                self.logger.warning("X/Twitter连接验证失败，某些功能可能不可用")
-        except Exception as e:
-            self.logger.warning(f"X/Twitter连接验证异常: {str(e)}")
+        self._auth_failed_at: Optional[float] = None
+        self._credential_key = _credential_key()
+        self.authenticated = self._has_cached_auth()
+        if self.authenticated:
+            self.logger.info("复用已验证的X认证信息，跳过连接验证")
+        else:
+            try:
+                self.authenticated = self.bird_wrapper.test_connection()
+                if self.authenticated:
+                    self.logger.info("X/Twitter连接验证成功")
+                else:
+                    self.logger.warning("X/Twitter连接验证失败，某些功能可能不可用")
+            except Exception as e:
+                self.logger.warning(f"X/Twitter连接验证异常: {str(e)}")
+            self._record_auth_result(self.authenticated)
+        if not self.authenticated:
+            self._auth_failed_at = time.monotonic()
 
         self.logger.info(f"X爬取器初始化完成，时间窗口: {time_window_hours}小时")
 
@@ -63,54 +210,110 @@ class XCrawler:
         """
         验证认证状态
 
+        有效期内已验证通过的认证信息直接返回成功，不再运行连接测试。
+
         Returns:
             bool: 认证是否成功
         """
+        if self._has_cached_auth():
+            self.logger.debug("X认证验证结果仍在有效期内，跳过连接测试")
+            self.authenticated = True
+            return True
+
         try:
             self.authenticated = self.bird_wrapper.test_connection()
             if self.authenticated:
                 self.logger.info("X认证验证成功")
             else:
                 self.logger.warning("X认证验证失败")
-            return self.authenticated
         except Exception as e:
             self.logger.error(f"X认证验证异常: {str(e)}")
             self.authenticated = False
+
+        self._record_auth_result(self.authenticated)
+        return self.authenticated
+
+    def _has_cached_auth(self) -> bool:
+        """当前认证信息是否有仍在有效期内的验证结果"""
+        with self._verified_lock:
+            valid_until = self._verified_credentials.get(self._credential_key)
+        return valid_until is not None and time.monotonic() < valid_until
+
+    def _record_auth_result(self, authenticated: bool) -> None:
+        """
+        将认证结果同步到所有实例共享的认证状态
+
+        验证失败或bird获取推文因认证失效而失败时清除缓存，下次认证重新运行连接测试。
+        """
+        with self._verified_lock:
+            if authenticated:
+                self._verified_credentials[self._credential_key] = (
+                    time.monotonic() + self.AUTH_CACHE_TTL_SECONDS
+                )
+            else:
+                self._verified_credentials.pop(self._credential_key, None)
+
+    def _record_fetch_failure(self, result: BirdResult) -> None:
+        """
+        处理bird获取推文失败
+
+        只有错误输出表明认证失效时才清除共享的认证缓存；单个源的列表无效、
+        超时或服务端错误不影响其他源复用已验证的认证信息。
+        """
+        if _AUTH_ERROR_RE.search(result.error or ""):
+            self.logger.warning("Bird错误输出表明X认证失效，清除认证缓存")
+            self._record_auth_result(False)
+
+    def _ensure_authenticated(self) -> bool:
+        """
+        确保已认证，供爬取路径使用
+
+        已认证时直接返回；最近一次验证失败未超过AUTH_RETRY_INTERVAL_SECONDS时
+        不再重复验证，避免每个源都触发一次连接测试。
+
+        Returns:
+            bool: 是否已认证
+        """
+        if self.authenticated:
+            return True
+
+        if (
+            self._auth_failed_at is not None
+            and time.monotonic() - self._auth_failed_at < self.AUTH_RETRY_INTERVAL_SECONDS
+        ):
             return False
 
+        if self.authenticate():
+            self._auth_failed_at = None
+            return True
+
+        self._auth_failed_at = time.monotonic()
+        return False
+
     def _extract_list_id_from_url(self, list_url: str) -> Optional[str]:
         """从列表URL提取列表ID"""
         try:
-            # 匹配 https://x.com/i/lists/1234567890 格式
-            match = re.search(r'/lists/(\d+)', list_url)
-            if match:
-                return match.group(1)
-
-            self.logger.error(f"无法从URL提取列表ID: {list_url}")
-            return None
-
+            list_id = _extract_list_id(list_url)
         except Exception as e:
             self.logger.error(f"提取列表ID时出错: {str(e)}")
             return None
 
+        if not list_id:
+            self.logger.error(f"无法从URL提取列表ID: {list_url}")
+        return list_id
+
     def _extract_username_from_url(self, timeline_url: str) -> Optional[str]:
         """从时间线URL提取用户名"""
         try:
-            # 匹配 https://x.com/username 或 https://twitter.com/username 格式
-            match = re.search(r'(?:x\.com|twitter\.com)/([^/]+)', timeline_url)
-            if match:
-                username = match.group(1)
-                # 过滤掉特殊路径
-                if username not in ['i', 'home', 'explore', 'notifications', 'messages', 'settings']:
-                    return username
-
-            self.logger.error(f"无法从URL提取用户名: {timeline_url}")
-            return None
-
+            username = _extract_username(timeline_url)
         except Exception as e:
             self.logger.error(f"提取用户名时出错: {str(e)}")
             return None
 
+        if not username:
+            self.logger.error(f"无法从URL提取用户名: {timeline_url}")
+        return username
+
     def crawl_list(self, list_url: str, source_name: Optional[str] = None) -> List[ContentItem]:
         """
         爬取X列表内容
@@ -122,6 +325,7 @@ class XCrawler:
         Returns:
             List[ContentItem]: 爬取到的内容项列表
         """
+        self._refresh_cutoff()
         try:
             list_id = self._extract_list_id_from_url(list_url)
             if not list_id:
@@ -130,36 +334,20 @@ class XCrawler:
             self.logger.info(f"开始爬取X列表: {list_id}")
 
             # 确保已认证
-            if not self.authenticated and not self.authenticate():
+            if not self._ensure_authenticated():
                 raise AuthenticationError("X认证失败，请检查认证配置")
 
             # 使用bird工具获取列表推文，传递source_name用于智能速率限制
             result = self.bird_wrapper.fetch_list_tweets(list_id, source_name=source_name)
 
             if not result.success:
+                self._record_fetch_failure(result)
                 error_msg = f"Bird工具获取列表推文失败: {result.error}"
                 self.logger.error(error_msg)
                 raise CrawlerError(error_msg)
 
-            # 解析bird工具输出
-            tweets_data = self.bird_wrapper.parse_tweet_data(result.output)
-
-            if not tweets_data:
-                self.logger.warning("Bird工具返回空数据")
-                return []
-
-            # 转换为ContentItem并过滤时间窗口
-            items = []
-            for tweet_data in tweets_data:
-                try:
-                    item = self.parse_tweet(tweet_data, source_name=source_name)
-                    if self.is_within_time_window(item.publish_time):
-                        items.append(item)
-                    else:
-                        self.logger.debug(f"推文超出时间窗口，跳过: {item.title[:30]}...")
-                except Exception as e:
-                    self.logger.warning(f"解析推文失败，跳过: {str(e)}")
-                    continue
+            # 解析bird工具输出并过滤时间窗口
+            items = self._parse_result_items(result.output, source_name=source_name)
 
             self.logger.info(f"X列表爬取完成，共获得 {len(items)} 条内容")
             return items
@@ -179,6 +367,7 @@ class XCrawler:
         Returns:
             List[ContentItem]: 爬取到的内容项列表
         """
+        self._refresh_cutoff()
         try:
             username = None
             if timeline_url:
@@ -190,7 +379,7 @@ class XCrawler:
                 self.logger.info("开始爬取主时间线")
 
             # 确保已认证
-            if not self.authenticated and not self.authenticate():
+            if not self._ensure_authenticated():
                 raise AuthenticationError("X认证失败，请检查认证配置")
 
             # 使用bird工具获取时间线推文，传递source_name用于智能速率限制
@@ -203,29 +392,13 @@ class XCrawler:
                 result = self.bird_wrapper.fetch_user_timeline("home", source_name=source_name)
 
             if not result.success:
+                self._record_fetch_failure(result)
                 error_msg = f"Bird工具获取时间线推文失败: {result.error}"
                 self.logger.error(error_msg)
                 raise CrawlerError(error_msg)
 
-            # 解析bird工具输出
-            tweets_data = self.bird_wrapper.parse_tweet_data(result.output)
-
-            if not tweets_data:
-                self.logger.warning("Bird工具返回空数据")
-                return []
-
-            # 转换为ContentItem并过滤时间窗口
-            items = []
-            for tweet_data in tweets_data:
-                try:
-                    item = self.parse_tweet(tweet_data, source_name=source_name)
-                    if self.is_within_time_window(item.publish_time):
-                        items.append(item)
-                    else:
-                        self.logger.debug(f"推文超出时间窗口，跳过: {item.title[:30]}...")
-                except Exception as e:
-                    self.logger.warning(f"解析推文失败，跳过: {str(e)}")
-                    continue
+            # 解析bird工具输出并过滤时间窗口
+            items = self._parse_result_items(result.output, source_name=source_name)
 
             self.logger.info(f"X时间线爬取完成，共获得 {len(items)} 条内容")
             return items
@@ -244,133 +417,307 @@ class XCrawler:
         Returns:
             List[CrawlResult]: 爬取结果列表
         """
-        results = []
+        _, results = self.crawl_all_sources_with_items(sources)
+        return results
 
+    def crawl_all_sources_with_items(
+        self, sources: List[XSource]
+    ) -> Tuple[List[ContentItem], List[CrawlResult]]:
+        """
+        爬取所有X信息源，同时返回内容项和每个源的爬取结果
+
+        先解析所有源的抓取目标，再通过一次批量调用并发获取推文，
+        最后逐个源解析结果。抓取目标相同的源只获取一次，
+        各自按自己的源名称解析同一份输出。
+
+        Args:
+            sources: X信息源列表
+
+        Returns:
+            Tuple[List[ContentItem], List[CrawlResult]]: 按源顺序合并的内容项，
+                以及与sources一一对应的爬取结果
+        """
         if not sources:
             self.logger.info("没有配置X信息源，跳过X爬取")
-            return results
+            return [], []
 
         self.logger.info(f"开始爬取 {len(sources)} 个X信息源")
+        self._refresh_cutoff()
 
-        for source in sources:
-            try:
-                self.logger.info(f"爬取X源: {source.name} ({source.type})")
+        results: List[Optional[CrawlResult]] = [None] * len(sources)
+        items_by_index: Dict[int, List[ContentItem]] = {}
+        batch_requests: List[Tuple[str, str, Optional[str]]] = []
+        # 每个批量请求对应的源索引列表，相同抓取目标的源共用一个请求
+        batch_groups: List[List[int]] = []
+        request_slots: Dict[Tuple[str, str], int] = {}
 
-                if source.type == "list":
-                    items = self.crawl_list(source.url, source_name=source.name)
-                elif source.type == "timeline":
-                    items = self.crawl_timeline(source.url, source_name=source.name)
-                else:
-                    raise CrawlerError(f"不支持的X源类型: {source.type}")
+        # 解析抓取目标，无效源直接记为失败
+        for index, source in enumerate(sources):
+            try:
+                target = self._resolve_fetch_target(source)
+            except CrawlerError as e:
+                results[index] = self._build_error_result(source, str(e))
+                continue
+            slot = request_slots.get((source.type, target))
+            if slot is None:
+                request_slots[(source.type, target)] = len(batch_requests)
+                batch_requests.append((source.type, target, source.name))
+                batch_groups.append([index])
+            else:
+                batch_groups[slot].append(index)
+                # 多个源共用的请求不代表某一个源，不带源名称，按默认页数抓取；
+                # 每个源的结果和内容项仍按各自的源名称生成
+                request_type, request_target, _ = batch_requests[slot]
+                batch_requests[slot] = (request_type, request_target, None)
 
-                result = CrawlResult(
-                    source_name=source.name,
-                    status="success",
-                    item_count=len(items),
-                    error_message=None
+        if batch_requests:
+            # 确保已认证
+            if not self._ensure_authenticated():
+                for group in batch_groups:
+                    for index in group:
+                        results[index] = self._build_error_result(sources[index], "X认证失败，请检查认证配置")
+            else:
+                # bird调用速率由BirdWrapper的命令级令牌桶统一控制
+                fetch_results = self.bird_wrapper.fetch_batch(
+                    batch_requests,
+                    max_workers=self.max_concurrent_sources,
                 )
+                for group, fetch_result in zip(batch_groups, fetch_results):
+                    for index in group:
+                        results[index], items_by_index[index] = self._build_source_result(
+                            sources[index], fetch_result
+                        )
+
+        # 每个源都已分配结果，收窄为非空列表
+        final: List[CrawlResult] = []
+        for result in results:
+            assert result is not None
+            final.append(result)
+
+        success_count = sum(1 for r in final if r.status == "success")
+        self.logger.info(f"X爬取完成，成功: {success_count}/{len(sources)}")
 
-                self.logger.info(f"X源 {source.name} 爬取成功，获得 {len(items)} 条内容")
+        all_items = [item for index in sorted(items_by_index) for item in items_by_index[index]]
+        return all_items, final
 
-            except Exception as e:
-                error_msg = str(e)
-                self.logger.error(f"X源 {source.name} 爬取失败: {error_msg}")
-
-                result = CrawlResult(
-                    source_name=source.name,
-                    status="error",
-                    item_count=0,
-                    error_message=error_msg
-                )
+    def _resolve_fetch_target(self, source: XSource) -> str:
+        """
+        解析X源对应的bird抓取目标
 
-            results.append(result)
+        Args:
+            source: X信息源
 
-            # 在源之间添加延迟，避免过于频繁的请求
-            if len(sources) > 1:
-                delay = 5.0  # 固定5秒延迟，bird工具内部已有速率限制
-                self.logger.debug(f"源间延迟: {delay} 秒")
-                time.sleep(delay)
+        Returns:
+            str: 列表ID或用户名
 
-        success_count = sum(1 for r in results if r.status == "success")
-        self.logger.info(f"X爬取完成，成功: {success_count}/{len(sources)}")
+        Raises:
+            CrawlerError: 源类型不支持或URL无效
+        """
+        if source.type == "list":
+            list_id = self._extract_list_id_from_url(source.url)
+            if not list_id:
+                raise CrawlerError(f"无效的列表URL: {source.url}")
+            return list_id
+
+        if source.type == "timeline":
+            if not source.url:
+                return "home"
+            username = self._extract_username_from_url(source.url)
+            if not username:
+                raise CrawlerError(f"无效的时间线URL: {source.url}")
+            return username
+
+        raise CrawlerError(f"不支持的X源类型: {source.type}")
+
+    def _build_source_result(
+        self, source: XSource, fetch_result: BirdResult
+    ) -> Tuple[CrawlResult, List[ContentItem]]:
+        """根据bird执行结果生成单个源的爬取结果及内容项"""
+        if not fetch_result.success:
+            self._record_fetch_failure(fetch_result)
+            return self._build_error_result(source, f"Bird工具获取推文失败: {fetch_result.error}"), []
 
-        return results
+        try:
+            items = self._parse_result_items(fetch_result.output, source_name=source.name)
+        except Exception as e:
+            return self._build_error_result(source, f"解析推文失败: {str(e)}"), []
+
+        self.logger.info(f"X源 {source.name} 爬取成功，获得 {len(items)} 条内容")
+        return CrawlResult(
+            source_name=source.name,
+            status="success",
+            item_count=len(items),
+            error_message=None
+        ), items
+
+    def _build_error_result(self, source: XSource, error_msg: str) -> CrawlResult:
+        """生成单个源的失败结果"""
+        self.logger.error(f"X源 {source.name} 爬取失败: {error_msg}")
+        return CrawlResult(
+            source_name=source.name,
+            status="error",
+            item_count=0,
+            error_message=error_msg
+        )
+
+    def _parse_result_items(self, output: str, source_name: Optional[str] = None) -> List[ContentItem]:
+        """
+        解析bird工具输出为时间窗口内的内容项
 
-    def parse_tweet(self, tweet_data: Dict[str, Any], source_name: Optional[str] = None) -> ContentItem:
+        Args:
+            output: bird工具原始输出
+            source_name: 数据源名称（可选）
+
+        Returns:
+            List[ContentItem]: 时间窗口内的内容项列表
+        """
+        return self._convert_tweets(self.bird_wrapper.iter_tweet_data(output), source_name=source_name)
+
+    def _convert_tweets(self, tweets_data: Iterable[Dict[str, Any]], source_name: Optional[str] = None) -> List[ContentItem]:
+        """
+        将推文数据转换为ContentItem并过滤时间窗口
+
+        Args:
+            tweets_data: 推文原始数据，可以是列表或按需产出的迭代器
+            source_name: 数据源名称（可选）
+
+        Returns:
+            List[ContentItem]: 时间窗口内的内容项列表
+        """
+        cutoff_time = self._current_cutoff or self._refresh_cutoff()
+        rows = []
+        tweet_count = 0
+        skipped_count = 0
+        stale_streak = 0
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        for tweet_data in tweets_data:
+            tweet_count += 1
+            # 先只解析时间，超出时间窗口的推文不构建ContentItem
+            publish_time = self._parse_twitter_time(tweet_data.get("created_at", ""))
+            if publish_time < cutoff_time:
+                if debug_enabled:
+                    self.logger.debug("推文超出时间窗口，跳过: id=%r", tweet_data.get("id"))
+                # bird输出按时间倒序排列，连续多条超出窗口说明后续推文都已过期
+                # （置顶推文等少量乱序推文不会触发）
+                stale_streak += 1
+                if 0 < self.stale_streak_break <= stale_streak:
+                    self.logger.debug("连续 %d 条推文超出时间窗口，停止解析", stale_streak)
+                    break
+                continue
+            stale_streak = 0
+
+            fields = self._build_tweet_fields(tweet_data, publish_time)
+            if fields is None:
+                skipped_count += 1
+                continue
+            rows.append(fields)
+
+        if not tweet_count:
+            self.logger.warning("Bird工具返回空数据")
+        elif skipped_count:
+            self.logger.warning("共有 %d 条推文数据无效，已跳过", skipped_count)
+
+        # 时间窗口内的推文一次性批量构建ContentItem
+        return create_content_items_bulk(rows, source_name=source_name or "X/Twitter", source_type="x")
+
+    def parse_tweet(
+        self,
+        tweet_data: Dict[str, Any],
+        source_name: Optional[str] = None,
+        publish_time: Optional[datetime] = None,
+    ) -> Optional[ContentItem]:
         """
         解析推文数据为ContentItem
 
         Args:
             tweet_data: 推文原始数据
             source_name: 数据源名称（可选）
+            publish_time: 已预解析的发布时间（可选），为None时从created_at解析
 
         Returns:
-            ContentItem: 解析后的内容项
+            Optional[ContentItem]: 解析后的内容项，数据无效时返回None
         """
-        try:
-            # 提取基本信息
-            tweet_id = tweet_data.get("id", "")
-            text = tweet_data.get("text", "").strip()
-            created_at_str = tweet_data.get("created_at", "")
-            user_data = tweet_data.get("user", {})
-
-            # 解析时间
-            publish_time = self._parse_twitter_time(created_at_str)
-
-            # 构建标题（使用用户名和推文开头）
-            username = user_data.get("screen_name", "unknown")
-            title = f"@{username}: {text[:50]}..." if len(text) > 50 else f"@{username}: {text}"
-
-            # 构建URL
-            url = f"https://x.com/{username}/status/{tweet_id}"
-
-            # 使用source_name或默认值
-            final_source_name = source_name if source_name else "X/Twitter"
-
-            # 创建ContentItem
-            return create_content_item_from_raw(
-                title=title,
-                content=text,
-                url=url,
-                publish_time=publish_time,
-                source_name=final_source_name,
-                source_type="x"
-            )
+        fields = self._build_tweet_fields(tweet_data, publish_time)
+        if fields is None:
+            return None
 
-        except Exception as e:
-            self.logger.error(f"解析推文失败: {str(e)}")
-            raise CrawlerError(f"解析推文失败: {str(e)}")
+        title, text, url, publish_time = fields
+
+        # 创建ContentItem
+        return create_content_item_from_raw(
+            title=title,
+            content=text,
+            url=url,
+            publish_time=publish_time,
+            source_name=source_name if source_name else "X/Twitter",
+            source_type="x"
+        )
+
+    def _build_tweet_fields(
+        self,
+        tweet_data: Dict[str, Any],
+        publish_time: Optional[datetime] = None,
+    ) -> Optional[Tuple[str, str, str, datetime]]:
+        """
+        提取构建ContentItem所需的字段
+
+        Args:
+            tweet_data: 推文原始数据
+            publish_time: 已预解析的发布时间（可选），为None时从created_at解析
+
+        Returns:
+            Optional[Tuple[str, str, str, datetime]]: (标题, 内容, URL, 发布时间)，
+                数据无效时返回None
+        """
+        # 提取基本信息
+        tweet_id = tweet_data.get("id", "")
+        text = (tweet_data.get("text") or "").strip()
+        user_data = tweet_data.get("user") or {}
+
+        if not tweet_id or not text:
+            self.logger.warning("推文缺少必需字段，跳过: id=%r", tweet_id)
+            return None
+
+        # 解析时间
+        if publish_time is None:
+            publish_time = self._parse_twitter_time(tweet_data.get("created_at", ""))
+
+        # 构建标题（使用用户名和推文开头）
+        username = user_data.get("screen_name") or "unknown"
+        head = text[:50]
+        title = f"@{username}: {head}{'...' if len(head) < len(text) else ''}"
+
+        # 构建URL
+        url = f"https://x.com/{username}/status/{tweet_id}"
+
+        return title, text, url, publish_time
 
     def _parse_twitter_time(self, time_str: str) -> datetime:
         """解析Twitter时间格式"""
         try:
             if not time_str:
                 self.logger.warning("时间字符串为空，使用当前时间")
-                from datetime import timezone
                 return datetime.now(timezone.utc)
 
+            # bird工具的固定格式走快速路径
+            dt = _parse_bird_time(time_str)
+            if dt is not None:
+                return dt
+
             # 尝试多种时间格式
-            time_formats = [
-                "%a %b %d %H:%M:%S %z %Y",  # Bird工具格式: "Wed Feb 04 14:57:51 +0000 2026"
-                "%a %b %d %H:%M:%S +0000 %Y",  # Twitter标准格式
-                "%Y-%m-%dT%H:%M:%S.%fZ",    # ISO格式
-                "%Y-%m-%dT%H:%M:%SZ",       # ISO格式（无毫秒）
-                "%Y-%m-%d %H:%M:%S",        # 简单格式
-            ]
-
-            for fmt in time_formats:
+            for fmt in _TWITTER_TIME_FORMATS:
                 try:
                     dt = datetime.strptime(time_str, fmt)
 
                     # 如果解析出的时间有时区信息，保持时区信息
                     if dt.tzinfo is not None:
-                        self.logger.debug(f"解析Twitter时间（带时区）: {dt}")
+                        self.logger.debug("解析Twitter时间（带时区）: %s", dt)
                         return dt
                     else:
                         # 没有时区信息，假设为UTC时间
-                        from datetime import timezone
                         dt = dt.replace(tzinfo=timezone.utc)
-                        self.logger.debug(f"解析Twitter时间（添加UTC时区）: {dt}")
+                        self.logger.debug("解析Twitter时间（添加UTC时区）: %s", dt)
                         return dt
 
                 except ValueError:
@@ -379,29 +726,26 @@ class XCrawler:
             # 如果所有格式都失败，尝试使用dateutil
             try:
                 from dateutil import parser
-                from datetime import timezone
                 dt = parser.parse(time_str)
 
                 # 如果有时区信息，保持时区信息
                 if dt.tzinfo is not None:
-                    self.logger.debug(f"dateutil解析Twitter时间（带时区）: {dt}")
+                    self.logger.debug("dateutil解析Twitter时间（带时区）: %s", dt)
                     return dt
                 else:
                     # 没有时区信息，假设为UTC时间
                     dt = dt.replace(tzinfo=timezone.utc)
-                    self.logger.debug(f"dateutil解析Twitter时间（添加UTC时区）: {dt}")
+                    self.logger.debug("dateutil解析Twitter时间（添加UTC时区）: %s", dt)
                     return dt
 
             except Exception:
                 pass
 
-            self.logger.warning(f"无法解析时间格式: {time_str}，使用当前时间")
-            from datetime import timezone
+            self.logger.warning("无法解析时间格式: %s，使用当前时间", time_str)
             return datetime.now(timezone.utc)
 
         except Exception as e:
-            self.logger.warning(f"解析Twitter时间失败: {time_str}, 错误: {str(e)}")
-            from datetime import timezone
+            self.logger.warning("解析Twitter时间失败: %s, 错误: %s", time_str, e)
             return datetime.now(timezone.utc)
 
     def is_within_time_window(self, publish_time: datetime) -> bool:
@@ -414,10 +758,19 @@ class XCrawler:
         Returns:
             bool: 是否在时间窗口内
         """
-        from datetime import timezone
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=self.time_window_hours)
+        cutoff_time = self._current_cutoff or self._refresh_cutoff()
         return publish_time >= cutoff_time
 
+    def _refresh_cutoff(self) -> datetime:
+        """
+        计算并记录本次爬取的时间窗口截止时间
+
+        每次爬取开始时调用一次，同一次爬取的所有源和推文共用该截止时间，
+        边界上的推文不会因处理先后而得到不同的判断结果。
+        """
+        self._current_cutoff = datetime.now(timezone.utc) - timedelta(hours=self.time_window_hours)
+        return self._current_cutoff
+
     def get_diagnostic_info(self) -> Dict[str, Any]:
         """
         获取诊断信息
@@ -442,13 +795,16 @@ class XCrawler:
     def cleanup(self) -> None:
         """清理资源"""
         try:
-            if hasattr(self, 'bird_wrapper') and self.bird_wrapper:
+            bird_wrapper = getattr(self, 'bird_wrapper', None)
+            if bird_wrapper:
                 # BirdWrapper目前没有cleanup方法，但可以在这里添加清理逻辑
                 pass
             self.logger.debug("X爬取器资源清理完成")
         except Exception as e:
             self.logger.warning(f"X爬取器清理时出错: {str(e)}")
 
-    def __del__(self):
-        """析构函数，清理资源"""
+    def __enter__(self) -> "XCrawler":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
         self.cleanup()
@@ -5,12 +5,41 @@ X/Twitter爬取器适配器
 保持向后兼容性的同时支持新的插件化架构。
 """
 
-from typing import Dict, List, Any, Optional
+import logging
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Sequence, Set, Tuple
 
 from .data_source_interface import DataSourceInterface, CrawlError, ConfigValidationError
 from .x_crawler import XCrawler
-from ..models import ContentItem, XSource, BirdConfig
-from ..utils.logging import get_logger
+from ..models import ContentItem, CrawlResult, XSource, BirdConfig
+
+
+# 模块级日志器，避免每次构建适配器时都查找日志器
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=512)
+def _build_x_source(name: str, url: str, source_type: str) -> XSource:
+    """
+    构建XSource，相同配置复用同一实例
+
+    XSource在__post_init__中完成校验，无效配置抛出的ValueError不会被缓存。
+    """
+    return XSource(name=name, url=url, type=source_type)
+
+
+def _validation_key(config: Dict[str, Any]) -> Optional[Tuple[Any, Any, Any]]:
+    """
+    获取配置的验证缓存键，验证结果只取决于name、url和type
+
+    配置不是字典或字段值不可哈希时返回None，调用方应走不缓存的验证路径。
+    """
+    try:
+        key = (config.get("name"), config.get("url"), config.get("type"))
+        hash(key)
+    except (AttributeError, TypeError):
+        return None
+    return key
 
 
 class XCrawlerAdapter(DataSourceInterface):
@@ -21,6 +50,40 @@ class XCrawlerAdapter(DataSourceInterface):
     提供统一的接口同时保持原有功能。
     """
 
+    # 实例属性固定，使用__slots__避免实例字典开销
+    __slots__ = ("time_window_hours", "bird_config", "data_manager", "logger", "_validated_keys", "x_crawler")
+
+    # 支持/必需的配置字段，直接返回共享元组；集合形式用于一次差集检查缺失字段
+    _SUPPORTED_FIELDS = ("name", "url", "type", "description")
+    _REQUIRED_FIELDS = ("name", "url", "type")
+    _REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+    # 源类型到爬取器方法名的分发表，新增源类型只需在此注册
+    _CRAWL_METHODS: Dict[str, str] = {
+        "list": "crawl_list",
+        "timeline": "crawl_timeline",
+    }
+
+    # get_source_info中与配置无关的X特定信息，只构建一次；
+    # 序列以元组保存，返回时复制为列表，与其他数据源的返回类型一致
+    _STATIC_SOURCE_INFO: Dict[str, Any] = {
+        "supported_types": ("list", "timeline"),
+        "auth_required": True,
+        "rate_limited": True,
+        "features": (
+            "基于bird工具的稳定爬取",
+            "列表和时间线爬取",
+            "自动速率限制管理",
+            "时间窗口过滤",
+            "错误恢复机制"
+        ),
+    }
+    _BIRD_TOOL_INFO: Dict[str, bool] = {
+        "required": True,
+        "auto_retry": True,
+        "rate_limit_managed": True
+    }
+
     def __init__(self, time_window_hours: int, bird_config: Optional[BirdConfig] = None, data_manager: Optional[Any] = None):
         """
         初始化X爬取器适配器
@@ -33,28 +96,31 @@ class XCrawlerAdapter(DataSourceInterface):
         self.time_window_hours = time_window_hours
         self.bird_config = bird_config
         self.data_manager = data_manager
-        self.logger = get_logger(__name__)
+        self.logger = logger
+
+        # 已通过验证的配置键，crawl时跳过重复验证
+        self._validated_keys: Set[Tuple[Any, Any, Any]] = set()
 
         # 创建底层X爬取器实例
         self.x_crawler = None
         try:
             self.x_crawler = XCrawler(time_window_hours=time_window_hours, bird_config=bird_config, data_manager=data_manager)
         except Exception as e:
-            self.logger.warning(f"X爬取器初始化失败: {str(e)}")
+            self.logger.warning("X爬取器初始化失败: %s", e)
 
-        self.logger.info(f"X爬取器适配器初始化完成，时间窗口: {time_window_hours}小时")
+        self.logger.info("X爬取器适配器初始化完成，时间窗口: %s小时", time_window_hours)
 
     def get_source_type(self) -> str:
         """获取数据源类型标识"""
         return "x"
 
-    def get_supported_config_fields(self) -> List[str]:
+    def get_supported_config_fields(self) -> Sequence[str]:
         """获取支持的配置字段列表"""
-        return ["name", "url", "type", "description"]
+        return self._SUPPORTED_FIELDS
 
-    def get_required_config_fields(self) -> List[str]:
+    def get_required_config_fields(self) -> Sequence[str]:
         """获取必需的配置字段列表"""
-        return ["name", "url", "type"]
+        return self._REQUIRED_FIELDS
 
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """
@@ -69,35 +135,55 @@ class XCrawlerAdapter(DataSourceInterface):
         Raises:
             ConfigValidationError: 配置验证失败
         """
-        try:
-            # 检查必需字段
-            required_fields = self.get_required_config_fields()
-            missing_fields = [field for field in required_fields if field not in config]
-            if missing_fields:
-                raise ConfigValidationError(
-                    f"缺少必需的配置字段: {missing_fields}",
-                    source_type=self.get_source_type(),
-                    source_name=config.get("name", "Unknown")
-                )
+        errors = self._collect_errors(config)
+        if errors:
+            raise ConfigValidationError(
+                "; ".join(errors),
+                source_type=self.get_source_type(),
+                source_name=config.get("name", "Unknown") if isinstance(config, dict) else "Unknown"
+            )
 
-            # 创建XSource对象进行验证
-            x_source = self._config_to_x_source(config)
-            x_source.validate()  # 这会抛出ValueError如果配置无效
+        key = _validation_key(config)
+        if key is not None:
+            self._validated_keys.add(key)
+        return True
 
-            return True
+    def _ensure_validated(self, config: Dict[str, Any]) -> None:
+        """
+        确保配置已通过验证，已缓存的配置直接跳过
 
-        except ValueError as e:
-            raise ConfigValidationError(
-                str(e),
-                source_type=self.get_source_type(),
-                source_name=config.get("name", "Unknown")
-            ) from e
-        except Exception as e:
-            raise ConfigValidationError(
-                f"配置验证时出现未知错误: {str(e)}",
-                source_type=self.get_source_type(),
-                source_name=config.get("name", "Unknown")
-            ) from e
+        Raises:
+            ConfigValidationError: 配置验证失败
+        """
+        key = _validation_key(config)
+        if key is None or key not in self._validated_keys:
+            self.validate_config(config)
+
+    def _collect_errors(self, config: Dict[str, Any]) -> List[str]:
+        """
+        收集X配置中的全部问题，不抛出异常
+
+        Args:
+            config: X配置字典
+
+        Returns:
+            List[str]: 错误信息列表，配置有效时为空
+        """
+        if not isinstance(config, dict):
+            return [f"X配置必须是字典，实际为: {type(config).__name__}"]
+
+        # 检查必需字段
+        missing = self._REQUIRED_FIELD_SET - config.keys()
+        if missing:
+            # 仅在出错时按字段定义顺序整理缺失字段
+            missing_fields = [field for field in self._REQUIRED_FIELDS if field in missing]
+            return [f"缺少必需的配置字段: {missing_fields}"]
+
+        return XSource.collect_errors(config["name"], config["url"], config["type"])
+
+    def invalidate_validation_cache(self) -> None:
+        """清空配置验证缓存，之后的爬取会重新验证配置"""
+        self._validated_keys.clear()
 
     def validate_source_availability(self, config: Dict[str, Any]) -> bool:
         """
@@ -110,17 +196,11 @@ class XCrawlerAdapter(DataSourceInterface):
             bool: X源是否可访问
         """
         try:
-            # 如果没有爬取器实例，尝试创建
-            if not self.x_crawler:
-                temp_crawler = XCrawler(time_window_hours=self.time_window_hours, bird_config=self.bird_config, data_manager=self.data_manager)
-                result = temp_crawler.authenticate()
-                temp_crawler.cleanup()
-                return result
-            else:
-                return self.x_crawler.authenticate()
+            # 复用（必要时创建并保存）爬取器实例，认证状态由XCrawler按凭据缓存
+            return self._get_or_create_crawler().authenticate()
 
         except Exception as e:
-            self.logger.warning(f"X源可访问性检查失败: {str(e)}")
+            self.logger.warning("X源可访问性检查失败: %s", e)
             return False
 
     def crawl(self, config: Dict[str, Any]) -> List[ContentItem]:
@@ -136,8 +216,8 @@ class XCrawlerAdapter(DataSourceInterface):
         Raises:
             CrawlError: 爬取失败时抛出
         """
-        # 验证配置
-        self.validate_config(config)
+        # 验证配置，已验证过的配置直接跳过
+        self._ensure_validated(config)
 
         source_name = config.get("name", "Unknown X Source")
 
@@ -148,18 +228,16 @@ class XCrawlerAdapter(DataSourceInterface):
             # 转换配置为XSource对象
             x_source = self._config_to_x_source(config)
 
-            # 根据类型进行爬取
-            if x_source.type == "list":
-                items = crawler.crawl_list(x_source.url, source_name=source_name)
-            elif x_source.type == "timeline":
-                items = crawler.crawl_timeline(x_source.url, source_name=source_name)
-            else:
+            # 根据类型分发爬取
+            method_name = self._CRAWL_METHODS.get(x_source.type)
+            if method_name is None:
                 raise CrawlError(
                     f"不支持的X源类型: {x_source.type}",
                     source_type=self.get_source_type(),
                     source_name=source_name
                 )
 
+            items: List[ContentItem] = getattr(crawler, method_name)(x_source.url, source_name=source_name)
             return items
 
         except Exception as e:
@@ -189,22 +267,14 @@ class XCrawlerAdapter(DataSourceInterface):
             # 转换配置为XSource对象列表
             x_sources = []
             for config in sources:
-                self.validate_config(config)
+                self._ensure_validated(config)
                 x_sources.append(self._config_to_x_source(config))
 
             # 确保有爬取器实例
             crawler = self._get_or_create_crawler()
 
-            # 使用底层爬取器进行批量爬取
-            crawl_results = crawler.crawl_all_sources(x_sources)
-
-            # 收集所有内容项
-            all_items = []
-            for result in crawl_results:
-                if result.status == "success":
-                    # 注意：原始XCrawler的crawl_all_sources返回CrawlResult列表，不包含items
-                    # 需要单独爬取每个源来获取items
-                    pass
+            # 使用底层爬取器进行批量爬取，一次调用同时拿到内容项和每个源的结果
+            all_items, crawl_results = crawler.crawl_all_sources_with_items(x_sources)
 
             # 重新组织返回格式以匹配接口
             return {
@@ -218,6 +288,60 @@ class XCrawlerAdapter(DataSourceInterface):
             self.logger.error(error_msg)
             raise CrawlError(error_msg, source_type=self.get_source_type()) from e
 
+    def crawl_all_sources_with_items(
+        self, sources: List[Dict[str, Any]]
+    ) -> Tuple[List[ContentItem], List[CrawlResult]]:
+        """
+        批量爬取X源，返回内容项和与sources一一对应的爬取结果
+
+        配置无效的源记为失败，不影响其他源；有效的源交给底层爬取器
+        一次批量抓取，相同抓取目标只获取一次。
+
+        Args:
+            sources: X配置字典列表
+
+        Returns:
+            Tuple[List[ContentItem], List[CrawlResult]]: 内容项及每个源的爬取结果
+
+        Raises:
+            CrawlError: 无法创建底层爬取器时抛出
+        """
+        results: List[Optional[CrawlResult]] = [None] * len(sources)
+        valid_indexes: List[int] = []
+        x_sources: List[XSource] = []
+
+        for index, config in enumerate(sources):
+            try:
+                self._ensure_validated(config)
+                x_sources.append(self._config_to_x_source(config))
+                valid_indexes.append(index)
+            except Exception as e:
+                source_name = config.get("name") if isinstance(config, dict) else None
+                if not isinstance(source_name, str) or not source_name.strip():
+                    source_name = "Unknown X Source"
+                self.logger.warning("X源 %s 配置无效: %s", source_name, e)
+                results[index] = CrawlResult(
+                    source_name=source_name,
+                    status="error",
+                    item_count=0,
+                    error_message=str(e)
+                )
+
+        all_items: List[ContentItem] = []
+        if x_sources:
+            crawler = self._get_or_create_crawler()
+            all_items, crawl_results = crawler.crawl_all_sources_with_items(x_sources)
+            for index, crawl_result in zip(valid_indexes, crawl_results):
+                results[index] = crawl_result
+
+        # 每个源都已分配结果，收窄为非空列表
+        final: List[CrawlResult] = []
+        for result in results:
+            assert result is not None
+            final.append(result)
+
+        return all_items, final
+
     def get_source_info(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
         获取X源信息
@@ -231,23 +355,10 @@ class XCrawlerAdapter(DataSourceInterface):
         base_info = super().get_source_info(config)
 
         # 添加X特定信息
-        base_info.update({
-            "supported_types": ["list", "timeline"],
-            "auth_required": True,
-            "rate_limited": True,
-            "features": [
-                "基于bird工具的稳定爬取",
-                "列表和时间线爬取",
-                "自动速率限制管理",
-                "时间窗口过滤",
-                "错误恢复机制"
-            ],
-            "bird_tool_info": {
-                "required": True,
-                "auto_retry": True,
-                "rate_limit_managed": True
-            }
-        })
+        base_info.update(self._STATIC_SOURCE_INFO)
+        base_info["supported_types"] = list(self._STATIC_SOURCE_INFO["supported_types"])
+        base_info["features"] = list(self._STATIC_SOURCE_INFO["features"])
+        base_info["bird_tool_info"] = dict(self._BIRD_TOOL_INFO)
 
         # 添加认证状态信息
         if self.x_crawler:
@@ -267,18 +378,20 @@ class XCrawlerAdapter(DataSourceInterface):
             config: X配置字典
 
         Returns:
-            XSource: X源对象
+            XSource: X源对象（按配置缓存，调用方不应修改）
         """
-        return XSource(
-            name=config["name"],
-            url=config["url"],
-            type=config["type"]
-        )
+        try:
+            return _build_x_source(config["name"], config["url"], config["type"])
+        except TypeError:
+            # 字段值不可哈希时无法使用缓存，直接构建
+            return XSource(name=config["name"], url=config["url"], type=config["type"])
 
     def _get_or_create_crawler(self) -> XCrawler:
         """
         获取或创建X爬取器实例
 
+        创建成功后保存到self.x_crawler，后续可用性检查和爬取共用同一实例。
+
         Returns:
             XCrawler: X爬取器实例
 
@@ -289,8 +402,8 @@ class XCrawlerAdapter(DataSourceInterface):
             return self.x_crawler
 
         try:
-            crawler = XCrawler(time_window_hours=self.time_window_hours, bird_config=self.bird_config, data_manager=self.data_manager)
-            return crawler
+            self.x_crawler = XCrawler(time_window_hours=self.time_window_hours, bird_config=self.bird_config, data_manager=self.data_manager)
+            return self.x_crawler
         except Exception as e:
             raise CrawlError(
                 f"创建X爬取器失败: {str(e)}",
@@ -9,7 +9,7 @@ Version: 1.0.0
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple, Set
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Set
 
 from .models import (
     AnalysisRequest,
@@ -294,7 +294,7 @@ class ContentRepository(ABC):
         pass
 
     @abstractmethod
-    def deduplicate(self) -> int:
+    def deduplicate(self, content_hashes: Optional[Iterable[str]] = None) -> int:
         pass
 
     @abstractmethod
@@ -310,6 +310,15 @@ class ContentRepository(ABC):
     ) -> List[Any]:
         pass
 
+    @abstractmethod
+    def count_recent_content_items(
+        self,
+        time_window_hours: Optional[int] = None,
+        source_types: Optional[List[str]] = None,
+    ) -> int:
+        """Count items in the time window without loading them"""
+        pass
+
     @abstractmethod
     def get_content_items_since(
         self,
@@ -19,12 +19,14 @@ import signal
 import threading
 import time
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Deque, Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
 from enum import Enum
 import json
-import traceback
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from types import SimpleNamespace
 
 from .config.manager import ConfigManager
@@ -35,7 +37,9 @@ from .config.llm_registry import (
 )
 from .domain.models import DataSource, IngestionJob, IngestionJobStatus
 from .storage.data_manager import DataManager
+from .utils.timezone_utils import format_datetime_utc8
 from .crawlers.data_source_factory import get_data_source_factory
+from .crawlers.x_crawler_adapter import XCrawlerAdapter
 from .analyzers.llm_analyzer import LLMAnalyzer
 from .reporters.report_generator import ReportGenerator, create_analyzed_data
 from .reporters.telegram_sender import TelegramSenderSync, create_telegram_config
@@ -48,6 +52,9 @@ from .models import (
 )
 from .utils.errors import ErrorRecoveryManager
 
+# 报告备份文件名中的时间戳格式
+_BACKUP_TS_FMT = "%Y%m%d_%H%M%S"
+
 
 class ExecutionMode(Enum):
     """执行模式"""
@@ -89,6 +96,14 @@ class ExecutionInfo:
             self.categories_found = {}
 
 
+@dataclass(frozen=True)
+class WorkflowConfig:
+    """单次工作流的配置快照，周期开始时构建一次，各阶段只读共享"""
+
+    time_window_hours: int
+    min_weight_score: int
+
+
 @dataclass
 class ExecutionResult:
     """执行结果"""
@@ -107,11 +122,26 @@ class ExecutionResult:
     trigger_chat_id: Optional[str] = None  # 触发命令的聊天ID
 
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
-        data = asdict(self)
-        data["start_time"] = self.start_time.isoformat()
-        data["end_time"] = self.end_time.isoformat()
-        return data
+        """
+        转换为字典
+
+        字段都是扁平值，逐个取值即可，不需要asdict的递归深拷贝；
+        错误列表和分类统计复制一层，避免调用方修改影响原对象。
+        """
+        return {
+            "execution_id": self.execution_id,
+            "success": self.success,
+            "start_time": self.start_time.isoformat(),
+            "end_time": self.end_time.isoformat(),
+            "duration_seconds": self.duration_seconds,
+            "items_processed": self.items_processed,
+            "categories_found": dict(self.categories_found),
+            "errors": list(self.errors),
+            "trigger_user": self.trigger_user,
+            "report_sent": self.report_sent,
+            "trigger_type": self.trigger_type,
+            "trigger_chat_id": self.trigger_chat_id,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ExecutionResult":
@@ -166,22 +196,46 @@ class MainController:
 
         # 执行状态管理
         self.current_execution: Optional[ExecutionInfo] = None
-        self.execution_history: List[ExecutionResult] = []
-        self._execution_lock = threading.RLock()
+        # 内存中最多保留的执行历史条数，超出后自动丢弃最旧的记录
+        self._history_max = 500
+        self.execution_history: Deque[ExecutionResult] = deque(maxlen=self._history_max)
+        # 临界区只做状态读写且不会嵌套获取，使用普通锁即可
+        self._execution_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._scheduler_thread: Optional[threading.Thread] = None
         self._last_scheduled_time: Optional[datetime] = None  # 上次调度任务开始的时间
+        # 上次调度时间对应的单调时钟读数，调度等待以此为准，不受系统时间调整影响
+        self._last_scheduled_monotonic: Optional[float] = None
         self._history_file = "./data/execution_history.json"  # 执行历史持久化文件
+        self._backup_dir_ready = False  # 报告备份目录是否已创建
 
         # 并发控制
         self._max_concurrent_executions = 1
         self._execution_timeout_minutes = 30
+        self._max_concurrent_crawlers = 4
+        # 爬取共用的线程池，首次并发爬取时创建，cleanup_resources时关闭
+        self._crawl_pool: Optional[ThreadPoolExecutor] = None
+        self._crawl_pool_lock = threading.Lock()
+
+        # 上次成功分析并发送报告时的 (时间窗口小时数, 窗口内内容数)，
+        # 用于在没有新内容时跳过重复的LLM分析
+        self._last_analyzed_window: Optional[Tuple[int, int]] = None
+
+        # Telegram命令配置缓存: (解析时的config_data, 配置对象)
+        self._telegram_command_config_cache: Optional[
+            Tuple[Dict[str, Any], TelegramCommandConfig]
+        ] = None
 
         # 信号处理
+        self._shutdown_thread: Optional[threading.Thread] = None
         self._setup_signal_handlers()
 
-        # 初始化标志
+        # 已通过前提条件验证的范围 -> 验证时配置文件的修改时间
+        self._validated_prerequisites: Dict[str, int] = {}
+
+        # 初始化标志，_init_lock保证并发触发时只初始化一次
         self._initialized = False
+        self._init_lock = threading.Lock()
 
         # 加载执行历史
         self._load_execution_history()
@@ -323,27 +377,37 @@ class MainController:
             # 设置停止标志
             self._stop_event.set()
 
-            # 如果有正在执行的任务，标记为取消状态
-            with self._execution_lock:
-                if (
-                    self.current_execution
-                    and self.current_execution.status == ExecutionStatus.RUNNING
-                ):
-                    self.logger.info(
-                        f"正在取消执行: {self.current_execution.execution_id}"
-                    )
-                    self.current_execution.status = ExecutionStatus.CANCELLED
+            # 信号处理函数在主线程中断处执行，主线程此时可能正持有执行锁或阻塞在其他调用中；
+            # 加锁、等待调度线程和清理资源交给独立线程完成，避免在处理函数中死锁
+            if self._shutdown_thread is None:
+                self._shutdown_thread = threading.Thread(
+                    target=self._graceful_shutdown, name="graceful-shutdown"
+                )
+                self._shutdown_thread.start()
 
-            # 停止调度器
-            self.stop_scheduler()
+        signal.signal(signal.SIGTERM, signal_handler)
+        signal.signal(signal.SIGINT, signal_handler)
 
-            # 清理资源
-            self.cleanup_resources()
+    def _graceful_shutdown(self) -> None:
+        """取消正在进行的执行、停止调度器并清理资源（在关闭线程中运行）"""
+        # 如果有正在执行的任务，标记为取消状态
+        with self._execution_lock:
+            if (
+                self.current_execution
+                and self.current_execution.status == ExecutionStatus.RUNNING
+            ):
+                self.logger.info(
+                    f"正在取消执行: {self.current_execution.execution_id}"
+                )
+                self.current_execution.status = ExecutionStatus.CANCELLED
 
-            self.logger.info("优雅关闭完成")
+        # 停止调度器
+        self.stop_scheduler()
 
-        signal.signal(signal.SIGTERM, signal_handler)
-        signal.signal(signal.SIGINT, signal_handler)
+        # 清理资源
+        self.cleanup_resources()
+
+        self.logger.info("优雅关闭完成")
 
     def initialize_system(self) -> bool:
         """
@@ -388,6 +452,7 @@ class MainController:
                 analysis_prompt_path=llm_config.analysis_prompt_path,
                 temperature=llm_config.temperature,
                 batch_size=llm_config.batch_size,
+                max_concurrent_batches=llm_config.max_concurrent_llm_batches,
                 cache_ttl_minutes=llm_config.cache_ttl_minutes,
                 cached_messages_hours=llm_config.cached_messages_hours,
                 mock_mode=False,
@@ -433,7 +498,7 @@ class MainController:
                     self.logger.info("Telegram命令处理器初始化完成")
                 except Exception as e:
                     self.logger.error(f"Telegram命令处理器初始化失败: {str(e)}")
-                    self.logger.debug(traceback.format_exc())
+                    self.logger.debug("异常堆栈", exc_info=True)
                     # 不设置command_handler，让它保持为None
             else:
                 if not telegram_command_config.enabled:
@@ -449,9 +514,26 @@ class MainController:
 
         except Exception as e:
             self.logger.error(f"系统初始化失败: {str(e)}")
-            self.logger.debug(traceback.format_exc())
+            self.logger.debug("异常堆栈", exc_info=True)
             return False
 
+    def _ensure_initialized(self) -> bool:
+        """
+        确保系统已初始化
+
+        手动与定时触发可能同时到达，加锁后再次检查，避免重复创建分析器和发送器。
+
+        Returns:
+            系统是否已初始化
+        """
+        if self._initialized:
+            return True
+
+        with self._init_lock:
+            if self._initialized:
+                return True
+            return self.initialize_system()
+
     def initialize_ingestion_system(self) -> bool:
         try:
             self.logger.info("开始初始化摄取服务组件（ingestion-only）")
@@ -469,7 +551,7 @@ class MainController:
             return True
         except Exception as e:
             self.logger.error(f"摄取服务初始化失败: {str(e)}")
-            self.logger.debug(traceback.format_exc())
+            self.logger.debug("异常堆栈", exc_info=True)
             return False
 
     def _initialize_core_system_components(self) -> Dict[str, Any]:
@@ -478,6 +560,8 @@ class MainController:
         config_data = self.config_manager.load_config()
         self.logger.info("配置管理器初始化完成")
 
+        self._max_concurrent_crawlers = self.config_manager.get_max_concurrent_crawlers()
+
         # 初始化数据管理器
         storage_config = self.config_manager.get_storage_config()
         self.storage_config = storage_config  # 保存为实例变量供后续使用
@@ -727,13 +811,19 @@ class MainController:
         """
         获取Telegram命令配置
 
+        解析结果按配置字典缓存，配置重新加载（config_data被替换）后重新解析。
+
         Returns:
             TelegramCommandConfig对象
         """
         config_data = self.config_manager.config_data
+        cached = self._telegram_command_config_cache
+        if cached is not None and cached[0] is config_data:
+            return cached[1]
+
         telegram_commands = config_data.get("telegram_commands", {})
 
-        return TelegramCommandConfig(
+        command_config = TelegramCommandConfig(
             enabled=telegram_commands.get("enabled", False),
             authorized_users=telegram_commands.get("authorized_users", []),
             execution_timeout_minutes=telegram_commands.get(
@@ -747,6 +837,8 @@ class MainController:
                 {"max_commands_per_hour": 10, "cooldown_seconds": 1},
             ),
         )
+        self._telegram_command_config_cache = (config_data, command_config)
+        return command_config
 
     def validate_prerequisites(
         self, validation_scope: Optional[str] = None
@@ -885,10 +977,40 @@ class MainController:
             validation_result["errors"].append(f"验证过程中发生异常: {str(e)}")
             validation_result["valid"] = False
             self.logger.error(f"前提条件验证异常: {str(e)}")
-            self.logger.debug(traceback.format_exc())
+            self.logger.debug("异常堆栈", exc_info=True)
 
         return validation_result
 
+    def _check_prerequisites(self, validation_scope: str) -> Dict[str, Any]:
+        """
+        执行前验证前提条件，配置文件未修改时复用上次通过的结果
+
+        Args:
+            validation_scope: 验证范围
+
+        Returns:
+            验证结果字典
+        """
+        try:
+            config_mtime = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            config_mtime = None
+
+        if (
+            config_mtime is not None
+            and self._validated_prerequisites.get(validation_scope) == config_mtime
+        ):
+            return {"valid": True, "errors": [], "warnings": []}
+
+        validation_result = self.validate_prerequisites(validation_scope=validation_scope)
+        if validation_result["valid"] and config_mtime is not None:
+            self._validated_prerequisites[validation_scope] = config_mtime
+        return validation_result
+
+    def invalidate_prerequisites(self) -> None:
+        """清空前提条件验证缓存，下次执行时重新验证"""
+        self._validated_prerequisites.clear()
+
     def _required_llm_provider_env_vars(self, llm_config: Any) -> List[str]:
         providers = {
             llm_config.model.provider,
@@ -946,6 +1068,8 @@ class MainController:
         """
         execution_id = f"exec_{int(time.time())}"
         start_time = datetime.now()
+        # 墙上时间仅用于展示，耗时使用单调时钟计算，不受系统时间调整影响
+        start_counter = time.perf_counter()
 
         # 创建执行信息
         execution_info = ExecutionInfo(
@@ -960,23 +1084,26 @@ class MainController:
             error_message=None,
         )
 
+        # 检查并占用执行状态必须在同一临界区内完成，避免并发触发同时通过检查
         with self._execution_lock:
+            if (
+                self.current_execution
+                and self.current_execution.status == ExecutionStatus.RUNNING
+            ):
+                return self._build_rejected_result(trigger_user, trigger_chat_id)
             self.current_execution = execution_info
 
         try:
-            self.logger.info(f"开始执行工作流 {execution_id}")
+            self.logger.info("开始执行工作流 %s", execution_id)
 
             # 验证前提条件
-            validation_result = self.validate_prerequisites(
-                validation_scope="analysis-service"
-            )
+            validation_result = self._check_prerequisites("analysis-service")
             if not validation_result["valid"]:
                 raise Exception(f"前提条件验证失败: {validation_result['errors']}")
 
             # 初始化系统（如果尚未初始化）
-            if not self._initialized:
-                if not self.initialize_system():
-                    raise Exception("系统初始化失败")
+            if not self._ensure_initialized():
+                raise Exception("系统初始化失败")
 
             # 执行完整工作流
             result = self.coordinate_workflow(
@@ -985,7 +1112,7 @@ class MainController:
 
             # 更新执行状态
             end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_counter
 
             execution_result = ExecutionResult(
                 execution_id=execution_id,
@@ -1028,17 +1155,17 @@ class MainController:
             )
 
             self.logger.info(
-                f"工作流执行完成 {execution_id}: {'成功' if result['success'] else '失败'}"
+                "工作流执行完成 %s: %s", execution_id, "成功" if result["success"] else "失败"
             )
             return execution_result
 
         except Exception as e:
             end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_counter
 
             error_msg = str(e)
             self.logger.error(f"工作流执行失败 {execution_id}: {error_msg}")
-            self.logger.debug(traceback.format_exc())
+            self.logger.debug("异常堆栈", exc_info=True)
 
             # 更新执行状态
             with self._execution_lock:
@@ -1098,8 +1225,9 @@ class MainController:
         }
 
         try:
-            # 使用配置管理器的getter方法获取时间窗口
-            time_window_hours = self.config_manager.get_time_window_hours()
+            # 本周期使用的配置只读取一次
+            workflow_config = self._snapshot_workflow_config()
+            time_window_hours = workflow_config.time_window_hours
 
             # 阶段1: 数据爬取
             self._update_execution_progress(0.1, "crawling")
@@ -1113,14 +1241,33 @@ class MainController:
             content_items = crawl_result["content_items"]
             crawl_status = crawl_result["crawl_status"]
 
-            self.logger.info(f"数据爬取完成，获取到 {len(content_items)} 个内容项")
+            self.logger.info("数据爬取完成，获取到 %s 个内容项", len(content_items))
+
+            # 定时任务在本轮没有写入新内容、且窗口内内容数与上次分析时相同时，
+            # 待分析内容与上次完全一致，跳过分析、报告和发送阶段
+            analyzed_window = None
+            if not is_manual and self.content_repository is not None:
+                analyzed_window = (
+                    time_window_hours,
+                    self.content_repository.count_recent_content_items(
+                        time_window_hours=time_window_hours
+                    ),
+                )
+                if (
+                    not crawl_result.get("items_new")
+                    and analyzed_window == self._last_analyzed_window
+                ):
+                    self.logger.info("本轮没有新内容且与上次分析的内容一致，跳过分析")
+                    self._update_execution_progress(1.0, "completed")
+                    result["success"] = True
+                    return result
 
             # 阶段2: 内容分析
             self._update_execution_progress(0.4, "analyzing")
             self.logger.info("开始内容分析阶段")
 
             analysis_result = self._execute_analysis_stage(
-                content_items, is_manual=is_manual
+                content_items, is_manual=is_manual, workflow_config=workflow_config
             )
             if not analysis_result["success"]:
                 result["errors"].extend(analysis_result["errors"])
@@ -1129,7 +1276,7 @@ class MainController:
             categorized_items = analysis_result["categorized_items"]
             analysis_results = analysis_result["analysis_results"]
 
-            self.logger.info(f"内容分析完成，分类结果: {len(categorized_items)} 个类别")
+            self.logger.info("内容分析完成，分类结果: %s 个类别", len(categorized_items))
 
             # 阶段3: 报告生成
             self._update_execution_progress(0.7, "reporting")
@@ -1167,7 +1314,9 @@ class MainController:
                 }
             )
 
-            if not send_result["success"]:
+            if send_result["success"]:
+                self._last_analyzed_window = analyzed_window
+            else:
                 result["errors"].extend(send_result["errors"])
 
             self._update_execution_progress(1.0, "completed")
@@ -1180,6 +1329,19 @@ class MainController:
 
         return result
 
+    def _snapshot_workflow_config(self) -> WorkflowConfig:
+        """
+        读取本周期工作流使用的配置
+
+        Returns:
+            不可变的配置快照
+        """
+        llm_config = self.config_manager.config_data.get("llm_config", {})
+        return WorkflowConfig(
+            time_window_hours=self.config_manager.get_time_window_hours(),
+            min_weight_score=llm_config.get("min_weight_score", 50),
+        )
+
     def _execute_crawling_stage(self, time_window_hours: int) -> Dict[str, Any]:
         """执行数据爬取阶段"""
         result = {
@@ -1190,18 +1352,25 @@ class MainController:
             "errors": [],
         }
 
+        # 本阶段创建的全部爬取器实例，阶段结束时统一清理
+        crawlers: List[Any] = []
+
         try:
             factory = get_data_source_factory()
             all_content_items = []
             rss_results = []
-            x_results = []
+            x_results: List[CrawlResult] = []
 
-            # 爬取RSS源
+            # 爬取RSS源（并发执行，结果按源顺序处理）
             rss_sources = self.config_manager.get_rss_sources()
-            for rss_source in rss_sources:
-                try:
-                    crawler = factory.create_source("rss", time_window_hours)
-                    items = crawler.crawl(rss_source.to_dict())
+            if rss_sources:
+                rss_outcomes = self._crawl_http_sources(
+                    factory, "rss", rss_sources, time_window_hours, crawlers
+                )
+            else:
+                rss_outcomes = []
+            for rss_source, items, error in rss_outcomes:
+                if error is None:
                     all_content_items.extend(items)
 
                     rss_results.append(
@@ -1213,65 +1382,47 @@ class MainController:
                         )
                     )
 
-                except Exception as e:
-                    error_msg = f"RSS源 {rss_source.name} 爬取失败: {str(e)}"
+                else:
+                    error_msg = f"RSS源 {rss_source.name} 爬取失败: {str(error)}"
                     self.logger.warning(error_msg)
                     rss_results.append(
                         CrawlResult(
                             source_name=rss_source.name,
                             status="error",
                             item_count=0,
-                            error_message=str(e),
+                            error_message=str(error),
                         )
                     )
 
-            # 爬取X源
+            # 爬取X源（bird工具有速率限制，由X爬取器统一批量调度）
             x_sources = self.config_manager.get_x_sources()
             x_auth = self.config_manager.get_x_auth_credentials()
 
             if x_sources and x_auth["X_CT0"] and x_auth["X_AUTH_TOKEN"]:
                 bird_config = self.config_manager.get_bird_config()
+                x_crawler = factory.create_source(
+                    "x",
+                    time_window_hours,
+                    bird_config=bird_config,
+                    data_manager=self.data_manager,
+                )
+                crawlers.append(x_crawler)
 
-                for x_source in x_sources:
-                    try:
-                        crawler = factory.create_source(
-                            "x",
-                            time_window_hours,
-                            bird_config=bird_config,
-                            data_manager=self.data_manager,
-                        )
-                        items = crawler.crawl(x_source.to_dict())
-                        all_content_items.extend(items)
-
-                        x_results.append(
-                            CrawlResult(
-                                source_name=x_source.name,
-                                status="success",
-                                item_count=len(items),
-                                error_message=None,
-                            )
-                        )
-
-                    except Exception as e:
-                        error_msg = f"X源 {x_source.name} 爬取失败: {str(e)}"
-                        self.logger.warning(error_msg)
-                        x_results.append(
-                            CrawlResult(
-                                source_name=x_source.name,
-                                status="error",
-                                item_count=0,
-                                error_message=str(e),
-                            )
-                        )
+                x_items, x_results = self._crawl_x_sources(x_crawler, x_sources)
+                all_content_items.extend(x_items)
 
             rest_api_sources = self.config_manager.get_rest_api_sources()
-            for rest_api_source in rest_api_sources:
-                try:
-                    crawler = factory.create_source("rest_api", time_window_hours)
-                    items = crawler.crawl(rest_api_source.to_dict())
+            if rest_api_sources:
+                rest_api_outcomes = self._crawl_http_sources(
+                    factory, "rest_api", rest_api_sources, time_window_hours, crawlers
+                )
+            else:
+                rest_api_outcomes = []
+            for rest_api_source, items, error in rest_api_outcomes:
+                if error is None:
                     all_content_items.extend(items)
-                except Exception as e:
-                    error_msg = f"REST API源 {rest_api_source.name} 爬取失败: {str(e)}"
+                else:
+                    error_msg = f"REST API源 {rest_api_source.name} 爬取失败: {str(error)}"
                     self.logger.warning(error_msg)
 
             # 数据去重和存储
@@ -1280,8 +1431,12 @@ class MainController:
                 if self.content_repository is None:
                     raise ValueError("内容仓储未初始化")
                 added_count = self.content_repository.save_many(all_content_items)
-                self.content_repository.deduplicate()
-                self.logger.info(f"成功存储 {added_count} 个内容项")
+                # 只有本轮新写入的内容可能产生新的重复，去重范围限定在这些内容哈希内
+                if added_count:
+                    self.content_repository.deduplicate(
+                        {item.generate_content_hash() for item in all_content_items}
+                    )
+                self.logger.info("成功存储 %s 个内容项", added_count)
 
             # 创建爬取状态
             crawl_status = CrawlStatus(
@@ -1310,8 +1465,170 @@ class MainController:
             self.logger.error(error_msg)
             result["errors"].append(error_msg)
 
+        finally:
+            for crawler in crawlers:
+                try:
+                    crawler.cleanup()
+                except Exception as e:
+                    self.logger.warning(f"清理爬取器资源失败: {str(e)}")
+
         return result
 
+    def _crawl_x_sources(
+        self, x_crawler: Any, x_sources: List[Any]
+    ) -> Tuple[List[ContentItem], List[CrawlResult]]:
+        """
+        爬取全部X源
+
+        内置X爬取器通过一次批量调用抓取所有源（相同目标只抓取一次，
+        bird进程按令牌桶限速并发执行）；其他实现逐个源调用crawl。
+
+        Args:
+            x_crawler: X数据源实例
+            x_sources: X源配置列表
+
+        Returns:
+            (内容项列表, 与x_sources一一对应的爬取结果列表)
+        """
+        x_items: List[ContentItem]
+        x_results: List[CrawlResult]
+        if isinstance(x_crawler, XCrawlerAdapter):
+            try:
+                x_items, x_results = x_crawler.crawl_all_sources_with_items(
+                    [x_source.to_dict() for x_source in x_sources]
+                )
+            except Exception as e:
+                self.logger.warning(f"X源批量爬取失败: {str(e)}")
+                x_items = []
+                x_results = [
+                    CrawlResult(
+                        source_name=x_source.name,
+                        status="error",
+                        item_count=0,
+                        error_message=str(e),
+                    )
+                    for x_source in x_sources
+                ]
+            for crawl_result in x_results:
+                if crawl_result.status != "success":
+                    self.logger.warning(
+                        f"X源 {crawl_result.source_name} 爬取失败: {crawl_result.error_message}"
+                    )
+            return x_items, x_results
+
+        x_items = []
+        x_results = []
+        for x_source in x_sources:
+            try:
+                items = x_crawler.crawl(x_source.to_dict())
+                x_items.extend(items)
+
+                x_results.append(
+                    CrawlResult(
+                        source_name=x_source.name,
+                        status="success",
+                        item_count=len(items),
+                        error_message=None,
+                    )
+                )
+
+            except Exception as e:
+                error_msg = f"X源 {x_source.name} 爬取失败: {str(e)}"
+                self.logger.warning(error_msg)
+                x_results.append(
+                    CrawlResult(
+                        source_name=x_source.name,
+                        status="error",
+                        item_count=0,
+                        error_message=str(e),
+                    )
+                )
+        return x_items, x_results
+
+    def _crawl_http_sources(
+        self,
+        factory: Any,
+        source_type: str,
+        sources: List[Any],
+        time_window_hours: int,
+        crawlers: List[Any],
+    ) -> List[Tuple[Any, List[ContentItem], Optional[Exception]]]:
+        """
+        爬取一组同类型的HTTP数据源（RSS、REST API）
+
+        爬取器持有的HTTP会话不保证线程安全，每个工作线程各自创建一个爬取器实例，
+        同一线程内的源复用该实例。创建的实例都会加入crawlers，由调用方统一清理。
+
+        Args:
+            factory: 数据源工厂
+            source_type: 数据源类型
+            sources: 数据源配置列表
+            time_window_hours: 时间窗口（小时）
+            crawlers: 收集已创建爬取器的列表
+
+        Returns:
+            与sources一一对应的 (源, 内容项列表, 异常) 列表，成功时异常为None，
+            失败时内容项列表为空
+        """
+        thread_crawlers = threading.local()
+        crawlers_lock = threading.Lock()
+
+        def crawl_source(source: Any) -> List[ContentItem]:
+            crawler = getattr(thread_crawlers, "crawler", None)
+            if crawler is None:
+                crawler = factory.create_source(source_type, time_window_hours)
+                thread_crawlers.crawler = crawler
+                with crawlers_lock:
+                    crawlers.append(crawler)
+            items: List[ContentItem] = crawler.crawl(source.to_dict())
+            return items
+
+        return self._crawl_sources_concurrently(sources, crawl_source)
+
+    def _crawl_sources_concurrently(
+        self,
+        sources: List[Any],
+        crawl_source: Callable[[Any], List[ContentItem]],
+    ) -> List[Tuple[Any, List[ContentItem], Optional[Exception]]]:
+        """
+        并发爬取一组数据源
+
+        每个源的异常单独捕获，单个源失败不影响其他源。
+
+        Args:
+            sources: 数据源配置列表
+            crawl_source: 爬取单个数据源并返回内容项的函数
+
+        Returns:
+            与sources一一对应的 (源, 内容项列表, 异常) 列表，成功时异常为None，
+            失败时内容项列表为空
+        """
+
+        def run(source: Any) -> Tuple[Any, List[ContentItem], Optional[Exception]]:
+            try:
+                return source, crawl_source(source), None
+            except Exception as e:
+                return source, [], e
+
+        if min(self._max_concurrent_crawlers, len(sources)) <= 1:
+            return [run(source) for source in sources]
+
+        return list(self._get_crawl_pool().map(run, sources))
+
+    def _get_crawl_pool(self) -> ThreadPoolExecutor:
+        """
+        获取爬取共用的线程池，复用线程避免每个阶段重复创建和销毁
+
+        Returns:
+            最多_max_concurrent_crawlers个线程的线程池
+        """
+        with self._crawl_pool_lock:
+            if self._crawl_pool is None:
+                self._crawl_pool = ThreadPoolExecutor(
+                    max_workers=self._max_concurrent_crawlers, thread_name_prefix="crawl"
+                )
+            return self._crawl_pool
+
     def _execute_analysis_stage(
         self,
         newly_crawled_items: List[ContentItem],
@@ -1319,6 +1636,7 @@ class MainController:
         analysis_time_window_hours: Optional[int] = None,
         preloaded_content_items: Optional[List[ContentItem]] = None,
         manual_historical_titles: Optional[List[str]] = None,
+        workflow_config: Optional[WorkflowConfig] = None,
     ) -> Dict[str, Any]:
         """
         执行内容分析阶段
@@ -1331,6 +1649,7 @@ class MainController:
             is_manual: 是否为手动触发（手动触发时不包含 Outdated News）
             analysis_time_window_hours: 分析时间窗口（小时），传入时优先于配置
             preloaded_content_items: 预加载的待分析内容项（传入时不再重新查询数据库）
+            workflow_config: 本周期的配置快照，未传入时从配置管理器读取
 
         Returns:
             分析结果字典
@@ -1343,16 +1662,19 @@ class MainController:
         }
 
         try:
+            if workflow_config is None:
+                workflow_config = self._snapshot_workflow_config()
+
             if preloaded_content_items is not None:
                 all_content_items = preloaded_content_items
                 self.logger.info(
-                    f"使用预加载内容项进行分析，共 {len(all_content_items)} 个"
+                    "使用预加载内容项进行分析，共 %s 个", len(all_content_items)
                 )
             else:
                 time_window_hours = (
                     analysis_time_window_hours
                     if analysis_time_window_hours is not None
-                    else self.config_manager.get_time_window_hours()
+                    else workflow_config.time_window_hours
                 )
 
                 # 获取时间窗口内的所有内容项（包括之前爬取的和刚爬取的）
@@ -1363,10 +1685,12 @@ class MainController:
                 )
 
             self.logger.info(
-                f"从数据库获取到时间窗口内的 {len(all_content_items)} 个内容项进行分析"
+                "从数据库获取到时间窗口内的 %s 个内容项进行分析", len(all_content_items)
             )
             self.logger.info(
-                f"其中本次新爬取 {len(newly_crawled_items)} 个，历史数据 {len(all_content_items) - len(newly_crawled_items)} 个"
+                "其中本次新爬取 %s 个，历史数据 %s 个",
+                len(newly_crawled_items),
+                len(all_content_items) - len(newly_crawled_items),
             )
 
             if not all_content_items:
@@ -1374,9 +1698,7 @@ class MainController:
                 result["success"] = True
                 return result
 
-            # 获取最小权重阈值配置
-            llm_config = self.config_manager.config_data.get("llm_config", {})
-            min_weight_score = llm_config.get("min_weight_score", 50)
+            min_weight_score = workflow_config.min_weight_score
 
             # 批量分析内容（仅在定时任务时包含 Outdated News）
             is_scheduled = not is_manual
@@ -1392,7 +1714,7 @@ class MainController:
             )
 
             # 分类内容 - 注意这里存储的是 StructuredAnalysisResult 而不是 ContentItem
-            categorized_items = {}
+            categorized_items: Dict[str, List[Any]] = defaultdict(list)
             analysis_dict = {}
 
             for item, analysis in zip(all_content_items, analysis_results):
@@ -1400,19 +1722,15 @@ class MainController:
                 if analysis.weight_score < min_weight_score:
                     continue
 
-                category = analysis.category
-
-                if category not in categorized_items:
-                    categorized_items[category] = []
-
                 # 存储 StructuredAnalysisResult 而不是 ContentItem
-                categorized_items[category].append(analysis)
+                categorized_items[analysis.category].append(analysis)
                 analysis_dict[item.id] = analysis
 
             result.update(
                 {
                     "success": True,
-                    "categorized_items": categorized_items,
+                    # 转回普通字典，避免下游读取不存在的分类时意外插入空列表
+                    "categorized_items": dict(categorized_items),
                     "analysis_results": analysis_dict,
                 }
             )
@@ -1484,61 +1802,67 @@ class MainController:
             发送结果字典
         """
         result = {"success": False, "errors": []}
+        # 已尝试过本地备份时，异常处理中不再重复写入
+        backup_attempted = False
 
         try:
             if not self.telegram_sender:
                 self.logger.warning("Telegram发送器未配置，跳过报告发送")
                 # 保存本地备份
+                backup_attempted = True
                 backup_path = self._save_report_backup(report_content)
-                self.logger.info(f"报告已保存到本地: {backup_path}")
+                self.logger.info("报告已保存到本地: %s", backup_path)
                 result["success"] = True
                 return result
 
             # 确定发送目标
             if target_chat_id:
                 # 用户触发的报告，发送到触发命令的聊天窗口
-                self.logger.info(f"发送报告到用户触发的聊天窗口: {target_chat_id}")
+                self.logger.info("发送报告到用户触发的聊天窗口: %s", target_chat_id)
                 send_result = self.telegram_sender.send_report_to_chat(
                     report_content, target_chat_id
                 )
             else:
                 # 定时任务报告，发送到配置的频道
                 self.logger.info(
-                    f"发送报告到配置的频道: {self.telegram_sender.config.channel_id}"
+                    "发送报告到配置的频道: %s", self.telegram_sender.config.channel_id
                 )
                 send_result = self.telegram_sender.send_report(report_content)
 
             if send_result.success:
-                self.logger.info(f"报告发送成功，消息ID: {send_result.message_id}")
+                self.logger.info("报告发送成功，消息ID: %s", send_result.message_id)
                 result["success"] = True
 
                 # 需求17.9: 报告发送成功后缓存已发送的消息
                 # 手动触发时不缓存，避免影响定时任务的去重逻辑
                 if should_cache and self.cache_repository and categorized_items:
                     try:
-                        messages_to_cache = []
-                        for category, items in categorized_items.items():
-                            for item in items:
-                                # item 是 StructuredAnalysisResult 对象
-                                messages_to_cache.append(
-                                    {
-                                        "title": item.title,
-                                        "body": item.body,
-                                        "category": item.category,
-                                        "time": item.time,
-                                        "sent_at": datetime.now().isoformat(),
-                                    }
-                                )
+                        # 同一批消息共用一个发送时间
+                        sent_at = datetime.now().isoformat()
+                        # item 是 StructuredAnalysisResult 对象
+                        messages_to_cache = [
+                            {
+                                "title": item.title,
+                                "body": item.body,
+                                "category": item.category,
+                                "time": item.time,
+                                "sent_at": sent_at,
+                            }
+                            for items in categorized_items.values()
+                            for item in items
+                        ]
 
                         if messages_to_cache:
                             cached_count = self.cache_repository.cache_sent_messages(
                                 messages_to_cache
                             )
-                            self.logger.info(f"成功缓存 {cached_count} 条已发送消息")
+                            self.logger.info("成功缓存 %s 条已发送消息", cached_count)
 
                             # 需求17.14: 实现缓存统计和监控
-                            cache_stats = self.cache_repository.get_cache_statistics()
-                            self.logger.info(f"缓存统计: {cache_stats}")
+                            # 统计需要查询数据库，只在INFO日志会输出时才获取
+                            if self.logger.isEnabledFor(logging.INFO):
+                                cache_stats = self.cache_repository.get_cache_statistics()
+                                self.logger.info("缓存统计: %s", cache_stats)
                     except Exception as cache_error:
                         # 需求17.15: 缓存失败不影响主流程
                         self.logger.warning(f"缓存已发送消息失败: {str(cache_error)}")
@@ -1550,8 +1874,9 @@ class MainController:
                 result["errors"].append(error_msg)
 
                 # 保存本地备份
+                backup_attempted = True
                 backup_path = self._save_report_backup(report_content)
-                self.logger.info(f"报告已保存到本地备份: {backup_path}")
+                self.logger.info("报告已保存到本地备份: %s", backup_path)
 
         except Exception as e:
             error_msg = f"报告发送阶段失败: {str(e)}"
@@ -1559,30 +1884,34 @@ class MainController:
             result["errors"].append(error_msg)
 
             # 保存本地备份
-            try:
-                backup_path = self._save_report_backup(report_content)
-                self.logger.info(f"报告已保存到本地备份: {backup_path}")
-            except Exception as backup_error:
-                self.logger.error(f"保存本地备份失败: {str(backup_error)}")
+            if not backup_attempted:
+                try:
+                    backup_path = self._save_report_backup(report_content)
+                    self.logger.info("报告已保存到本地备份: %s", backup_path)
+                except Exception as backup_error:
+                    self.logger.error(f"保存本地备份失败: {str(backup_error)}")
 
         return result
 
     def _save_report_backup(self, report_content: str) -> str:
         """保存报告备份"""
-        import os
-        from datetime import datetime
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime(_BACKUP_TS_FMT)
         filename = f"crypto_news_report_{timestamp}.md"
 
-        # 确保备份目录存在
+        # 确保备份目录存在，创建成功后不再重复检查
         backup_dir = "logs"
-        os.makedirs(backup_dir, exist_ok=True)
+        if not self._backup_dir_ready:
+            os.makedirs(backup_dir, exist_ok=True)
+            self._backup_dir_ready = True
 
         backup_path = os.path.join(backup_dir, filename)
 
-        with open(backup_path, "w", encoding="utf-8") as f:
-            f.write(report_content)
+        # 一次编码后整体写入临时文件，再原子替换到目标路径，
+        # 进程中途被终止时不会留下写了一半的备份
+        tmp_path = backup_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(report_content.encode("utf-8"))
+        os.replace(tmp_path, backup_path)
 
         return backup_path
 
@@ -1647,43 +1976,50 @@ class MainController:
                 f"初始化上次调度时间为当前时间: {self._last_scheduled_time.strftime('%Y-%m-%d %H:%M:%S')}"
             )
 
+        # 上次调度时间可能来自执行历史（墙上时钟），启动时换算一次为单调时钟，
+        # 之后的调度完全基于单调时钟推进
+        self._last_scheduled_monotonic = time.monotonic() - (
+            datetime.now() - self._last_scheduled_time
+        ).total_seconds()
+
         consecutive_failures = 0
         max_consecutive_failures = 3
+        interval = timedelta(seconds=interval_seconds)
 
         while not self._stop_event.is_set():
             try:
-                # 计算下次执行时间（基于上次调度时间 + 间隔）
-                next_execution = self._last_scheduled_time + timedelta(
-                    seconds=interval_seconds
-                )
-
-                # 计算需要等待的时间
-                now = datetime.now()
-                wait_seconds = (next_execution - now).total_seconds()
+                # 计算下次执行的截止时间（基于上次调度时间 + 间隔）
+                deadline = self._last_scheduled_monotonic + interval_seconds
+                wait_seconds = deadline - time.monotonic()
+                # 墙上时间只用于日志展示
+                next_execution = self._last_scheduled_time + interval
 
                 # 如果下次执行时间已经过了，立即执行
                 if wait_seconds <= 0:
                     self.logger.info(
-                        f"下次执行时间 {next_execution.strftime('%Y-%m-%d %H:%M:%S')} 已过，立即执行"
+                        "下次执行时间 %s 已过，立即执行",
+                        next_execution.strftime("%Y-%m-%d %H:%M:%S"),
                     )
-                    wait_seconds = 0
                 else:
                     self.logger.info(
-                        f"下次执行时间: {next_execution.strftime('%Y-%m-%d %H:%M:%S')}，等待 {wait_seconds:.0f} 秒"
+                        "下次执行时间: %s，等待 %.0f 秒",
+                        next_execution.strftime("%Y-%m-%d %H:%M:%S"),
+                        wait_seconds,
                     )
 
-                # 等待到下次执行时间或停止信号
+                # 等待到截止时间或停止信号
                 if wait_seconds > 0 and self._stop_event.wait(wait_seconds):
                     break  # 收到停止信号
 
-                # 检查是否有其他执行正在进行
-                with self._execution_lock:
-                    if (
-                        self.current_execution
-                        and self.current_execution.status == ExecutionStatus.RUNNING
-                    ):
-                        self.logger.warning("上次执行仍在进行中，跳过本次调度")
-                        continue
+                # 检查是否有其他执行正在进行（无锁读取，run_crawl_only 内部
+                # 仍会在锁内复核，这里只用于提前跳过）
+                if self.is_execution_running():
+                    self.logger.warning("上次执行仍在进行中，跳过本次调度")
+                    # 跳过的调度也推进到下一个周期，之后阻塞在停止事件上等待，
+                    # 否则下次执行时间一直已过，循环会空转
+                    self._last_scheduled_monotonic = deadline
+                    self._last_scheduled_time = next_execution
+                    continue
 
                 # 执行工作流
                 self.logger.info("定时调度触发执行")
@@ -1691,6 +2027,7 @@ class MainController:
 
                 # 更新上次调度时间为本次调度的理论时间（而不是实际执行时间）
                 # 这样可以避免执行耗时影响下次调度时间
+                self._last_scheduled_monotonic = deadline
                 self._last_scheduled_time = next_execution
 
                 if result.success:
@@ -1720,7 +2057,7 @@ class MainController:
                 self.logger.error(
                     f"调度器循环异常 (连续失败: {consecutive_failures}/{max_consecutive_failures}): {str(e)}"
                 )
-                self.logger.debug(traceback.format_exc())
+                self.logger.debug("异常堆栈", exc_info=True)
 
                 # 如果连续失败次数过多，增加等待时间
                 if consecutive_failures >= max_consecutive_failures:
@@ -1749,24 +2086,32 @@ class MainController:
 
     def get_execution_status(self) -> Optional[ExecutionInfo]:
         """获取当前执行状态"""
-        with self._execution_lock:
-            return self.current_execution
+        # 单个引用读取是原子的，只读查询无需与执行线程争用锁
+        return self.current_execution
 
     def get_execution_history(self, limit: int = 10) -> List[ExecutionResult]:
         """获取执行历史"""
-        return self.execution_history[-limit:] if limit > 0 else self.execution_history
+        return self._recent_execution_history(limit)
+
+    def _recent_execution_history(self, limit: int) -> List[ExecutionResult]:
+        """获取最近limit条执行历史（按时间顺序），limit<=0时返回全部"""
+        if limit <= 0 or limit >= len(self.execution_history):
+            return list(self.execution_history)
+        # 从尾部反向取limit条，避免islice从deque头部逐个跳过前面的记录
+        recent = list(islice(reversed(self.execution_history), limit))
+        recent.reverse()
+        return recent
 
     def _load_execution_history(self) -> None:
         """从文件加载执行历史"""
         try:
-            import os
-
             if os.path.exists(self._history_file):
                 with open(self._history_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
-                    self.execution_history = [
-                        ExecutionResult.from_dict(item) for item in data
-                    ]
+                    self.execution_history = deque(
+                        (ExecutionResult.from_dict(item) for item in data),
+                        maxlen=self._history_max,
+                    )
                     self.logger.info(
                         f"已加载 {len(self.execution_history)} 条执行历史记录"
                     )
@@ -1774,33 +2119,36 @@ class MainController:
                 self.logger.info("执行历史文件不存在，从空历史开始")
         except Exception as e:
             self.logger.error(f"加载执行历史失败: {e}")
-            self.execution_history = []
+            self.execution_history = deque(maxlen=self._history_max)
 
     def _save_execution_history(self) -> None:
         """保存执行历史到文件（保留最近100条）"""
         try:
-            import os
-
             os.makedirs(os.path.dirname(self._history_file), exist_ok=True)
 
             # 只保留最近100条记录
-            history_to_save = self.execution_history[-100:]
+            history_to_save = self._recent_execution_history(100)
             data = [item.to_dict() for item in history_to_save]
 
-            with open(self._history_file, "w", encoding="utf-8") as f:
+            # 先写临时文件再原子替换，避免启动时加载到不完整的历史文件
+            tmp_path = self._history_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self._history_file)
 
             self.logger.debug(f"已保存 {len(history_to_save)} 条执行历史记录")
         except Exception as e:
             self.logger.error(f"保存执行历史失败: {e}")
 
     def is_execution_running(self) -> bool:
-        """检查是否有执行正在进行"""
-        with self._execution_lock:
-            return (
-                self.current_execution is not None
-                and self.current_execution.status == ExecutionStatus.RUNNING
-            )
+        """
+        检查是否有执行正在进行
+
+        只读取一次 current_execution 引用（单个引用赋值是原子的），无需加锁；
+        执行状态的变更仍在 _execution_lock 内完成。
+        """
+        current = self.current_execution
+        return current is not None and current.status == ExecutionStatus.RUNNING
 
     def get_next_execution_time(self) -> Optional[datetime]:
         """获取下次执行时间"""
@@ -1810,6 +2158,11 @@ class MainController:
         # 从配置获取间隔（使用配置管理器的getter方法）
         interval_seconds = self.config_manager.get_execution_interval()
 
+        # 调度器已按单调时钟推进时，只在这里换算为墙上时间
+        if self._last_scheduled_monotonic is not None:
+            remaining = self._last_scheduled_monotonic + interval_seconds - time.monotonic()
+            return datetime.now() + timedelta(seconds=remaining)
+
         # 如果有上次调度时间，使用它来计算下次执行时间
         if self._last_scheduled_time:
             return self._last_scheduled_time + timedelta(seconds=interval_seconds)
@@ -1836,13 +2189,14 @@ class MainController:
             "timestamp": datetime.now().isoformat(),
         }
 
+        # 只序列化一次，日志和标准输出共用同一字符串
+        payload = json.dumps(log_entry, ensure_ascii=False)
+
         # 输出到标准输出（容器日志）
-        self.logger.info(f"执行周期记录: {json.dumps(log_entry, ensure_ascii=False)}")
+        self.logger.info("执行周期记录: %s", payload)
 
         # 同时输出到标准输出以确保容器日志可见
-        print(
-            f"[EXECUTION_CYCLE] {json.dumps(log_entry, ensure_ascii=False)}", flush=True
-        )
+        print(f"[EXECUTION_CYCLE] {payload}", flush=True)
 
     def cleanup_resources(self) -> None:
         """清理资源"""
@@ -1852,6 +2206,12 @@ class MainController:
             # 停止调度器
             self.stop_scheduler()
 
+            # 关闭爬取线程池
+            with self._crawl_pool_lock:
+                crawl_pool, self._crawl_pool = self._crawl_pool, None
+            if crawl_pool is not None:
+                crawl_pool.shutdown(wait=True, cancel_futures=True)
+
             # 清理数据管理器
             if self.data_manager:
                 self.data_manager.close()
@@ -1866,21 +2226,19 @@ class MainController:
             self.logger.error(f"资源清理失败: {str(e)}")
 
     def _deep_update(self, base_dict: Dict, update_dict: Dict) -> None:
-        """深度更新字典"""
-        for key, value in update_dict.items():
-            if (
-                key in base_dict
-                and isinstance(base_dict[key], dict)
-                and isinstance(value, dict)
-            ):
-                self._deep_update(base_dict[key], value)
-            else:
-                base_dict[key] = value
+        """深度更新字典（使用显式栈迭代，避免深层嵌套时的递归开销）"""
+        stack = [(base_dict, update_dict)]
+        while stack:
+            target, updates = stack.pop()
+            for key, value in updates.items():
+                current = target.get(key)
+                if isinstance(value, dict) and isinstance(current, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
 
     def get_system_status(self) -> Dict[str, Any]:
         """获取系统状态"""
-        from crypto_news_analyzer.utils.timezone_utils import format_datetime_utc8
-
         status = {
             "initialized": self._initialized,
             "scheduler_running": bool(
@@ -1936,32 +2294,31 @@ class MainController:
                 "use /news_analyze or HTTP /analyze instead"
             )
 
-        # 检查并发限制
-        with self._execution_lock:
-            if (
-                self.current_execution
-                and self.current_execution.status == ExecutionStatus.RUNNING
-            ):
-                # 返回一个表示拒绝的结果
-                return ExecutionResult(
-                    execution_id="rejected",
-                    success=False,
-                    start_time=datetime.now(),
-                    end_time=datetime.now(),
-                    duration_seconds=0.0,
-                    items_processed=0,
-                    categories_found={},
-                    errors=["系统正在执行任务，请稍后再试"],
-                    trigger_user=user_id,
-                    trigger_chat_id=chat_id,
-                    report_sent=False,
-                )
-
-        # 执行工作流
+        # 执行工作流（并发限制由run_once在锁内检查，已有执行时返回拒绝结果）
         return self.run_once(
             trigger_type="manual", trigger_user=user_id, trigger_chat_id=chat_id
         )
 
+    def _build_rejected_result(
+        self, trigger_user: Optional[str], trigger_chat_id: Optional[str]
+    ) -> ExecutionResult:
+        """构建因已有执行进行中而被拒绝的执行结果"""
+        # 开始与结束时间共用同一时刻
+        rejected_at = datetime.now()
+        return ExecutionResult(
+            execution_id="rejected",
+            success=False,
+            start_time=rejected_at,
+            end_time=rejected_at,
+            duration_seconds=0.0,
+            items_processed=0,
+            categories_found={},
+            errors=["系统正在执行任务，请稍后再试"],
+            trigger_user=trigger_user,
+            trigger_chat_id=trigger_chat_id,
+            report_sent=False,
+        )
+
     def get_current_execution_info(self) -> Optional[ExecutionInfo]:
         """
         获取当前执行信息
@@ -1971,8 +2328,7 @@ class MainController:
         Returns:
             当前执行信息，如果没有则返回None
         """
-        with self._execution_lock:
-            return self.current_execution
+        return self.current_execution
 
     def cancel_current_execution(self) -> bool:
         """
@@ -2040,6 +2396,8 @@ class MainController:
         """
         execution_id = f"crawl_{int(time.time())}"
         start_time = datetime.now()
+        # 墙上时间仅用于展示，耗时使用单调时钟计算，不受系统时间调整影响
+        start_counter = time.perf_counter()
         source_type = "scheduler"
         source_name = "crawl_only"
 
@@ -2062,16 +2420,13 @@ class MainController:
             self.logger.info(f"开始爬取阶段 {execution_id}")
 
             # 验证前提条件
-            validation_result = self.validate_prerequisites(
-                validation_scope="ingestion"
-            )
+            validation_result = self._check_prerequisites("ingestion")
             if not validation_result["valid"]:
                 raise Exception(f"前提条件验证失败: {validation_result['errors']}")
 
             # 初始化系统（如果尚未初始化）
-            if not self._initialized:
-                if not self.initialize_system():
-                    raise Exception("系统初始化失败")
+            if not self._ensure_initialized():
+                raise Exception("系统初始化失败")
 
             if self.ingestion_repository is None:
                 raise Exception("IngestionRepository未初始化")
@@ -2093,7 +2448,7 @@ class MainController:
                     self.ingestion_repository.save(skipped_job)
 
                     end_time = datetime.now()
-                    duration = (end_time - start_time).total_seconds()
+                    duration = time.perf_counter() - start_counter
                     self.logger.info(
                         "检测到内存中运行任务，已持久化跳过 ingestion 作业"
                     )
@@ -2161,7 +2516,7 @@ class MainController:
                         self.ingestion_repository.save(skipped_job)
 
                         end_time = datetime.now()
-                        duration = (end_time - start_time).total_seconds()
+                        duration = time.perf_counter() - start_counter
                         active_started = getattr(running_jobs[0], "started_at", "unknown")
                         self.logger.info(
                             "检测到运行中的持久化 ingestion 作业，跳过本次触发"
@@ -2230,7 +2585,7 @@ class MainController:
 
             # 更新执行状态
             end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_counter
 
             if crawl_result["success"]:
                 # 更新执行信息
@@ -2278,11 +2633,11 @@ class MainController:
 
         except Exception as e:
             end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_counter
 
             error_msg = str(e)
             self.logger.error(f"爬取阶段失败 {execution_id}: {error_msg}")
-            self.logger.debug(traceback.format_exc())
+            self.logger.debug("异常堆栈", exc_info=True)
 
             # 更新执行状态
             with self._execution_lock:
@@ -2391,8 +2746,6 @@ class MainController:
         Returns:
             包含report_content和execution_id的字典
         """
-        from datetime import timezone
-
         execution_id = f"analyze_{chat_id}_{int(time.time())}"
         result = {
             "success": False,
@@ -2411,9 +2764,8 @@ class MainController:
                 raise Exception("分析仓储未初始化")
 
             # 初始化系统（如果尚未初始化）
-            if not self._initialized:
-                if not self.initialize_system():
-                    raise Exception("系统初始化失败")
+            if not self._ensure_initialized():
+                raise Exception("系统初始化失败")
 
             since_time = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
 
@@ -2495,7 +2847,7 @@ class MainController:
         except Exception as e:
             error_msg = f"时间窗口分析失败: {str(e)}"
             self.logger.error(error_msg)
-            self.logger.debug(traceback.format_exc())
+            self.logger.debug("异常堆栈", exc_info=True)
             result["errors"].append(error_msg)
             if self.analysis_repository is not None:
                 self.analysis_repository.log_execution(
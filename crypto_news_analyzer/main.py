@@ -4,7 +4,7 @@ import argparse
 import logging
 import threading
 import signal
-from typing import Optional
+from typing import Any, Optional
 
 from .execution_coordinator import MainController
 from .semantic_search import run_embedding_backfill_once
@@ -115,55 +115,73 @@ def run_api_only_service(config_path: str = "./config.jsonc") -> int:
     Returns:
         退出状态码
     """
-    import uvicorn
-    from .api_server import create_api_server
-
     logger = logging.getLogger(__name__)
     logger.info("启动 API-only 服务模式（Railway analysis服务）")
 
-    try:
-        os.environ["CRYPTO_NEWS_RUNTIME_MODE"] = "api-only"
-        # start_services=False 确保不启动调度器和Telegram监听
-        app = create_api_server(config_path, start_services=False)
+    # start_services=False 确保不启动调度器和Telegram监听
+    return _serve_api_app(
+        config_path,
+        runtime_mode="api-only",
+        service_label="API-only 服务",
+        detail="无调度器/监听",
+        start_services=False,
+    )
 
-        host = os.environ.get("API_HOST", "0.0.0.0")
-        port = int(os.environ.get("API_PORT", "8080"))
 
-        logger.info(f"API-only 服务启动在 {host}:{port}（无调度器/监听）")
-        uvicorn.run(app, host=host, port=port)
+def run_analysis_service(config_path: str = "./config.jsonc") -> int:
+    """运行公网分析服务（API + Telegram，无调度器）。"""
+    logger = logging.getLogger(__name__)
+    logger.info("启动公网分析服务模式（API + Telegram，无调度器）")
 
-        return 0
-    except Exception as e:
-        logger.error(f"API-only 服务启动失败: {e}")
-        return 1
+    return _serve_api_app(
+        config_path,
+        runtime_mode="analysis-service",
+        service_label="公网分析服务",
+        detail="无调度器",
+        start_services=False,
+        start_scheduler=False,
+        start_command_listener=True,
+    )
 
 
-def run_analysis_service(config_path: str = "./config.jsonc") -> int:
-    """运行公网分析服务（API + Telegram，无调度器）。"""
+def _serve_api_app(
+    config_path: str,
+    runtime_mode: str,
+    service_label: str,
+    detail: str,
+    **server_options: Any,
+) -> int:
+    """
+    创建API应用并通过uvicorn运行，供各HTTP服务模式共用
+
+    Args:
+        config_path: 配置文件路径
+        runtime_mode: 写入CRYPTO_NEWS_RUNTIME_MODE的运行模式
+        service_label: 日志中使用的服务名称
+        detail: 启动日志中的附加说明
+        **server_options: 透传给create_api_server的启动选项
+
+    Returns:
+        退出状态码
+    """
     import uvicorn
     from .api_server import create_api_server
 
     logger = logging.getLogger(__name__)
-    logger.info("启动公网分析服务模式（API + Telegram，无调度器）")
 
     try:
-        os.environ["CRYPTO_NEWS_RUNTIME_MODE"] = "analysis-service"
-        app = create_api_server(
-            config_path,
-            start_services=False,
-            start_scheduler=False,
-            start_command_listener=True,
-        )
+        os.environ["CRYPTO_NEWS_RUNTIME_MODE"] = runtime_mode
+        app = create_api_server(config_path, **server_options)
 
         host = os.environ.get("API_HOST", "0.0.0.0")
         port = int(os.environ.get("API_PORT", "8080"))
 
-        logger.info(f"公网分析服务启动在 {host}:{port}（无调度器）")
+        logger.info(f"{service_label}启动在 {host}:{port}（{detail}）")
         uvicorn.run(app, host=host, port=port)
 
         return 0
     except Exception as e:
-        logger.error(f"公网分析服务启动失败: {e}")
+        logger.error(f"{service_label}启动失败: {e}")
         return 1
 
 
@@ -202,9 +220,8 @@ def run_ingestion_loop(config_path: str = "./config.jsonc") -> int:
         signal.signal(signal.SIGTERM, signal_handler)
         signal.signal(signal.SIGINT, signal_handler)
 
-        # 等待停止信号
-        while not stop_event.is_set():
-            stop_event.wait(1)
+        # 阻塞等待停止信号，信号处理函数设置事件后立即返回，无需每秒轮询
+        stop_event.wait()
 
         logger.info("数据摄取循环已停止")
         return 0
@@ -7,7 +7,7 @@
 from dataclasses import dataclass, asdict
 from dataclasses import field
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterable, List, Optional, Any, Tuple, Union
 import json
 import hashlib
 from urllib.parse import urlparse
@@ -25,6 +25,19 @@ def _is_hhmm_time(value: Any) -> bool:
     return 0 <= hour <= 23 and 0 <= minute <= 59
 
 
+# X源支持的类型
+_X_SOURCE_TYPES = frozenset(("list", "timeline"))
+
+
+def _is_valid_url(url: str) -> bool:
+    """验证URL格式（需同时包含协议和主机），各配置模型共用"""
+    try:
+        result = urlparse(url)
+        return bool(result.scheme and result.netloc)
+    except Exception:
+        return False
+
+
 @dataclass
 class ContentItem:
     """内容项数据模型"""
@@ -64,11 +77,7 @@ class ContentItem:
 
     def _is_valid_url(self, url: str) -> bool:
         """验证URL格式"""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+        return _is_valid_url(url)
 
     def generate_content_hash(self) -> str:
         """生成内容哈希用于去重"""
@@ -136,11 +145,7 @@ class RSSSource:
 
     def _is_valid_url(self, url: str) -> bool:
         """验证URL格式"""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+        return _is_valid_url(url)
 
     def to_dict(self) -> Dict[str, Any]:
         """序列化为字典"""
@@ -166,22 +171,38 @@ class XSource:
 
     def validate(self) -> None:
         """验证配置有效性"""
-        if not self.name or not self.name.strip():
-            raise ValueError("X源名称不能为空")
+        errors = self.collect_errors(self.name, self.url, self.type)
+        if errors:
+            raise ValueError(errors[0])
 
-        if not self.url or not self._is_valid_url(self.url):
-            raise ValueError(f"无效的X URL: {self.url}")
+    @staticmethod
+    def collect_errors(name: Any, url: Any, source_type: Any) -> List[str]:
+        """
+        检查X源配置，返回全部问题而不抛出异常
+
+        Args:
+            name: 源名称
+            url: 源URL
+            source_type: 源类型
+
+        Returns:
+            List[str]: 错误信息列表，配置有效时为空
+        """
+        errors = []
+        if not isinstance(name, str) or not name.strip():
+            errors.append("X源名称不能为空")
+
+        if not url or not _is_valid_url(url):
+            errors.append(f"无效的X URL: {url}")
+
+        if not isinstance(source_type, str) or source_type not in _X_SOURCE_TYPES:
+            errors.append(f"无效的X源类型: {source_type}")
 
-        if self.type not in ["list", "timeline"]:
-            raise ValueError(f"无效的X源类型: {self.type}")
+        return errors
 
     def _is_valid_url(self, url: str) -> bool:
         """验证URL格式"""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+        return _is_valid_url(url)
 
     def to_dict(self) -> Dict[str, Any]:
         """序列化为字典"""
@@ -226,11 +247,7 @@ class RESTAPISource:
 
     def _is_valid_url(self, url: str) -> bool:
         """验证URL格式"""
-        try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+        return _is_valid_url(url)
 
     def to_dict(self) -> Dict[str, Any]:
         """序列化为字典"""
@@ -766,6 +783,10 @@ class AnalysisResult:
 class CrawlResult:
     """爬取结果"""
 
+    # 每个源每轮爬取都会生成一个结果，使用__slots__避免实例字典开销
+    # （项目需兼容Python 3.9，无法使用dataclass(slots=True)）
+    __slots__ = ("source_name", "status", "item_count", "error_message")
+
     source_name: str
     status: str  # "success" or "error"
     item_count: int
@@ -1098,6 +1119,49 @@ def create_content_item_from_raw(
     )
 
 
+def create_content_items_bulk(
+    rows: Iterable[Tuple[str, str, str, datetime]],
+    source_name: str,
+    source_type: str,
+) -> List[ContentItem]:
+    """
+    批量创建同一数据源的ContentItem对象
+
+    结果与逐条调用create_content_item_from_raw相同，但数据源名称和类型
+    只处理一次，且不再逐条判断时间是否为字符串。
+
+    Args:
+        rows: (title, content, url, publish_time) 元组，publish_time须为datetime，
+            无时区信息时视为UTC
+        source_name: 数据源名称
+        source_type: 数据源类型
+
+    Returns:
+        List[ContentItem]: 与输入顺序一致的内容项列表
+    """
+    from datetime import timezone
+
+    source_name = source_name.strip()
+    source_type = source_type.strip()
+    items = []
+
+    for title, content, url, publish_time in rows:
+        if publish_time.tzinfo is None:
+            publish_time = publish_time.replace(tzinfo=timezone.utc)
+
+        items.append(ContentItem(
+            id=ContentItem.generate_id(title, url, publish_time),
+            title=title.strip(),
+            content=content.strip(),
+            url=url.strip(),
+            publish_time=publish_time,
+            source_name=source_name,
+            source_type=source_type,
+        ))
+
+    return items
+
+
 # 批量操作工具类
 class DataModelUtils:
     """数据模型工具类"""
@@ -100,6 +100,8 @@ class TelegramCommandHandler(IntelligenceCommandsMixin, DatasourceCommandsMixin)
         self.application: Optional[Application] = None
         self._listener_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # 监听循环内等待的异步事件，由 request_stop 跨线程唤醒
+        self._async_stop_event: Optional[asyncio.Event] = None
         self._event_loop: Optional[asyncio.AbstractEventLoop] = None
 
         # 命令执行历史
@@ -775,13 +777,14 @@ class TelegramCommandHandler(IntelligenceCommandsMixin, DatasourceCommandsMixin)
             await self.application.updater.start_polling()
 
             # 保存事件循环引用以便从其他线程访问
+            self._async_stop_event = asyncio.Event()
             self._event_loop = asyncio.get_running_loop()
 
             self.logger.info("Telegram命令监听器已启动")
 
-            # 保持运行直到收到停止信号
-            while not self._stop_event.is_set():
-                await asyncio.sleep(1)
+            # 阻塞等待停止信号，不再每秒轮询
+            if not self._stop_event.is_set():
+                await self._async_stop_event.wait()
 
         except Exception as e:
             self.logger.error(f"启动命令监听器失败: {str(e)}")
@@ -789,6 +792,18 @@ class TelegramCommandHandler(IntelligenceCommandsMixin, DatasourceCommandsMixin)
         finally:
             await self.stop_command_listener()
 
+    def request_stop(self) -> None:
+        """
+        请求停止命令监听器（线程安全）
+
+        设置停止标志，并唤醒事件循环中等待的监听协程。
+        """
+        self._stop_event.set()
+        loop = self._event_loop
+        async_stop_event = self._async_stop_event
+        if loop is not None and async_stop_event is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(async_stop_event.set)
+
     async def stop_command_listener(self) -> None:
         """停止命令监听器"""
         if not self.application:
@@ -2495,7 +2510,7 @@ class TelegramCommandHandlerSync:
     def stop_command_listener(self) -> None:
         """同步停止命令监听器"""
         if self._loop:
-            self.handler._stop_event.set()
+            self.handler.request_stop()
             if self._listener_thread:
                 self._listener_thread.join(timeout=10)
 
@@ -11,7 +11,7 @@ import json
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -679,10 +679,54 @@ class DataManager:
             logger.info(f"获取到 {len(items)} 个内容项")
             return items
 
-    def deduplicate_content(self) -> int:
+    def count_content_items(
+        self,
+        time_window_hours: Optional[int] = None,
+        source_types: Optional[List[str]] = None,
+    ) -> int:
+        """
+        统计内容项数量（条件与get_content_items一致，只在数据库中计数，不加载内容）
+
+        Args:
+            time_window_hours: 时间窗口（小时）
+            source_types: 数据源类型过滤
+
+        Returns:
+            内容项数量
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            conditions = []
+            params: List[Any] = []
+
+            if time_window_hours is not None:
+                from datetime import timezone
+
+                cutoff_time = datetime.now(timezone.utc) - timedelta(hours=time_window_hours)
+                conditions.append("publish_time >= ?")
+                params.append(cutoff_time.isoformat())
+
+            if source_types:
+                placeholders = ",".join(["?" for _ in source_types])
+                conditions.append(f"source_type IN ({placeholders})")
+                params.extend(source_types)
+
+            query = "SELECT COUNT(*) AS total_count FROM content_items"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+
+            cursor.execute(self._sql(query), params)
+            return int(cursor.fetchone()["total_count"])
+
+    def deduplicate_content(self, content_hashes: Optional[Iterable[str]] = None) -> int:
         """
         去重内容（基于内容哈希）
 
+        Args:
+            content_hashes: 只检查这些内容哈希（如本轮新写入内容的哈希），
+                为None时扫描全表
+
         Returns:
             删除的重复项数量
         """
@@ -691,14 +735,32 @@ class DataManager:
                 cursor = conn.cursor()
 
                 # 查找重复的内容哈希
-                cursor.execute("""
-                    SELECT content_hash, COUNT(*) as count
-                    FROM content_items
-                    GROUP BY content_hash
-                    HAVING COUNT(*) > 1
-                """)
-
-                duplicate_hashes = cursor.fetchall()
+                if content_hashes is None:
+                    cursor.execute("""
+                        SELECT content_hash, COUNT(*) as count
+                        FROM content_items
+                        GROUP BY content_hash
+                        HAVING COUNT(*) > 1
+                    """)
+                    duplicate_hashes = cursor.fetchall()
+                else:
+                    unique_hashes = list(dict.fromkeys(content_hashes))
+                    duplicate_hashes = []
+                    # 分块查询，避免IN子句参数过多
+                    for start in range(0, len(unique_hashes), 500):
+                        chunk = unique_hashes[start:start + 500]
+                        placeholders = ", ".join("?" * len(chunk))
+                        cursor.execute(
+                            self._sql(f"""
+                            SELECT content_hash, COUNT(*) as count
+                            FROM content_items
+                            WHERE content_hash IN ({placeholders})
+                            GROUP BY content_hash
+                            HAVING COUNT(*) > 1
+                        """),
+                            chunk,
+                        )
+                        duplicate_hashes.extend(cursor.fetchall())
                 deleted_count = 0
 
                 for row in duplicate_hashes:
@@ -9,7 +9,7 @@ These adapters wrap the existing DataManager and CacheManager.
 import json
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, Tuple, Set, cast
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Set, cast
 
 from ..domain.models import (
     AnalysisRequest,
@@ -318,8 +318,8 @@ class SQLiteContentRepository(ContentRepository):
     def save_many(self, items: List[ContentItem]) -> int:
         return self._data.add_content_items(items)
 
-    def deduplicate(self) -> int:
-        return self._data.deduplicate_content()
+    def deduplicate(self, content_hashes: Optional[Iterable[str]] = None) -> int:
+        return self._data.deduplicate_content(content_hashes)
 
     def save_crawl_status(self, crawl_status: CrawlStatus) -> None:
         self._data.save_crawl_status(crawl_status)
@@ -336,6 +336,16 @@ class SQLiteContentRepository(ContentRepository):
             limit=limit,
         )
 
+    def count_recent_content_items(
+        self,
+        time_window_hours: Optional[int] = None,
+        source_types: Optional[List[str]] = None,
+    ) -> int:
+        return self._data.count_content_items(
+            time_window_hours=time_window_hours,
+            source_types=source_types,
+        )
+
     def get_content_items_since(
         self,
         since_time: datetime,
@@ -0,0 +1,115 @@
+"""
+令牌桶限流器
+
+按固定速率补充令牌，空闲期间积累的令牌允许短时突发请求，
+只有在令牌耗尽时才阻塞等待，避免固定间隔休眠造成的浪费。
+"""
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    线程安全的令牌桶
+
+    桶初始为满，每秒补充rate个令牌，最多积累capacity个。
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数
+            capacity: 桶容量，即允许的最大突发请求数
+            clock: 单调时钟函数，便于测试注入
+            sleep: 休眠函数，便于测试注入
+
+        Raises:
+            ValueError: 参数无效
+        """
+        if rate <= 0:
+            raise ValueError("令牌补充速率必须大于0")
+        if capacity < 1:
+            raise ValueError("令牌桶容量不能小于1")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._last_refill = clock()
+        self._lock = threading.Lock()
+
+    def _check_tokens(self, tokens: float) -> None:
+        """
+        检查请求的令牌数，超过桶容量的请求永远无法满足
+
+        Raises:
+            ValueError: 令牌数超过桶容量
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"请求的令牌数 {tokens} 超过桶容量 {self.capacity}")
+
+    def _refill(self) -> None:
+        """按流逝时间补充令牌（调用方需持有锁）"""
+        now = self._clock()
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        尝试立即获取令牌
+
+        Args:
+            tokens: 需要的令牌数
+
+        Returns:
+            bool: 是否获取成功
+
+        Raises:
+            ValueError: 令牌数超过桶容量
+        """
+        self._check_tokens(tokens)
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        获取令牌，令牌不足时阻塞等待
+
+        Args:
+            tokens: 需要的令牌数
+
+        Returns:
+            float: 实际等待的秒数
+
+        Raises:
+            ValueError: 令牌数超过桶容量
+        """
+        self._check_tokens(tokens)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait_seconds = (tokens - self._tokens) / self.rate
+
+            self._sleep(wait_seconds)
+            waited += wait_seconds
@@ -4,6 +4,8 @@ LLM分析器测试
 测试四步分析流程的实现。
 """
 
+import threading
+
 import pytest
 from datetime import datetime
 from typing import Any, Dict
@@ -490,6 +492,82 @@ class TestLLMAnalyzer:
         assert "- 第一批实际输出标题" in captured_user_prompts[1]
         assert "第一批原始输入标题" not in captured_user_prompts[1]
 
+    def test_scheduled_batches_run_concurrently_in_order(self, mock_market_snapshot):
+        """测试定时任务的批次并发请求，结果仍按批次顺序汇总"""
+        analyzer = LLMAnalyzer(mock_mode=False, batch_size=1, max_concurrent_batches=2)
+        analyzer.client = Mock()
+        analyzer._log_final_prompt = Mock()
+        analyzer._log_llm_response = Mock()
+        analyzer._get_formatted_cached_messages = Mock(return_value="无")
+
+        items = [
+            self._make_content_item("batch-1", "第一批输入标题"),
+            self._make_content_item("batch-2", "第二批输入标题"),
+        ]
+        # 两个批次都到达屏障才能返回，串行执行会超时
+        barrier = threading.Barrier(2, timeout=5)
+
+        def respond(*args, **kwargs):
+            barrier.wait()
+            user_prompt = kwargs["messages"][1]["content"]
+            index = 1 if "第一批输入标题" in user_prompt else 2
+            return BatchAnalysisResult(
+                results=[self._make_result(f"第{index}批输出", f"https://example.com/{index}")]
+            )
+
+        analyzer.structured_output_manager.force_structured_response = Mock(
+            side_effect=respond
+        )
+
+        results = analyzer._analyze_batch_with_structured_output(
+            items=items,
+            system_prompt="system prompt",
+            market_snapshot=mock_market_snapshot,
+            is_scheduled=True,
+        )
+
+        assert [result.title for result in results] == ["第1批输出", "第2批输出"]
+
+    def test_scheduled_batches_cancel_pending_after_content_filter_failure(
+        self, mock_market_snapshot
+    ):
+        """测试并发批次中内容过滤失败且无备用模型时，取消尚未开始的批次"""
+        analyzer = LLMAnalyzer(mock_mode=False, batch_size=1, max_concurrent_batches=2)
+        analyzer.client = Mock()
+        analyzer._log_final_prompt = Mock()
+        analyzer._log_llm_response = Mock()
+        analyzer._get_formatted_cached_messages = Mock(return_value="无")
+        analyzer._select_content_filter_fallback_runtime = Mock(return_value=None)
+
+        items = [self._make_content_item(f"batch-{i}", f"批次{i}输入标题") for i in range(1, 5)]
+        release = threading.Event()
+        started = []
+
+        def respond(*args, **kwargs):
+            user_prompt = kwargs["messages"][1]["content"]
+            index = next(i for i in range(1, 5) if f"批次{i}输入标题" in user_prompt)
+            started.append(index)
+            if index == 1:
+                raise ContentFilterError("Kimi rejected", model="kimi-k2.5")
+            # 占住工作线程，让第4批只能排队等待
+            release.wait(1)
+            return BatchAnalysisResult(results=[])
+
+        analyzer.structured_output_manager.force_structured_response = Mock(
+            side_effect=respond
+        )
+
+        with pytest.raises(ContentFilterError):
+            analyzer._analyze_batch_with_structured_output(
+                items=items,
+                system_prompt="system prompt",
+                market_snapshot=mock_market_snapshot,
+                is_scheduled=True,
+            )
+        release.set()
+
+        assert 4 not in started
+
     def test_format_user_prompt_for_logging_extracts_message_from_json(self):
         analyzer = LLMAnalyzer(mock_mode=True)
 
@@ -0,0 +1,316 @@
+"""
+X爬取器单元测试
+
+测试X爬取器的核心功能，包括：
+- 推文解析
+- 时间窗口过滤
+- 批量爬取
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta, timezone
+
+from crypto_news_analyzer.crawlers.x_crawler import XCrawler, _parse_bird_time, _parse_x_url
+from crypto_news_analyzer.models import BirdResult, XSource
+from crypto_news_analyzer.utils.errors import CrawlerError
+
+
+def _twitter_time(dt: datetime) -> str:
+    """将datetime格式化为bird工具输出的时间格式"""
+    return dt.strftime("%a %b %d %H:%M:%S +0000 %Y")
+
+
+def _make_tweet(tweet_id: str, text: str, hours_ago: float, username: str = "alice") -> dict:
+    """构造标准化后的推文数据"""
+    created_at = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return {
+        "id": tweet_id,
+        "text": text,
+        "created_at": _twitter_time(created_at),
+        "user": {"screen_name": username},
+    }
+
+
+def _ok_result(output: str = "[]") -> BirdResult:
+    return BirdResult(
+        success=True,
+        output=output,
+        error="",
+        exit_code=0,
+        execution_time=0.1,
+        command=["bird"],
+    )
+
+
+class TestXCrawler:
+    """X爬取器测试类"""
+
+    @pytest.fixture
+    def bird_wrapper(self):
+        """模拟的Bird封装器"""
+        wrapper = MagicMock()
+        wrapper.test_connection.return_value = True
+        wrapper.fetch_list_tweets.return_value = _ok_result()
+        wrapper.fetch_user_timeline.return_value = _ok_result()
+        return wrapper
+
+    @pytest.fixture
+    def crawler(self, bird_wrapper):
+        """创建X爬取器实例"""
+        XCrawler._verified_credentials.clear()
+        with patch("crypto_news_analyzer.crawlers.x_crawler.BirdWrapper", return_value=bird_wrapper):
+            return XCrawler(time_window_hours=24)
+
+    def test_parse_tweet_success(self, crawler):
+        """测试推文解析成功"""
+        item = crawler.parse_tweet(_make_tweet("1", "hello world", 1), source_name="测试源")
+
+        assert item is not None
+        assert item.title == "@alice: hello world"
+        assert item.url == "https://x.com/alice/status/1"
+        assert item.source_name == "测试源"
+        assert item.source_type == "x"
+
+    def test_parse_tweet_returns_none_for_invalid_data(self, crawler):
+        """测试无效推文数据返回None而不是抛出异常"""
+        assert crawler.parse_tweet({"id": "", "text": "hello"}) is None
+        assert crawler.parse_tweet({"id": "1", "text": "   "}) is None
+        assert crawler.parse_tweet({"id": "1", "text": None}) is None
+
+    def test_crawl_list_skips_invalid_and_stale_tweets(self, crawler, bird_wrapper):
+        """测试列表爬取跳过无效推文和超出时间窗口的推文"""
+        bird_wrapper.iter_tweet_data.return_value = [
+            _make_tweet("1", "fresh tweet", 1),
+            {"id": "2", "text": ""},
+            _make_tweet("3", "stale tweet", 48),
+        ]
+
+        items = crawler.crawl_list("https://x.com/i/lists/123", source_name="列表源")
+
+        assert [item.url for item in items] == ["https://x.com/alice/status/1"]
+        bird_wrapper.fetch_list_tweets.assert_called_once_with("123", source_name="列表源")
+
+    def test_crawl_all_sources_uses_single_batch_call(self, crawler, bird_wrapper):
+        """测试批量爬取只调用一次bird批量接口，并保持源顺序"""
+        bird_wrapper.fetch_batch.return_value = [_ok_result(), _ok_result()]
+        bird_wrapper.iter_tweet_data.return_value = [_make_tweet("1", "fresh tweet", 1)]
+        sources = [
+            XSource(name="列表源", url="https://x.com/i/lists/123", type="list"),
+            XSource(name="无效源", url="https://example.com/foo", type="list"),
+            XSource(name="用户源", url="https://x.com/alice", type="timeline"),
+        ]
+
+        results = crawler.crawl_all_sources(sources)
+
+        bird_wrapper.fetch_batch.assert_called_once()
+        requests = bird_wrapper.fetch_batch.call_args.args[0]
+        assert requests == [("list", "123", "列表源"), ("timeline", "alice", "用户源")]
+        assert [r.source_name for r in results] == ["列表源", "无效源", "用户源"]
+        assert [r.status for r in results] == ["success", "error", "success"]
+        assert results[0].item_count == 1
+
+    def test_convert_tweets_stops_after_stale_streak(self, crawler):
+        """测试连续超出时间窗口的推文达到阈值后停止解析"""
+        crawler.stale_streak_break = 2
+        tweets = [
+            _make_tweet("1", "pinned old tweet", 72),
+            _make_tweet("2", "fresh tweet", 1),
+            _make_tweet("3", "old tweet", 30),
+            _make_tweet("4", "older tweet", 31),
+            _make_tweet("5", "never parsed", 32),
+        ]
+
+        with patch.object(crawler, "_parse_twitter_time", wraps=crawler._parse_twitter_time) as mock_time, \
+                patch.object(crawler, "_build_tweet_fields", wraps=crawler._build_tweet_fields) as mock_fields:
+            items = crawler._convert_tweets(iter(tweets))
+
+        assert [item.url for item in items] == ["https://x.com/alice/status/2"]
+        assert mock_time.call_count == 4
+        # 超出时间窗口的推文只解析时间，不构建ContentItem
+        assert [call.args[0]["id"] for call in mock_fields.call_args_list] == ["2"]
+
+    def test_extract_targets_from_url(self, crawler):
+        """测试从URL提取列表ID和用户名"""
+        assert crawler._extract_list_id_from_url("https://x.com/i/lists/1234567890") == "1234567890"
+        assert crawler._extract_list_id_from_url("https://x.com/alice") is None
+        assert crawler._extract_username_from_url("https://twitter.com/alice") == "alice"
+        assert crawler._extract_username_from_url("https://x.com/home") is None
+        assert crawler._extract_username_from_url("https://example.com/alice") is None
+
+    def test_parse_x_url_classifies_targets(self):
+        """测试X URL一次解析即可区分列表和用户"""
+        assert _parse_x_url("https://x.com/i/lists/123") == ("list", "123")
+        assert _parse_x_url("https://twitter.com/alice/lists/456") == ("list", "456")
+        assert _parse_x_url("https://www.x.com/alice?s=20") == ("user", "alice")
+        assert _parse_x_url("https://notx.com/alice") is None
+        assert _parse_x_url("https://x.com/") is None
+
+    def test_parse_tweet_truncates_long_title(self, crawler):
+        """测试长推文标题截断为50个字符"""
+        text = "a" * 60
+        item = crawler.parse_tweet(_make_tweet("1", text, 1))
+
+        assert item.title == "@alice: " + "a" * 50 + "..."
+        assert item.content == text
+
+    def test_convert_tweets_keeps_offset_regardless_of_batch_size(self, crawler):
+        """测试大批量推文逐条解析时间，保留原始时区偏移，生成的ID与单条解析一致"""
+        local_time = (datetime.now(timezone.utc) + timedelta(hours=7)).astimezone(
+            timezone(timedelta(hours=8))
+        )
+        tweets = [_make_tweet(str(i), f"tweet {i}", 1) for i in range(70)]
+        tweets[0]["created_at"] = local_time.strftime("%a %b %d %H:%M:%S %z %Y")
+
+        batch_items = crawler._convert_tweets(tweets)
+        single_items = crawler._convert_tweets(tweets[:1])
+
+        assert len(batch_items) == 70
+        assert batch_items[0].publish_time.utcoffset() == timedelta(hours=8)
+        assert batch_items[0].id == single_items[0].id
+
+    def test_failed_auth_is_not_retested_per_source(self, crawler, bird_wrapper):
+        """测试认证失败后短时间内不会为每个源重复验证连接"""
+        crawler.authenticated = False
+        crawler._auth_failed_at = None
+        XCrawler._verified_credentials.clear()
+        bird_wrapper.test_connection.reset_mock()
+        bird_wrapper.test_connection.return_value = False
+
+        for _ in range(3):
+            with pytest.raises(CrawlerError):
+                crawler.crawl_list("https://x.com/i/lists/123")
+
+        assert bird_wrapper.test_connection.call_count == 1
+        bird_wrapper.fetch_list_tweets.assert_not_called()
+
+    def test_parse_bird_time_matches_strptime(self):
+        """测试查表解析与strptime结果一致，且格式不符时返回None"""
+        for time_str in ("Wed Feb 04 14:57:51 +0000 2026", "Mon Jan 01 08:00:00 -0530 2024"):
+            expected = datetime.strptime(time_str, "%a %b %d %H:%M:%S %z %Y")
+            assert _parse_bird_time(time_str) == expected
+
+        assert _parse_bird_time("2024-01-01T12:00:00Z") is None
+        assert _parse_bird_time("Wed Foo 04 14:57:51 +0000 2026") is None
+        assert _parse_bird_time("Wed Feb 04 14:57 +0000 2026") is None
+
+    def test_verified_credentials_shared_across_instances(self, crawler, bird_wrapper):
+        """测试有效期内复用已验证状态，bird获取因认证失败后缓存失效"""
+        assert bird_wrapper.test_connection.call_count == 1
+
+        with patch("crypto_news_analyzer.crawlers.x_crawler.BirdWrapper", return_value=bird_wrapper):
+            second = XCrawler(time_window_hours=24)
+
+        assert second.authenticated
+        assert second.authenticate()
+        assert bird_wrapper.test_connection.call_count == 1
+
+        failed = _ok_result()
+        failed.success = False
+        failed.error = "HTTP 401 Unauthorized"
+        bird_wrapper.fetch_list_tweets.return_value = failed
+        with pytest.raises(CrawlerError):
+            second.crawl_list("https://x.com/i/lists/123")
+
+        bird_wrapper.test_connection.return_value = False
+        assert not second.authenticate()
+        assert bird_wrapper.test_connection.call_count == 2
+
+        with patch("crypto_news_analyzer.crawlers.x_crawler.BirdWrapper", return_value=bird_wrapper):
+            third = XCrawler(time_window_hours=24)
+
+        assert not third.authenticated
+        assert bird_wrapper.test_connection.call_count == 3
+
+    def test_convert_tweets_matches_parse_tweet(self, crawler):
+        """测试批量构建的内容项与逐条parse_tweet结果一致"""
+        tweets = [_make_tweet("1", "first", 1), _make_tweet("2", "b" * 60, 2, username="bob")]
+
+        items = crawler._convert_tweets(tweets, source_name="测试源")
+
+        assert items == [crawler.parse_tweet(tweet, source_name="测试源") for tweet in tweets]
+
+    def test_failed_shared_fetch_reported_per_source(self, crawler, bird_wrapper):
+        """测试抓取目标相同的源共用的请求失败时，每个源的失败结果使用各自的名称"""
+        failed = _ok_result()
+        failed.success = False
+        failed.error = "timeout"
+        bird_wrapper.fetch_batch.return_value = [failed]
+        sources = [
+            XSource(name="列表源A", url="https://x.com/i/lists/123", type="list"),
+            XSource(name="列表源B", url="https://x.com/i/lists/123", type="list"),
+        ]
+
+        items, results = crawler.crawl_all_sources_with_items(sources)
+
+        assert items == []
+        assert [r.source_name for r in results] == ["列表源A", "列表源B"]
+        assert [r.status for r in results] == ["error", "error"]
+
+    def test_crawl_all_sources_uses_one_cutoff(self, crawler, bird_wrapper):
+        """测试一次批量爬取内所有源共用同一个时间窗口截止时间"""
+        bird_wrapper.fetch_batch.return_value = [_ok_result(), _ok_result()]
+        bird_wrapper.iter_tweet_data.return_value = [_make_tweet("1", "fresh tweet", 1)]
+        sources = [
+            XSource(name="列表源", url="https://x.com/i/lists/123", type="list"),
+            XSource(name="用户源", url="https://x.com/alice", type="timeline"),
+        ]
+
+        with patch.object(crawler, "_refresh_cutoff", wraps=crawler._refresh_cutoff) as mock_refresh:
+            crawler.crawl_all_sources(sources)
+
+        assert mock_refresh.call_count == 1
+
+    def test_crawl_all_sources_with_items_returns_items_in_source_order(self, crawler, bird_wrapper):
+        """测试批量爬取同时返回按源顺序合并的内容项"""
+        failed = _ok_result()
+        failed.success = False
+        bird_wrapper.fetch_batch.return_value = [_ok_result("list"), failed, _ok_result("user")]
+        bird_wrapper.iter_tweet_data.side_effect = lambda output: [
+            _make_tweet(output, f"{output} tweet", 1)
+        ]
+        sources = [
+            XSource(name="列表源", url="https://x.com/i/lists/123", type="list"),
+            XSource(name="失败源", url="https://x.com/i/lists/456", type="list"),
+            XSource(name="用户源", url="https://x.com/alice", type="timeline"),
+        ]
+
+        items, results = crawler.crawl_all_sources_with_items(sources)
+
+        assert [item.source_name for item in items] == ["列表源", "用户源"]
+        assert [r.status for r in results] == ["success", "error", "success"]
+
+    def test_fetch_failure_keeps_auth_cache_unless_auth_error(self, crawler, bird_wrapper):
+        """测试只有认证错误才清除共享认证缓存，其他源失败不影响已验证的认证信息"""
+        XCrawler._verified_credentials.clear()
+        crawler._record_auth_result(True)
+        sources = [XSource(name="列表源", url="https://x.com/i/lists/123", type="list")]
+
+        for error in ("list not found", "ETIMEDOUT", "HTTP 503 Service Unavailable"):
+            failed = _ok_result()
+            failed.success = False
+            failed.error = error
+            bird_wrapper.fetch_batch.return_value = [failed]
+            crawler.crawl_all_sources_with_items(sources)
+            assert crawler._has_cached_auth() is True
+
+        failed.error = "HTTP 401: Could not authenticate you"
+        crawler.crawl_all_sources_with_items(sources)
+        assert crawler._has_cached_auth() is False
+
+    def test_crawl_all_sources_fetches_duplicate_targets_once(self, crawler, bird_wrapper):
+        """测试抓取目标相同的源只获取一次，结果按各自源名称返回"""
+        bird_wrapper.fetch_batch.return_value = [_ok_result()]
+        bird_wrapper.iter_tweet_data.return_value = [_make_tweet("1", "fresh tweet", 1)]
+        sources = [
+            XSource(name="列表源A", url="https://x.com/i/lists/123", type="list"),
+            XSource(name="列表源B", url="https://twitter.com/i/lists/123", type="list"),
+        ]
+
+        items, results = crawler.crawl_all_sources_with_items(sources)
+
+        # 共用的请求不带某一个源的名称
+        assert bird_wrapper.fetch_batch.call_args.args[0] == [("list", "123", None)]
+        assert [r.source_name for r in results] == ["列表源A", "列表源B"]
+        assert [r.item_count for r in results] == [1, 1]
+        assert [item.source_name for item in items] == ["列表源A", "列表源B"]
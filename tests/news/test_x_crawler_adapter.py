@@ -0,0 +1,175 @@
+"""
+X爬取器适配器单元测试
+
+测试X爬取器适配器的核心功能，包括：
+- 配置验证
+- 配置到XSource的转换
+- 批量爬取结果组装
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from crypto_news_analyzer.crawlers.data_source_interface import ConfigValidationError
+from crypto_news_analyzer.crawlers.x_crawler_adapter import XCrawlerAdapter
+
+
+def _list_config(name: str = "列表源", url: str = "https://x.com/i/lists/123") -> dict:
+    return {"name": name, "url": url, "type": "list"}
+
+
+class TestXCrawlerAdapter:
+    """X爬取器适配器测试类"""
+
+    @pytest.fixture
+    def x_crawler(self):
+        """模拟的底层X爬取器"""
+        crawler = MagicMock()
+        crawler.authenticated = True
+        return crawler
+
+    @pytest.fixture
+    def adapter(self, x_crawler):
+        """创建X爬取器适配器实例"""
+        with patch("crypto_news_analyzer.crawlers.x_crawler_adapter.XCrawler", return_value=x_crawler):
+            return XCrawlerAdapter(time_window_hours=24)
+
+    def test_config_to_x_source_reuses_instance(self, adapter):
+        """测试相同配置复用同一个XSource实例"""
+        first = adapter._config_to_x_source(_list_config())
+        second = adapter._config_to_x_source(dict(_list_config()))
+
+        assert first is second
+        assert first.url == "https://x.com/i/lists/123"
+
+    def test_validate_config_rejects_invalid_type(self, adapter):
+        """测试无效源类型验证失败，且失败结果不会被缓存"""
+        config = {"name": "坏源", "url": "https://x.com/i/lists/123", "type": "feed"}
+
+        for _ in range(2):
+            with pytest.raises(ConfigValidationError):
+                adapter.validate_config(config)
+
+    @pytest.mark.parametrize("config", [
+        ["name", "url", "type"],
+        {"name": ["列表源"], "url": "https://x.com/i/lists/123", "type": "list"},
+        {"name": "列表源", "url": {"href": "https://x.com"}, "type": "list"},
+    ])
+    def test_malformed_config_raises_validation_error(self, adapter, config):
+        """测试非字典或含不可哈希字段的配置抛出ConfigValidationError而非TypeError"""
+        with pytest.raises(ConfigValidationError):
+            adapter.validate_config(config)
+
+        with pytest.raises(ConfigValidationError):
+            adapter.crawl(config)
+
+        _, results = adapter.crawl_all_sources_with_items([config])
+        assert results[0].status == "error"
+
+    def test_crawl_all_sources_returns_items(self, adapter, x_crawler):
+        """测试批量爬取返回底层爬取器产出的内容项"""
+        item = MagicMock()
+        x_crawler.crawl_all_sources_with_items.return_value = ([item], ["result"])
+
+        result = adapter.crawl_all_sources([_list_config()])
+
+        assert result == {"items": [item], "results": ["result"], "total_items": 1}
+
+    def test_crawl_all_sources_with_items_isolates_invalid_configs(self, adapter, x_crawler):
+        """测试批量爬取时无效配置单独记为失败，其余源仍一次批量抓取"""
+        item = MagicMock()
+        ok_result = MagicMock(status="success")
+        x_crawler.crawl_all_sources_with_items.return_value = ([item], [ok_result])
+        bad_config = {"name": "坏源", "url": "https://x.com/i/lists/123", "type": "feed"}
+
+        items, results = adapter.crawl_all_sources_with_items([bad_config, _list_config()])
+
+        assert items == [item]
+        assert results[0].status == "error"
+        assert results[0].source_name == "坏源"
+        assert results[1] is ok_result
+        (x_sources,), _ = x_crawler.crawl_all_sources_with_items.call_args
+        assert [source.name for source in x_sources] == ["列表源"]
+
+    def test_get_source_info_reflects_auth_state(self, adapter, x_crawler):
+        """测试源信息包含静态特性，且认证状态按当前爬取器实时反映"""
+        info = adapter.get_source_info(_list_config())
+
+        assert info["supported_types"] == ["list", "timeline"]
+        assert isinstance(info["features"], list)
+        assert info["bird_tool_info"]["required"] is True
+        assert info["authenticated"] is True
+
+        info["supported_types"].append("feed")
+        info["bird_tool_info"]["required"] = False
+        x_crawler.authenticated = False
+        info = adapter.get_source_info(_list_config())
+
+        assert info["supported_types"] == ["list", "timeline"]
+        assert info["bird_tool_info"]["required"] is True
+        assert info["authenticated"] is False
+
+    def test_crawl_skips_revalidation_of_validated_config(self, adapter, x_crawler):
+        """测试已验证的配置在爬取时不重复验证，清空缓存后重新验证"""
+        x_crawler.crawl_list.return_value = []
+        config = _list_config()
+        adapter.validate_config(config)
+
+        with patch.object(XCrawlerAdapter, "validate_config", autospec=True,
+                          side_effect=XCrawlerAdapter.validate_config) as mock_validate:
+            adapter.crawl(config)
+            assert mock_validate.call_count == 0
+
+            adapter.invalidate_validation_cache()
+            adapter.crawl(config)
+            assert mock_validate.call_count == 1
+
+        x_crawler.crawl_list.assert_called_with(config["url"], source_name=config["name"])
+
+    def test_validate_config_reports_missing_fields_in_order(self, adapter):
+        """测试缺失必需字段时按字段定义顺序报告"""
+        with pytest.raises(ConfigValidationError, match=r"\['url', 'type'\]"):
+            adapter.validate_config({"name": "缺字段源"})
+
+        assert adapter.get_required_config_fields() == ("name", "url", "type")
+
+    def test_availability_check_keeps_created_crawler(self, x_crawler):
+        """测试初始化失败后，可用性检查创建的爬取器会被保存并复用"""
+        with patch("crypto_news_analyzer.crawlers.x_crawler_adapter.XCrawler",
+                   side_effect=[RuntimeError("bird不可用"), x_crawler]) as mock_cls:
+            adapter = XCrawlerAdapter(time_window_hours=24)
+            assert adapter.x_crawler is None
+
+            x_crawler.authenticate.return_value = True
+            assert adapter.validate_source_availability(_list_config())
+            assert adapter.validate_source_availability(_list_config())
+
+        assert adapter.x_crawler is x_crawler
+        assert mock_cls.call_count == 2
+        x_crawler.cleanup.assert_not_called()
+
+    def test_adapter_has_no_instance_dict(self, adapter):
+        """测试适配器使用__slots__，不创建实例字典"""
+        assert not hasattr(adapter, "__dict__")
+
+    def test_crawl_dispatches_timeline_sources(self, adapter, x_crawler):
+        """测试时间线源分发到crawl_timeline"""
+        item = MagicMock()
+        x_crawler.crawl_timeline.return_value = [item]
+        config = {"name": "用户源", "url": "https://x.com/alice", "type": "timeline"}
+
+        assert adapter.crawl(config) == [item]
+        x_crawler.crawl_timeline.assert_called_once_with("https://x.com/alice", source_name="用户源")
+        x_crawler.crawl_list.assert_not_called()
+
+    def test_validate_config_reports_all_errors(self, adapter):
+        """测试一次验证报告全部问题，且非字符串字段不会导致意外异常"""
+        config = {"name": " ", "url": "not-a-url", "type": ["list"]}
+
+        with pytest.raises(ConfigValidationError) as exc_info:
+            adapter.validate_config(config)
+
+        message = str(exc_info.value)
+        assert "X源名称不能为空" in message
+        assert "无效的X URL: not-a-url" in message
+        assert "无效的X源类型" in message
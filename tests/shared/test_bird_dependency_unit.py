@@ -7,6 +7,7 @@ Bird工具依赖管理单元测试
 import unittest
 from unittest.mock import patch, MagicMock
 import os
+import threading
 import tempfile
 import json
 from pathlib import Path
@@ -509,6 +510,74 @@ class TestBirdWrapperMocked(unittest.TestCase):
             # 测试None数据
             tweets = wrapper.parse_tweet_data(None)
             self.assertEqual(len(tweets), 0)
+
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
+    def test_iter_tweet_data_ndjson(self, mock_manager_class):
+        """测试逐条解析多行JSON推文数据"""
+        mock_manager = MagicMock()
+        mock_status = MagicMock()
+        mock_status.available = True
+        mock_manager.check_bird_availability.return_value = mock_status
+        mock_manager_class.return_value = mock_manager
+
+        with patch.dict(os.environ, {'X_CT0': 'test_ct0', 'X_AUTH_TOKEN': 'test_token'}):
+            wrapper = BirdWrapper(self.config)
+
+            ndjson_data = (
+                '{"id": "1", "text": "first", "author": {"username": "alice"}}\n'
+                '{"id": "2", "text": "second", "author": {"username": "bob"}}\n'
+            )
+
+            tweets = wrapper.iter_tweet_data(ndjson_data)
+            first = next(tweets)
+            self.assertEqual(first["id"], "1")
+            self.assertEqual(first["user"]["screen_name"], "alice")
+            self.assertEqual([tweet["id"] for tweet in tweets], ["2"])
+
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
+    def test_iter_tweet_data_ndjson_uses_loader_per_line(self, mock_manager_class):
+        """测试NDJSON按行使用快速解析函数，跨行文档回退标准库解码"""
+        mock_manager = MagicMock()
+        mock_status = MagicMock()
+        mock_status.available = True
+        mock_manager.check_bird_availability.return_value = mock_status
+        mock_manager_class.return_value = mock_manager
+
+        with patch.dict(os.environ, {'X_CT0': 'test_ct0', 'X_AUTH_TOKEN': 'test_token'}):
+            wrapper = BirdWrapper(self.config)
+            loader = MagicMock(side_effect=json.loads)
+            wrapper._json_loads = loader
+
+            mixed_data = (
+                '{"id": "1", "text": "first"}\n'
+                '{"id": "2", "text": "second"}\n'
+                '{\n  "id": "3",\n  "text": "pretty"\n}\n'
+            )
+
+            tweets = wrapper.parse_tweet_data(mixed_data)
+
+            self.assertEqual([tweet["id"] for tweet in tweets], ["1", "2", "3"])
+            # 整体解析1次 + 前两行各1次 + 跨行文档首行尝试1次
+            self.assertEqual(loader.call_count, 4)
+
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
+    def test_parse_tweet_data_uses_configured_json_loader(self, mock_manager_class):
+        """测试整体JSON文档使用可注入的解析函数"""
+        mock_manager = MagicMock()
+        mock_status = MagicMock()
+        mock_status.available = True
+        mock_manager.check_bird_availability.return_value = mock_status
+        mock_manager_class.return_value = mock_manager
+
+        with patch.dict(os.environ, {'X_CT0': 'test_ct0', 'X_AUTH_TOKEN': 'test_token'}):
+            wrapper = BirdWrapper(self.config)
+            loader = MagicMock(side_effect=json.loads)
+            wrapper._json_loads = loader
+
+            tweets = wrapper.parse_tweet_data('[{"id": "1", "text": "hello"}]')
+
+            loader.assert_called_once()
+            self.assertEqual([tweet["id"] for tweet in tweets], ["1"])
     
     @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
     @patch('subprocess.run')
@@ -561,6 +630,233 @@ class TestBirdWrapperMocked(unittest.TestCase):
             self.assertIn("connection_test", diagnostic)
             self.assertTrue(diagnostic["connection_test"])
 
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
+    @patch('subprocess.run')
+    def test_fetch_batch_runs_requests_in_order(self, mock_run, mock_manager_class):
+        """测试批量获取按顺序执行并复用执行环境"""
+        mock_manager = MagicMock()
+        mock_status = MagicMock()
+        mock_status.available = True
+        mock_manager.check_bird_availability.return_value = mock_status
+        mock_manager_class.return_value = mock_manager
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "[]"
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+
+        config = BirdConfig(rate_limit_delay=0)
+        with patch.dict(os.environ, {'X_CT0': 'test_ct0', 'X_AUTH_TOKEN': 'test_token'}):
+            wrapper = BirdWrapper(config)
+            with patch.object(wrapper, '_get_environment', wraps=wrapper._get_environment) as mock_env:
+                results = wrapper.fetch_batch([
+                    ("list", "123", None),
+                    ("timeline", "@alice", None),
+                    ("unknown", "x", None),
+                ])
+
+            self.assertEqual(mock_env.call_count, 1)
+
+        self.assertEqual(len(results), 3)
+        self.assertTrue(results[0].success)
+        self.assertTrue(results[1].success)
+        self.assertFalse(results[2].success)
+
+        commands = [call.args[0] for call in mock_run.call_args_list]
+        self.assertEqual(commands[0][-5:], ["list-timeline", "123", "--json", "--max-pages", "3"])
+        self.assertIn("user-tweets", commands[1])
+        self.assertIn("alice", commands[1])
+
+
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
+    @patch('subprocess.run')
+    def test_fetch_batch_concurrent_keeps_request_order(self, mock_run, mock_manager_class):
+        """测试并发批量获取的结果仍与请求顺序一一对应"""
+        mock_manager = MagicMock()
+        mock_status = MagicMock()
+        mock_status.available = True
+        mock_manager.check_bird_availability.return_value = mock_status
+        mock_manager_class.return_value = mock_manager
+
+        def fake_run(command, **kwargs):
+            result = MagicMock()
+            result.returncode = 0
+            result.stdout = command[-4]  # 目标参数
+            result.stderr = ""
+            return result
+
+        mock_run.side_effect = fake_run
+
+        config = BirdConfig(rate_limit_delay=0)
+        resolve_threads = set()
+        with patch.dict(os.environ, {'X_CT0': 'test_ct0', 'X_AUTH_TOKEN': 'test_token'}):
+            wrapper = BirdWrapper(config)
+            original_resolve = wrapper._resolve_max_pages
+
+            def tracking_resolve(max_pages, source_name):
+                resolve_threads.add(threading.get_ident())
+                return original_resolve(max_pages, source_name)
+
+            with patch.object(wrapper, '_resolve_max_pages', side_effect=tracking_resolve):
+                results = wrapper.fetch_batch(
+                    [("list", str(i), None) for i in range(6)],
+                    max_workers=3,
+                )
+
+        self.assertEqual([result.output for result in results], [str(i) for i in range(6)])
+        self.assertEqual(mock_run.call_count, 6)
+        # max_pages在调用线程上确定，工作线程不访问data_manager
+        self.assertEqual(resolve_threads, {threading.get_ident()})
+
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
+    @patch('subprocess.run')
+    def test_consecutive_commands_within_burst_do_not_wait(self, mock_run, mock_manager_class):
+        """测试令牌桶额度内的连续命令无需等待固定延迟"""
+        mock_manager = MagicMock()
+        mock_status = MagicMock()
+        mock_status.available = True
+        mock_manager.check_bird_availability.return_value = mock_status
+        mock_manager_class.return_value = mock_manager
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "[]"
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+
+        config = BirdConfig(rate_limit_delay=5.0)
+        with patch.dict(os.environ, {'X_CT0': 'test_ct0', 'X_AUTH_TOKEN': 'test_token'}):
+            wrapper = BirdWrapper(config)
+            bucket = wrapper._command_bucket
+            with patch.object(bucket, 'acquire', wraps=bucket.acquire) as mock_acquire:
+                for _ in range(BirdWrapper.COMMAND_BURST):
+                    wrapper.fetch_list_tweets("123")
+
+            self.assertEqual(mock_acquire.call_count, BirdWrapper.COMMAND_BURST)
+            self.assertFalse(bucket.try_acquire())
+
+        self.assertIsNone(BirdWrapper(BirdConfig(rate_limit_delay=0))._command_bucket)
+
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
+    @patch('subprocess.run')
+    def test_fetch_batch_uses_single_limiter(self, mock_run, mock_manager_class):
+        """测试批量获取传入令牌桶时只经过该令牌桶，不再叠加命令级令牌桶"""
+        mock_manager = MagicMock()
+        mock_status = MagicMock()
+        mock_status.available = True
+        mock_manager.check_bird_availability.return_value = mock_status
+        mock_manager_class.return_value = mock_manager
+
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = "[]"
+        mock_result.stderr = ""
+        mock_run.return_value = mock_result
+
+        self.assertEqual(BirdWrapper.COMMAND_BURST, 1)
+
+        config = BirdConfig(rate_limit_delay=5.0)
+        caller_bucket = MagicMock()
+        caller_bucket.acquire.return_value = 0.0
+        with patch.dict(os.environ, {'X_CT0': 'test_ct0', 'X_AUTH_TOKEN': 'test_token'}):
+            wrapper = BirdWrapper(config)
+            with patch.object(wrapper._command_bucket, 'acquire') as command_acquire:
+                wrapper.fetch_batch(
+                    [("list", "1", None), ("list", "2", None)],
+                    rate_limiter=caller_bucket,
+                )
+
+        self.assertEqual(caller_bucket.acquire.call_count, 2)
+        command_acquire.assert_not_called()
+
+
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
+    def test_environment_cached_until_auth_changes(self, mock_manager_class):
+        """测试执行环境在认证信息不变时复用，变化后重建"""
+        mock_manager = MagicMock()
+        mock_status = MagicMock()
+        mock_status.available = True
+        mock_manager.check_bird_availability.return_value = mock_status
+        mock_manager_class.return_value = mock_manager
+
+        with patch.dict(os.environ, {'X_CT0': 'test_ct0', 'X_AUTH_TOKEN': 'test_token'}):
+            wrapper = BirdWrapper(self.config)
+            env = wrapper._get_environment()
+            self.assertIs(wrapper._get_environment(), env)
+
+            os.environ['X_CT0'] = 'new_ct0'
+            new_env = wrapper._get_environment()
+            self.assertIsNot(new_env, env)
+            self.assertEqual(new_env['X_CT0'], 'new_ct0')
+
+
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.time.sleep')
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
+    @patch('subprocess.run')
+    def test_transient_failure_retried_with_retry_after(self, mock_run, mock_manager_class, mock_sleep):
+        """测试限流等临时错误按Retry-After重试，认证错误不重试"""
+        mock_manager = MagicMock()
+        mock_status = MagicMock()
+        mock_status.available = True
+        mock_manager.check_bird_availability.return_value = mock_status
+        mock_manager_class.return_value = mock_manager
+
+        rate_limited = MagicMock(returncode=1, stdout="", stderr="HTTP 429 Too Many Requests, Retry-After: 7")
+        ok = MagicMock(returncode=0, stdout="[]", stderr="")
+        mock_run.side_effect = [rate_limited, ok]
+
+        config = BirdConfig(rate_limit_delay=0, max_retries=2, retry_delay_seconds=60)
+        with patch.dict(os.environ, {'X_CT0': 'test_ct0', 'X_AUTH_TOKEN': 'test_token'}):
+            wrapper = BirdWrapper(config)
+            result = wrapper.fetch_list_tweets("123")
+
+            self.assertTrue(result.success)
+            self.assertEqual(mock_run.call_count, 2)
+            mock_sleep.assert_called_once()
+            delay = mock_sleep.call_args.args[0]
+            self.assertTrue(7.0 <= delay <= 8.0)
+
+            mock_run.reset_mock()
+            mock_sleep.reset_mock()
+            mock_run.side_effect = None
+            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="401 Unauthorized")
+            result = wrapper.fetch_list_tweets("123")
+
+            self.assertFalse(result.success)
+            self.assertEqual(mock_run.call_count, 1)
+            mock_sleep.assert_not_called()
+
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.time.sleep')
+    @patch('crypto_news_analyzer.crawlers.bird_wrapper.BirdDependencyManager')
+    @patch('subprocess.run')
+    def test_retry_after_capped_and_bare_numbers_not_transient(self, mock_run, mock_manager_class, mock_sleep):
+        """测试Retry-After按命令超时封顶，且错误输出中的普通数字不被视为临时错误"""
+        mock_manager = MagicMock()
+        mock_status = MagicMock()
+        mock_status.available = True
+        mock_manager.check_bird_availability.return_value = mock_status
+        mock_manager_class.return_value = mock_manager
+
+        rate_limited = MagicMock(returncode=1, stdout="", stderr="HTTP 429 Too Many Requests, Retry-After: 900")
+        ok = MagicMock(returncode=0, stdout="[]", stderr="")
+        mock_run.side_effect = [rate_limited, ok]
+
+        config = BirdConfig(rate_limit_delay=0, max_retries=2, retry_delay_seconds=60, timeout_seconds=30)
+        with patch.dict(os.environ, {'X_CT0': 'test_ct0', 'X_AUTH_TOKEN': 'test_token'}):
+            wrapper = BirdWrapper(config)
+            self.assertTrue(wrapper.fetch_list_tweets("123").success)
+            delay = mock_sleep.call_args.args[0]
+            self.assertTrue(30.0 <= delay <= 31.0)
+
+            mock_run.reset_mock()
+            mock_sleep.reset_mock()
+            mock_run.side_effect = None
+            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="list not found after 500 items")
+            self.assertFalse(wrapper.fetch_list_tweets("123").success)
+            self.assertEqual(mock_run.call_count, 1)
+            mock_sleep.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
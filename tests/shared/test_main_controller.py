@@ -15,7 +15,8 @@ from unittest.mock import Mock, patch, MagicMock
 
 from crypto_news_analyzer.analyzers.structured_output_manager import StructuredAnalysisResult
 from crypto_news_analyzer.config.llm_registry import LLMConfig, ModelConfig
-from crypto_news_analyzer.execution_coordinator import MainController, ExecutionStatus, ExecutionMode
+from crypto_news_analyzer.crawlers.x_crawler_adapter import XCrawlerAdapter
+from crypto_news_analyzer.execution_coordinator import MainController, ExecutionStatus, ExecutionMode, ExecutionResult
 from crypto_news_analyzer.models import AuthConfig, ContentItem, CrawlStatus, CrawlResult, AnalysisResult, StorageConfig
 from crypto_news_analyzer.storage.cache_manager import SentMessageCacheManager
 from crypto_news_analyzer.storage.data_manager import DataManager
@@ -330,7 +331,118 @@ class TestMainController:
         assert result.success is False
         assert "Test error" in result.errors
         assert len(mock_controller.execution_history) == 1
-    
+
+    def test_concurrent_run_once_starts_single_execution(self, mock_controller):
+        """测试并发触发时只有一个执行能占用执行状态，其余被拒绝"""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_workflow(**_kwargs):
+            started.set()
+            release.wait(5)
+            return {"success": True, "items_processed": 0, "categories_found": {},
+                    "errors": [], "report_sent": False}
+
+        mock_controller.coordinate_workflow = Mock(side_effect=slow_workflow)
+
+        results = []
+        runner = threading.Thread(target=lambda: results.append(mock_controller.run_once()))
+        runner.start()
+        assert started.wait(5)
+
+        rejected = mock_controller.trigger_manual_execution(user_id="u1", chat_id="c1")
+        release.set()
+        runner.join(5)
+
+        assert rejected.execution_id == "rejected"
+        assert rejected.trigger_chat_id == "c1"
+        assert mock_controller.coordinate_workflow.call_count == 1
+        assert results[0].success is True
+        assert mock_controller.current_execution is None
+
+    def test_concurrent_triggers_initialize_system_once(self, mock_controller):
+        """测试并发触发时系统只初始化一次"""
+        mock_controller._initialized = False
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_initialize():
+            entered.set()
+            release.wait(5)
+            mock_controller._initialized = True
+            return True
+
+        mock_controller.initialize_system = Mock(side_effect=slow_initialize)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(mock_controller._ensure_initialized()))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        assert entered.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert results == [True, True]
+        mock_controller.initialize_system.assert_called_once_with()
+
+    def test_execution_result_dict_round_trip(self):
+        """测试执行结果序列化包含全部字段，且反序列化后保持一致"""
+        start_time = datetime(2024, 1, 1, 12, 0)
+        result = ExecutionResult(
+            execution_id="exec_1",
+            success=False,
+            start_time=start_time,
+            end_time=start_time + timedelta(seconds=3),
+            duration_seconds=3.0,
+            items_processed=2,
+            categories_found={"大户动向": 2},
+            errors=["超时"],
+            trigger_user="user",
+            report_sent=False,
+            trigger_type="scheduled",
+            trigger_chat_id="chat",
+        )
+
+        data = result.to_dict()
+        data["errors"].append("调用方修改")
+
+        assert data["start_time"] == "2024-01-01T12:00:00"
+        assert result.errors == ["超时"]
+        data["errors"] = ["超时"]
+        assert ExecutionResult.from_dict(json.loads(json.dumps(data))) == result
+
+    def test_prerequisites_revalidated_only_after_config_change(self, mock_controller):
+        """测试配置文件未修改时复用前提条件验证结果"""
+        mock_controller.validate_prerequisites = Mock(
+            return_value={"valid": True, "errors": [], "warnings": []}
+        )
+
+        assert mock_controller._check_prerequisites("ingestion")["valid"] is True
+        assert mock_controller._check_prerequisites("ingestion")["valid"] is True
+        assert mock_controller.validate_prerequisites.call_count == 1
+
+        stat = os.stat(mock_controller.config_path)
+        os.utime(mock_controller.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        mock_controller._check_prerequisites("ingestion")
+        assert mock_controller.validate_prerequisites.call_count == 2
+
+        mock_controller.invalidate_prerequisites()
+        mock_controller._check_prerequisites("ingestion")
+        assert mock_controller.validate_prerequisites.call_count == 3
+
+    def test_run_once_duration_uses_monotonic_clock(self, mock_controller):
+        """测试执行耗时按单调时钟计算，不受墙上时间影响"""
+        mock_controller.coordinate_workflow = Mock(return_value={"success": True, "errors": []})
+
+        with patch("crypto_news_analyzer.execution_coordinator.time.perf_counter",
+                   side_effect=[100.0, 102.5]):
+            result = mock_controller.run_once()
+
+        assert result.duration_seconds == 2.5
+
     def test_coordinate_workflow_complete(self, mock_controller):
         """测试完整工作流协调"""
         # 模拟各阶段成功
@@ -365,7 +477,68 @@ class TestMainController:
         assert result["items_processed"] == 1
         assert "大户动向" in result["categories_found"]
         assert result["report_sent"] is True
+
+    def test_coordinate_workflow_shares_config_snapshot(self, mock_controller):
+        """测试工作流只读取一次配置，并把同一份快照交给分析阶段"""
+        mock_controller.config_manager.get_time_window_hours = Mock(return_value=6)
+        mock_controller._execute_crawling_stage = Mock(return_value={
+            "success": True,
+            "content_items": [],
+            "crawl_status": Mock(),
+            "errors": []
+        })
+        mock_controller._execute_analysis_stage = Mock(return_value={
+            "success": False,
+            "errors": ["分析失败"]
+        })
+
+        mock_controller.coordinate_workflow()
+
+        mock_controller.config_manager.get_time_window_hours.assert_called_once_with()
+        mock_controller._execute_crawling_stage.assert_called_once_with(6)
+        workflow_config = mock_controller._execute_analysis_stage.call_args.kwargs["workflow_config"]
+        assert workflow_config.time_window_hours == 6
     
+    def test_coordinate_workflow_skips_analysis_when_window_unchanged(self, mock_controller):
+        """测试定时工作流在没有新内容且窗口内容未变化时跳过分析"""
+        mock_controller.content_repository.count_recent_content_items.return_value = 3
+        mock_controller._execute_crawling_stage = Mock(return_value={
+            "success": True,
+            "content_items": [],
+            "crawl_status": Mock(),
+            "items_new": 0,
+            "errors": []
+        })
+        mock_controller._execute_analysis_stage = Mock(return_value={
+            "success": True,
+            "categorized_items": {},
+            "analysis_results": {},
+            "errors": []
+        })
+        mock_controller._execute_reporting_stage = Mock(return_value={
+            "success": True,
+            "report_content": "Test report",
+            "errors": []
+        })
+        mock_controller._execute_sending_stage = Mock(return_value={
+            "success": True,
+            "errors": []
+        })
+
+        first = mock_controller.coordinate_workflow()
+        second = mock_controller.coordinate_workflow()
+
+        assert first["report_sent"] is True
+        assert second["success"] is True
+        assert second["report_sent"] is False
+        assert mock_controller._execute_analysis_stage.call_count == 1
+
+        # 手动触发或窗口内容变化时照常分析
+        mock_controller.coordinate_workflow(is_manual=True)
+        mock_controller.content_repository.count_recent_content_items.return_value = 2
+        mock_controller.coordinate_workflow()
+        assert mock_controller._execute_analysis_stage.call_count == 3
+
     def test_scheduler_start_stop(self, mock_controller):
         """测试调度器启动和停止"""
         # 启动调度器
@@ -384,6 +557,21 @@ class TestMainController:
         time.sleep(0.2)
         
         assert not mock_controller._scheduler_thread.is_alive()
+
+    def test_scheduler_skipped_slot_waits_for_next_interval(self, mock_controller):
+        """测试上次执行未结束时跳过的调度推进到下一周期，而不是空转重试"""
+        mock_controller.current_execution = Mock(status=ExecutionStatus.RUNNING)
+        mock_controller.run_crawl_only = Mock()
+        last_scheduled = datetime.now() - timedelta(seconds=90)
+        mock_controller._last_scheduled_time = last_scheduled
+
+        mock_controller.start_scheduler(60)
+        time.sleep(0.2)
+        mock_controller.stop_scheduler()
+        mock_controller._scheduler_thread.join(5)
+
+        assert mock_controller._last_scheduled_time == last_scheduled + timedelta(seconds=60)
+        mock_controller.run_crawl_only.assert_not_called()
     
     def test_execution_status_tracking(self, mock_controller):
         """测试执行状态跟踪"""
@@ -528,6 +716,20 @@ class TestMainController:
         all_history = mock_controller.get_execution_history(limit=0)
         assert len(all_history) == 15
     
+    def test_execution_history_is_bounded(self, mock_controller):
+        """测试内存中的执行历史有上限，超出后丢弃最旧记录"""
+        for i in range(mock_controller._history_max + 20):
+            result = Mock()
+            result.execution_id = f"exec_{i}"
+            mock_controller.execution_history.append(result)
+
+        assert len(mock_controller.execution_history) == mock_controller._history_max
+        assert mock_controller.execution_history[0].execution_id == "exec_20"
+        assert [r.execution_id for r in mock_controller.get_execution_history(limit=2)] == [
+            f"exec_{mock_controller._history_max + 18}",
+            f"exec_{mock_controller._history_max + 19}",
+        ]
+
     def test_system_status(self, mock_controller):
         """测试系统状态获取"""
         status = mock_controller.get_system_status()
@@ -556,6 +758,64 @@ class TestMainController:
         # 验证数据管理器清理被调用
         mock_controller.data_manager.close.assert_called_once()
     
+    def test_telegram_command_config_cached_until_config_reload(self, mock_controller):
+        """测试Telegram命令配置按配置字典缓存，配置替换后重新解析"""
+        mock_controller.config_manager.config_data = {
+            "telegram_commands": {"enabled": True, "authorized_users": [{"user_id": "1"}]}
+        }
+
+        first = mock_controller._get_telegram_command_config()
+        assert mock_controller._get_telegram_command_config() is first
+        assert first.enabled is True
+
+        mock_controller.config_manager.config_data = {"telegram_commands": {"enabled": False}}
+        reloaded = mock_controller._get_telegram_command_config()
+
+        assert reloaded is not first
+        assert reloaded.enabled is False
+
+    def test_signal_handler_defers_shutdown_while_lock_held(self, mock_controller):
+        """测试信号处理函数不在中断处加锁，关闭流程在独立线程中完成"""
+        import signal
+        from crypto_news_analyzer.execution_coordinator import ExecutionInfo
+
+        mock_controller._setup_signal_handlers()
+        handler = signal.getsignal(signal.SIGTERM)
+        mock_controller.current_execution = ExecutionInfo(
+            execution_id="exec_1",
+            trigger_type="manual",
+            trigger_user=None,
+            start_time=datetime.now(),
+            end_time=None,
+            status=ExecutionStatus.RUNNING,
+            progress=0.0,
+            current_stage="crawling",
+            error_message=None,
+        )
+
+        lock_held = threading.Event()
+        release_lock = threading.Event()
+
+        def hold_lock():
+            with mock_controller._execution_lock:
+                lock_held.set()
+                release_lock.wait(5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        lock_held.wait(5)
+        try:
+            # 执行锁被占用时，处理函数也应立即返回
+            handler(signal.SIGTERM, None)
+            assert mock_controller._stop_event.is_set()
+        finally:
+            release_lock.set()
+            holder.join(5)
+
+        mock_controller._shutdown_thread.join(5)
+        assert mock_controller.current_execution.status == ExecutionStatus.CANCELLED
+        mock_controller.data_manager.close.assert_called_once()
+
     @patch('crypto_news_analyzer.execution_coordinator.get_data_source_factory')
     def test_crawling_stage_success(self, mock_factory, mock_controller):
         """测试数据爬取阶段成功"""
@@ -577,6 +837,156 @@ class TestMainController:
         assert len(result["content_items"]) > 0
         assert result["crawl_status"] is not None
 
+    @patch('crypto_news_analyzer.execution_coordinator.get_data_source_factory')
+    def test_crawling_stage_crawls_rss_sources_concurrently(self, mock_factory, mock_controller):
+        """测试RSS源并发爬取，结果按源顺序汇总且单个源失败不影响其他源"""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def crawl(payload):
+            if payload["name"] == "Broken RSS":
+                raise RuntimeError("feed unavailable")
+            # 两个正常源必须同时进入爬取，顺序执行时会超时
+            barrier.wait()
+            return [Mock(spec=ContentItem, title=payload["name"])]
+
+        mock_factory.return_value.create_source.return_value.crawl.side_effect = crawl
+
+        rss_sources = []
+        for name in ("RSS A", "Broken RSS", "RSS B"):
+            source = Mock()
+            source.name = name
+            source.to_dict.return_value = {"name": name}
+            rss_sources.append(source)
+        mock_controller.config_manager.get_rss_sources.return_value = rss_sources
+        mock_controller.config_manager.get_rest_api_sources.return_value = []
+
+        result = mock_controller._execute_crawling_stage(24)
+
+        assert result["success"] is True
+        assert [item.title for item in result["content_items"]] == ["RSS A", "RSS B"]
+        rss_results = result["crawl_status"].rss_results
+        assert [r.source_name for r in rss_results] == ["RSS A", "Broken RSS", "RSS B"]
+        assert [r.status for r in rss_results] == ["success", "error", "success"]
+
+    def test_concurrent_crawls_share_one_thread_pool(self, mock_controller):
+        """测试多次并发爬取复用同一个线程池，清理资源时关闭"""
+        sources = ["A", "B", "C"]
+
+        first = mock_controller._crawl_sources_concurrently(sources, lambda source: [source])
+        pool = mock_controller._crawl_pool
+        second = mock_controller._crawl_sources_concurrently(sources, lambda source: [source])
+
+        assert first == second == [(source, [source], None) for source in sources]
+        assert pool is not None
+        assert mock_controller._crawl_pool is pool
+
+        mock_controller.cleanup_resources()
+
+        assert mock_controller._crawl_pool is None
+        with pytest.raises(RuntimeError):
+            pool.submit(lambda: None)
+
+    @patch('crypto_news_analyzer.execution_coordinator.get_data_source_factory')
+    def test_crawling_stage_reuses_one_crawler_per_source_type(self, mock_factory, mock_controller):
+        """测试顺序爬取时同类型的多个源共用一个爬取器实例，阶段结束后清理"""
+        mock_controller._max_concurrent_crawlers = 1
+        mock_crawler = mock_factory.return_value.create_source.return_value
+        mock_crawler.crawl.return_value = []
+
+        rss_sources = []
+        for name in ("RSS A", "RSS B", "RSS C"):
+            source = Mock()
+            source.name = name
+            source.to_dict.return_value = {"name": name}
+            rss_sources.append(source)
+        mock_controller.config_manager.get_rss_sources.return_value = rss_sources
+        mock_controller.config_manager.get_rest_api_sources.return_value = []
+
+        result = mock_controller._execute_crawling_stage(24)
+
+        assert result["success"] is True
+        mock_factory.return_value.create_source.assert_called_once_with("rss", 24)
+        assert mock_crawler.crawl.call_count == 3
+        mock_crawler.cleanup.assert_called_once_with()
+
+    @patch('crypto_news_analyzer.execution_coordinator.get_data_source_factory')
+    def test_concurrent_crawling_does_not_share_crawlers_across_threads(self, mock_factory, mock_controller):
+        """测试并发爬取时每个工作线程使用独立的爬取器实例，且全部被清理"""
+        barrier = threading.Barrier(2, timeout=5)
+        created = []
+        used_by = {}
+        lock = threading.Lock()
+
+        def create_source(source_type, time_window_hours):
+            crawler = Mock()
+
+            def crawl(payload):
+                with lock:
+                    used_by.setdefault(id(crawler), set()).add(threading.get_ident())
+                # 两个源必须同时进入爬取
+                barrier.wait()
+                return []
+
+            crawler.crawl.side_effect = crawl
+            with lock:
+                created.append(crawler)
+            return crawler
+
+        mock_factory.return_value.create_source.side_effect = create_source
+
+        rss_sources = []
+        for name in ("RSS A", "RSS B"):
+            source = Mock()
+            source.name = name
+            source.to_dict.return_value = {"name": name}
+            rss_sources.append(source)
+        mock_controller.config_manager.get_rss_sources.return_value = rss_sources
+        mock_controller.config_manager.get_rest_api_sources.return_value = []
+
+        result = mock_controller._execute_crawling_stage(24)
+
+        assert result["success"] is True
+        assert len(created) == 2
+        assert all(len(threads) == 1 for threads in used_by.values())
+        for crawler in created:
+            crawler.cleanup.assert_called_once_with()
+
+    @patch('crypto_news_analyzer.execution_coordinator.get_data_source_factory')
+    def test_crawling_stage_batches_builtin_x_sources(self, mock_factory, mock_controller):
+        """测试内置X爬取器通过一次批量调用抓取全部X源"""
+        x_item = Mock(spec=ContentItem)
+        x_crawler = Mock(spec=XCrawlerAdapter)
+        x_crawler.crawl_all_sources_with_items.return_value = (
+            [x_item],
+            [
+                CrawlResult(source_name="X A", status="success", item_count=1, error_message=None),
+                CrawlResult(source_name="X B", status="error", item_count=0, error_message="boom"),
+            ],
+        )
+        mock_factory.return_value.create_source.return_value = x_crawler
+
+        x_sources = []
+        for name in ("X A", "X B"):
+            source = Mock()
+            source.name = name
+            source.to_dict.return_value = {"name": name}
+            x_sources.append(source)
+        mock_controller.config_manager.get_rss_sources.return_value = []
+        mock_controller.config_manager.get_rest_api_sources.return_value = []
+        mock_controller.config_manager.get_x_sources.return_value = x_sources
+        mock_controller.config_manager.get_x_auth_credentials.return_value = {
+            "X_CT0": "ct0-token",
+            "X_AUTH_TOKEN": "auth-token",
+        }
+
+        result = mock_controller._execute_crawling_stage(24)
+
+        assert result["success"] is True
+        assert result["content_items"] == [x_item]
+        x_crawler.crawl_all_sources_with_items.assert_called_once_with([{"name": "X A"}, {"name": "X B"}])
+        x_crawler.crawl.assert_not_called()
+        assert [r.status for r in result["crawl_status"].x_results] == ["success", "error"]
+
     @patch('crypto_news_analyzer.execution_coordinator.get_data_source_factory')
     def test_crawling_stage_uses_x_auth_credentials_without_loading_analysis_auth(
         self,
@@ -677,6 +1087,34 @@ class TestMainController:
 
         assert result["success"] is True  # 应该成功，因为保存了本地备份
 
+    def test_sending_stage_backup_failure_not_retried(self, mock_controller):
+        """测试本地备份失败时不会在异常处理中重复写入"""
+        mock_controller.telegram_sender = None
+
+        with patch.object(
+            mock_controller, '_save_report_backup', side_effect=OSError("disk full")
+        ) as mock_backup:
+            result = mock_controller._execute_sending_stage("Test report")
+
+        assert result["success"] is False
+        assert mock_backup.call_count == 1
+
+    def test_save_report_backup_writes_complete_file(self, mock_controller, tmp_path, monkeypatch):
+        """测试报告备份通过临时文件原子写入"""
+        monkeypatch.chdir(tmp_path)
+
+        backup_path = mock_controller._save_report_backup("报告内容")
+
+        assert (tmp_path / backup_path).read_text(encoding="utf-8") == "报告内容"
+        assert list((tmp_path / "logs").glob("*.tmp")) == []
+
+    def test_deep_update_merges_nested_dicts(self, mock_controller):
+        """测试深度更新合并嵌套字典并覆盖非字典值"""
+        base = {"a": {"b": {"c": 1, "d": 2}, "e": 3}, "f": [1]}
+        mock_controller._deep_update(base, {"a": {"b": {"c": 10}, "e": {"x": 1}}, "f": [2], "g": 4})
+
+        assert base == {"a": {"b": {"c": 10, "d": 2}, "e": {"x": 1}}, "f": [2], "g": 4}
+
     def test_manual_recipient_key_prevents_api_and_telegram_collisions(self, manual_history_controller):
         controller = manual_history_controller
 
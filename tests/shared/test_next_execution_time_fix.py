@@ -2,6 +2,7 @@
 Test to verify that next_execution_time is calculated correctly based on
 the last scheduled execution start time, not the end time.
 """
+import threading
 import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
@@ -74,19 +75,32 @@ class TestNextExecutionTimeFix:
         # Set a specific last scheduled time
         last_scheduled = datetime(2026, 2, 11, 10, 0, 0)
         mock_controller._last_scheduled_time = last_scheduled
-        
+
+        # Hold the overdue run so the schedule does not advance during the check
+        run_started = threading.Event()
+        release = threading.Event()
+
+        def _blocking_run():
+            run_started.set()
+            release.wait(5)
+            return Mock(success=True, items_processed=0)
+
+        mock_controller.run_crawl_only = Mock(side_effect=_blocking_run)
+
         # Start scheduler
         mock_controller.start_scheduler(interval_seconds=10)
-        
-        # Get next execution time
+        assert run_started.wait(5)
+
+        # Get next execution time (derived from the monotonic schedule)
         next_time = mock_controller.get_next_execution_time()
-        
+
         # Should be last_scheduled + 10 seconds
         expected_time = last_scheduled + timedelta(seconds=10)
-        assert next_time == expected_time
-        
+        assert abs((next_time - expected_time).total_seconds()) < 1.0
+
         # Stop scheduler
         mock_controller.stop_scheduler()
+        release.set()
     
     def test_next_execution_time_without_last_scheduled_time(self, mock_controller):
         """
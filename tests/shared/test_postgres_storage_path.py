@@ -168,6 +168,12 @@ def test_content_repository_time_range_and_hash_exists_path():
         ).generate_content_hash()
         assert repo.exists_by_hash(hash_value) is True
 
+        assert repo.count_recent_content_items() == 2
+        assert repo.count_recent_content_items(time_window_hours=2) == len(
+            repo.get_recent_content_items(time_window_hours=2)
+        ) == 1
+        assert repo.count_recent_content_items(source_types=["x"]) == 0
+
 
 class _ReadCursor:
     def __init__(self, *, row=None, rows=None):
@@ -335,3 +341,16 @@ def test_get_last_successful_analysis_time_accepts_str_and_datetime(as_string):
 
     result = manager.get_last_successful_analysis_time(chat_id="telegram:123")
     assert result == execution_time
+
+
+def test_deduplicate_content_scoped_to_given_hashes():
+    manager = DataManager(StorageConfig(database_path=":memory:"))
+    cursor = _DeduplicateCursor()
+    manager._get_connection = lambda: _stub_connection(cursor)
+
+    deleted = manager.deduplicate_content(["hash-1", "hash-2", "hash-1"])
+
+    assert deleted == 1
+    select_query, params = cursor.executed[0]
+    assert "WHERE content_hash IN (?, ?)" in select_query
+    assert params == ["hash-1", "hash-2"]
@@ -0,0 +1,75 @@
+"""
+令牌桶限流器单元测试
+"""
+
+import pytest
+
+from crypto_news_analyzer.utils.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_burst_within_capacity_does_not_sleep():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0.2, capacity=3, clock=clock, sleep=clock.sleep)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert clock.sleeps == []
+
+
+def test_acquire_waits_only_for_missing_tokens():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=0.5, capacity=1, clock=clock, sleep=clock.sleep)
+
+    bucket.acquire()
+    clock.now += 1.0  # 已补充0.5个令牌
+
+    assert bucket.acquire() == pytest.approx(1.0)
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_idle_time_refills_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert not bucket.try_acquire()
+
+    clock.now += 100.0
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+
+def test_invalid_parameters_rejected():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=0)
+
+
+def test_request_above_capacity_rejected_instead_of_blocking():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+    with pytest.raises(ValueError):
+        bucket.acquire(3)
+    with pytest.raises(ValueError):
+        bucket.try_acquire(3)
+
+    assert clock.sleeps == []
+    assert bucket.acquire(2) == 0.0